@@ -0,0 +1,176 @@
+"""Stroke-to-pixel latency benchmark.
+
+Replays a stroke stream through SVGLayoutDisplayTool and times each stage
+of the pipeline: the layout script, LayoutWidget.update_groups, the window
+geometry update and the paint that flushes the frame. Every scenario runs in
+its own subprocess so that peak RSS figures are not shared between them.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_latency.py --json out.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import harness
+
+
+RENDER_MODES = ("document", "layers", "elements", "atlas")
+STAGES = ("convert", "update", "window", "paint", "total")
+
+
+def wrap_stage(timings, stage, function):
+    def timed_function(*args, **kwargs):
+        start = perf_counter()
+        result = function(*args, **kwargs)
+        timings[stage].append(perf_counter() - start)
+        return result
+
+    return timed_function
+
+
+def resolve_layout(name: str, directory: str):
+    if name == "en":
+        return harness.EN_SVG, harness.EN_PY
+    return harness.generate_layout(directory, int(name))
+
+
+def run_scenario(layout: str, mode: str, cache: bool, strokes, warmup: int):
+    app = harness.get_app()
+    with tempfile.TemporaryDirectory() as directory:
+        svg_path, py_path = resolve_layout(layout, directory)
+
+        load_start = perf_counter()
+        tool = harness.make_tool(
+            svg_path, py_path,
+            render_mode=mode,
+            max_fps=0,
+            frame_cache_entries=256 if cache else 0,
+        )
+        app.processEvents()
+        load_time = perf_counter() - load_start
+
+        timings = {stage: [] for stage in STAGES}
+        tool.layout_script.convert = wrap_stage(
+            timings, "convert", tool.layout_script.convert
+        )
+        tool.svg_widget.update_groups = wrap_stage(
+            timings, "update", tool.svg_widget.update_groups
+        )
+        tool.repaint = wrap_stage(timings, "window", tool.repaint)
+
+        for stroke in strokes[:warmup]:
+            tool.on_stroke(stroke)
+            app.processEvents()
+        for stage in STAGES:
+            timings[stage].clear()
+
+        run_start = perf_counter()
+        for stroke in strokes[warmup:]:
+            stroke_start = perf_counter()
+            tool.on_stroke(stroke)
+
+            paint_start = perf_counter()
+            app.processEvents()
+            end = perf_counter()
+
+            timings["paint"].append(end - paint_start)
+            timings["total"].append(end - stroke_start)
+        run_time = perf_counter() - run_start
+
+        cache = tool.svg_widget.frame_cache
+        stroke_count = len(strokes) - warmup
+        result = {
+            "layout": layout,
+            "render_mode": mode,
+            "frame_cache": cache.enabled(),
+            "strokes": stroke_count,
+            "load_ms": load_time * 1000,
+            "throughput_strokes_per_sec": stroke_count / run_time if run_time else 0.0,
+            "stages": {stage: harness.summarize(timings[stage]) for stage in STAGES},
+            "frame_cache_hit_rate": cache.hit_rate(),
+            "atlases": tool.svg_widget.loaded.atlas_reports(),
+            "peak_rss_bytes": harness.peak_rss_bytes(),
+        }
+
+        tool.close()
+        return result
+
+
+def load_strokes(args):
+    if args.strokes_log:
+        return harness.take(harness.read_stroke_log(args.strokes_log), args.count)
+    return harness.synthetic_strokes(args.count, seed=args.seed)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--layouts", default="en,1000,10000",
+        help="comma separated list: 'en' for the bundled layout, or a group "
+             "count for a generated stress layout (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--modes", default=",".join(RENDER_MODES),
+        help="render modes to compare (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--cache", default="on,off",
+        help="frame cache settings to compare (default: %(default)s)"
+    )
+    parser.add_argument("--count", type=int, default=500, help="strokes per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="untimed strokes per scenario")
+    parser.add_argument("--seed", type=int, default=0, help="seed for synthetic strokes")
+    parser.add_argument("--strokes-log", help="replay a Plover strokes.log instead")
+    parser.add_argument("--json", help="write the report to this file instead of stdout")
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    strokes = load_strokes(args)
+
+    if args.scenario:
+        layout, mode, cache = args.scenario.split(":")
+        result = run_scenario(layout, mode, cache == "on", strokes, args.warmup)
+        print(json.dumps(result))
+        return
+
+    scenarios = []
+    for layout in args.layouts.split(","):
+        for mode in args.modes.split(","):
+            for cache in args.cache.split(","):
+                command = [
+                    sys.executable, os.path.abspath(__file__),
+                    "--scenario", ":".join((layout, mode, cache)),
+                    "--count", str(args.count),
+                    "--warmup", str(args.warmup),
+                    "--seed", str(args.seed),
+                ]
+                if args.strokes_log:
+                    command += ["--strokes-log", args.strokes_log]
+
+                print("running", layout, mode, "cache", cache, file=sys.stderr)
+                output = subprocess.run(
+                    command, check=True, stdout=subprocess.PIPE, universal_newlines=True
+                ).stdout
+                scenarios.append(json.loads(output.strip().splitlines()[-1]))
+
+    harness.write_report({
+        "benchmark": "latency",
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "scenarios": scenarios,
+    }, args.json)
+
+
+if __name__ == "__main__":
+    main()
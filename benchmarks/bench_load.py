@@ -0,0 +1,170 @@
+"""Layout loading benchmark.
+
+Loads the bundled layout and generated stress layouts with SVGParser, once
+with the streaming index and once with the lxml tree loader, and reports
+load time, peak traced allocations during the load and the memory still
+held afterwards. For each layout, it also times hot reloading an edit to a
+single group, and compares the size of the layout and the time it takes to
+render a frame of every group with and without the optimization pass.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_load.py --json load.json
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import harness
+
+
+LOADERS = {"streaming": True, "tree": False}
+
+
+def measure_load(path: str, streaming: bool, repeat: int):
+    from plover_svg_layout_display.svg_parser import SVGParser
+
+    times = []
+    for _ in range(repeat):
+        parser = SVGParser()
+        start = perf_counter()
+        parser.load_file(path, streaming)
+        times.append(perf_counter() - start)
+
+    tracemalloc.start()
+    parser = SVGParser()
+    parser.load_file(path, streaming)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Serializing every group once shows the cost of the lazy decoding
+    start = perf_counter()
+    for group_id in parser.group_svgs:
+        parser.group_svgs[group_id]
+    first_access = perf_counter() - start
+
+    return {
+        "groups": len(parser.group_svgs),
+        "load": harness.summarize(times),
+        "first_access_all_groups_ms": first_access * 1000,
+        "peak_alloc_bytes": peak,
+        "retained_bytes": retained,
+    }
+
+
+def measure_patch(path: str, repeat: int):
+    from plover_svg_layout_display.svg_widget import load_layout_svg
+
+    with open(path, "rb") as svg_file:
+        data = svg_file.read()
+
+    # Alternates between two versions that differ in one group
+    group_end = data.index(b"</g>")
+    edited = data[:group_end] + b"<desc>edited</desc>" + data[group_end:]
+
+    loaded = load_layout_svg(path, 100)
+    times = []
+    for index in range(repeat):
+        start = perf_counter()
+        patched = loaded.svg_parser.patch(edited if index % 2 == 0 else data)
+        loaded.patch(*patched)
+        times.append(perf_counter() - start)
+
+    return {"patch_one_group": harness.summarize(times)}
+
+
+def render_time(parser, repeat: int) -> list:
+    from PyQt5.QtCore import QByteArray, QRectF, Qt
+    from PyQt5.QtGui import QImage, QPainter
+    from PyQt5.QtSvg import QSvgRenderer
+
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        renderer = QSvgRenderer(QByteArray(parser.get_svg_bytes(parser.group_svgs)))
+        size = renderer.defaultSize()
+        image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        renderer.render(painter, QRectF(0, 0, size.width(), size.height()))
+        painter.end()
+        times.append(perf_counter() - start)
+
+    return times
+
+
+def measure_optimize(path: str, repeat: int):
+    from plover_svg_layout_display.svg_optimize import optimize_svg
+    from plover_svg_layout_display.svg_parser import SVGParser
+
+    with open(path, "rb") as svg_file:
+        data = svg_file.read()
+
+    start = perf_counter()
+    _, report = optimize_svg(data)
+    optimize_time = perf_counter() - start
+
+    result = {
+        "optimize_ms": optimize_time * 1000,
+        "bytes_before": report.bytes_before,
+        "bytes_after": report.bytes_after,
+    }
+    for name, optimize in (("frame_before", False), ("frame_after", True)):
+        parser = SVGParser()
+        parser.load_file(path, optimize=optimize)
+        result[name] = harness.summarize(render_time(parser, repeat))
+
+    return result
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--layouts", default="en,1000,10000,50000",
+        help="'en' or group counts of generated layouts (default: %(default)s)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed loads per layout")
+    parser.add_argument("--json", help="write the report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    harness.get_app()
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for layout in args.layouts.split(","):
+            if layout == "en":
+                path = harness.EN_SVG
+            else:
+                path, _ = harness.generate_layout(directory, int(layout))
+
+            for loader, streaming in LOADERS.items():
+                result = measure_load(path, streaming, args.repeat)
+                result.update({
+                    "layout": layout,
+                    "loader": loader,
+                    "file_bytes": os.path.getsize(path),
+                })
+                results.append(result)
+
+            result = measure_patch(path, args.repeat)
+            result.update({"layout": layout, "loader": "hot reload"})
+            results.append(result)
+
+            result = measure_optimize(path, args.repeat)
+            result.update({"layout": layout, "loader": "optimized"})
+            results.append(result)
+
+    harness.write_report({
+        "benchmark": "load",
+        "python": sys.version.split()[0],
+        "peak_rss_bytes": harness.peak_rss_bytes(),
+        "results": results,
+    }, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Startup benchmark.
+
+Measures, each in a fresh interpreter, how long it takes to import the
+tool module that Plover loads at startup, which optional modules that
+import pulls in, how long the tool's constructor blocks before the window
+is up, and the time until the first frame of the layout is painted.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_startup.py --json startup.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import harness
+
+
+# Modules that should only be imported once they are actually needed
+LAZY_MODULES = (
+    "numpy",
+    "lxml",
+    "multiprocessing",
+    "plover_svg_layout_display.config_ui",
+)
+
+
+def measure_child(svg_path: str, py_path: str) -> dict:
+    app = harness.get_app()
+
+    start = perf_counter()
+    from plover_svg_layout_display.layout_ui import SVGLayoutDisplayTool
+    import_time = perf_counter() - start
+    imported = [name for name in LAZY_MODULES if name in sys.modules]
+
+    start = perf_counter()
+    tool = SVGLayoutDisplayTool(harness.StubEngine())
+    tool.config.system_map[harness.SYSTEM_NAME] = {
+        "system_svg": svg_path,
+        "system_py": py_path,
+        "system_scale": 100,
+    }
+    construct_time = perf_counter() - start
+
+    while not tool.started or tool.svg_widget.loaded is None:
+        app.processEvents()
+    tool.svg_widget.repaint()
+    first_frame_time = perf_counter() - start
+
+    return {
+        "import_ms": import_time * 1000,
+        "construct_ms": construct_time * 1000,
+        "first_frame_ms": first_frame_time * 1000,
+        "eager_imports": imported,
+    }
+
+
+def run_child(svg_path: str, py_path: str) -> dict:
+    output = subprocess.check_output([
+        sys.executable, os.path.abspath(__file__),
+        "--child", "--svg", svg_path, "--py", py_path
+    ])
+    return json.loads(output)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--svg", default=harness.EN_SVG, help="layout SVG")
+    parser.add_argument("--py", default=harness.EN_PY, help="layout script")
+    parser.add_argument("--repeat", type=int, default=5, help="interpreters to start")
+    parser.add_argument("--json", help="write the report to this file instead of stdout")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_child(args.svg, args.py)))
+        return
+
+    runs = [run_child(args.svg, args.py) for _ in range(args.repeat)]
+    harness.write_report({
+        "benchmark": "startup",
+        "python": sys.version.split()[0],
+        "layout": args.svg,
+        "import": harness.summarize([run["import_ms"] / 1000 for run in runs]),
+        "construct": harness.summarize([run["construct_ms"] / 1000 for run in runs]),
+        "first_frame": harness.summarize([run["first_frame_ms"] / 1000 for run in runs]),
+        "eager_imports": sorted({name for run in runs for name in run["eager_imports"]}),
+    }, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""Shared setup for the headless benchmarks.
+
+The benchmarks run the real display code under the offscreen Qt platform,
+with just enough of Plover stubbed out to construct the tool without a
+running engine. Import this module before anything from the plugin.
+"""
+
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import tempfile
+import types
+
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QApplication, QDialog
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOURCES_DIR = os.path.join(REPO_DIR, "plover_svg_layout_display", "resources")
+EN_SVG = os.path.join(RESOURCES_DIR, "en_layout.svg")
+EN_PY = os.path.join(RESOURCES_DIR, "en_convert.py")
+
+SYSTEM_NAME = "English Stenotype"
+STENO_KEYS = (
+    "#", "S-", "T-", "K-", "P-", "W-", "H-", "R-", "A-", "O-", "*",
+    "-E", "-U", "-F", "-R", "-P", "-B", "-L", "-G", "-T", "-S", "-D", "-Z"
+)
+
+
+class StubStroke:
+    def __init__(self, steno_keys: Sequence[str]) -> None:
+        self.steno_keys = tuple(steno_keys)
+
+
+class StubTranslation:
+    def __init__(self, english: str) -> None:
+        self.english = english
+
+
+class StubTranslatorState:
+    def __init__(self) -> None:
+        self.translations = [StubTranslation("benchmark")]
+
+    def prev(self) -> List[StubTranslation]:
+        return self.translations
+
+
+class StubEngine:
+    def __init__(self) -> None:
+        self.translator_state = StubTranslatorState()
+        self.signals: Dict[str, List] = {}
+
+    def signal_connect(self, name: str, callback) -> None:
+        self.signals.setdefault(name, []).append(callback)
+
+
+class StubTool(QDialog):
+    def __init__(self, engine: StubEngine) -> None:
+        super().__init__()
+        self._engine = engine
+        self.settings_path = tempfile.mktemp(suffix=".ini")
+
+    def restore_state(self) -> None:
+        self._restore_state(QSettings(self.settings_path, QSettings.IniFormat))
+
+    def save_state(self) -> None:
+        self._save_state(QSettings(self.settings_path, QSettings.IniFormat))
+
+
+def install_plover_stubs() -> None:
+    modules = {
+        "plover": {},
+        "plover.log": {
+            "debug": logging.debug,
+            "info": logging.info,
+            "warning": logging.warning,
+            "error": logging.error,
+        },
+        "plover.system": {"NAME": SYSTEM_NAME},
+        "plover.engine": {"StenoEngine": StubEngine},
+        "plover.oslayer": {},
+        "plover.oslayer.config": {
+            "PLUGINS_PLATFORM": None,
+            "CONFIG_DIR": tempfile.mkdtemp(prefix="svgld_bench_"),
+        },
+        "plover.gui_qt": {},
+        "plover.gui_qt.tool": {"Tool": StubTool},
+        "plover.steno": {"Stroke": StubStroke},
+    }
+
+    for name, attributes in modules.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        sys.modules[name] = module
+
+
+_app = None
+
+
+def get_app() -> QApplication:
+    global _app
+    if _app is None:
+        _app = QApplication.instance() or QApplication(sys.argv[:1])
+    return _app
+
+
+def make_tool(svg_path: str, py_path: str, **config):
+    get_app()
+    from plover_svg_layout_display.layout_ui import SVGLayoutDisplayTool
+
+    tool = SVGLayoutDisplayTool(StubEngine())
+    tool.config.system_map[SYSTEM_NAME] = {
+        "system_svg": svg_path,
+        "system_py": py_path,
+        "system_scale": config.pop("system_scale", 100),
+    }
+    for key, value in config.items():
+        setattr(tool.config, key, value)
+
+    tool.reload_config()
+    return tool
+
+
+def generate_layout(directory: str, group_count: int) -> Tuple[str, str]:
+    """Writes a stress layout with `group_count` groups and a matching script.
+
+    Groups are split between the 23 steno keys, and every key owns a pressed
+    and a released half, so each stroke draws half of the groups, like the
+    bundled layout does.
+    """
+    columns = max(1, int(group_count ** 0.5))
+    cell = 10
+    width = columns * cell
+    height = (group_count // columns + 1) * cell
+
+    svg_path = os.path.join(directory, "stress_{}.svg".format(group_count))
+    with open(svg_path, "w", encoding="utf-8") as svg_file:
+        svg_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<svg width="{w}" height="{h}" viewBox="0 0 {w} {h}" '
+            'xmlns="http://www.w3.org/2000/svg">\n'.format(w=width, h=height)
+        )
+        for index in range(group_count):
+            x = (index % columns) * cell
+            y = (index // columns) * cell
+            svg_file.write(
+                ' <g id="g{i}">\n'
+                '  <rect x="{x}" y="{y}" width="8" height="8" rx="1" '
+                'fill="#e9d9f2" stroke="#7109aa" stroke-width=".2"/>\n'
+                ' </g>\n'.format(i=index, x=x + 1, y=y + 1)
+            )
+        svg_file.write("</svg>\n")
+
+    py_path = os.path.join(directory, "stress_{}.py".format(group_count))
+    with open(py_path, "w", encoding="utf-8") as py_file:
+        py_file.write(
+            "KEYS = {keys!r}\n"
+            "GROUP_COUNT = {count}\n"
+            "BUCKETS = [\n"
+            "    (key, ['g%d' % i for i in range(k, GROUP_COUNT, 2 * len(KEYS))],\n"
+            "     ['g%d' % i for i in range(k + len(KEYS), GROUP_COUNT, 2 * len(KEYS))])\n"
+            "    for k, key in enumerate(KEYS)\n"
+            "]\n"
+            "\n"
+            "def convert_stroke(stroke, translation):\n"
+            "    ids = []\n"
+            "    for key, pressed, released in BUCKETS:\n"
+            "        ids.extend(pressed if key in stroke else released)\n"
+            "    return ids\n".format(keys=STENO_KEYS, count=group_count)
+        )
+
+    return svg_path, py_path
+
+
+def synthetic_strokes(count: int, seed: int = 0, vocabulary: int = 500) -> List[Tuple[str, ...]]:
+    """A skewed stream: a few hundred distinct strokes, Zipf-distributed."""
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(vocabulary):
+        size = rng.randint(1, 7)
+        keys = sorted(rng.sample(range(len(STENO_KEYS)), size))
+        pool.append(tuple(STENO_KEYS[k] for k in keys))
+
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    return rng.choices(pool, weights=weights, k=count)
+
+
+def read_stroke_log(path: str) -> Iterator[Tuple[str, ...]]:
+    """Streams the strokes out of a Plover strokes.log file."""
+    from plover_svg_layout_display.replay import read_strokes
+
+    with open(path, encoding="utf-8", errors="replace") as log_file:
+        yield from read_strokes(log_file)
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """Summarizes timings given in seconds, reported in milliseconds."""
+    if not samples:
+        return {"count": 0}
+
+    return {
+        "count": len(samples),
+        "mean_ms": sum(samples) / len(samples) * 1000,
+        "p50_ms": percentile(samples, 0.50) * 1000,
+        "p95_ms": percentile(samples, 0.95) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def timed(function, *args) -> Tuple[float, object]:
+    start = perf_counter()
+    result = function(*args)
+    return perf_counter() - start, result
+
+
+def write_report(report: Dict, path: str = None) -> None:
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if path:
+        with open(path, "w", encoding="utf-8") as report_file:
+            report_file.write(text + "\n")
+    else:
+        print(text)
+
+
+def take(strokes: Iterable[Tuple[str, ...]], count: int) -> List[Tuple[str, ...]]:
+    result = []
+    for stroke in strokes:
+        if len(result) >= count:
+            break
+        result.append(stroke)
+    return result
+
+
+install_plover_stubs()
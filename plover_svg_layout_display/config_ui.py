@@ -1,15 +1,19 @@
 from PyQt5.QtWidgets import (
     QDialog, QWidget, QLabel, QDialogButtonBox, QGridLayout,
     QGroupBox, QCheckBox, QVBoxLayout, QLineEdit, QScrollArea,
-    QFileDialog, QPushButton, QSpinBox
+    QFileDialog, QPushButton, QSpinBox, QComboBox
 )
 from PyQt5.QtCore import Qt
 
+from typing import Optional
+
 from plover_svg_layout_display.layout_config import (
     CONFIG_FILE_PARAMS, SYSTEM_NAME_PLACEHOLDER, SYSTEM_PREFIX, 
     LayoutConfig, CONFIG_NAMES, CONFIG_ORDER, CONFIG_TYPES,
-    CONFIG_ITEMS
+    CONFIG_ITEMS, CONFIG_CHOICES, CONFIG_INT_PARAMS, CLEAR_CACHE_PLACEHOLDER,
+    SCRIPT_WARNING_PLACEHOLDER
 )
+from plover_svg_layout_display.layout_cache import LayoutCache
 
 
 FIELD_DATA_WIDTH = 250
@@ -22,11 +26,15 @@ class ConfigUI(QDialog):
         self, 
         temp_config: LayoutConfig, 
         system_name: str, 
-        parent: QWidget = None
+        parent: QWidget = None,
+        layout_cache: Optional[LayoutCache] = None,
+        script_warning: Optional[str] = None
     ) -> None:
         super().__init__(parent)
         self.temp_config = temp_config
         self.system_name = system_name
+        self.layout_cache = layout_cache
+        self.script_warning = script_warning
         self.setup_window()
 
     def select_file(
@@ -45,6 +53,17 @@ class ConfigUI(QDialog):
         
         return func
 
+    def cache_size_text(self) -> str:
+        if self.layout_cache is None:
+            return "Disabled"
+
+        return "{:.1f} MB".format(self.layout_cache.total_bytes() / (1024 * 1024))
+
+    def clear_cache(self) -> None:
+        if self.layout_cache is not None:
+            self.layout_cache.clear()
+        self.cache_size_label.setText(self.cache_size_text())
+
     def setup_window(self) -> None:
         self.scroll_widget = QWidget()
         self.scroll_area = QScrollArea()
@@ -83,6 +102,47 @@ class ConfigUI(QDialog):
                 current_grid_row += 1
                 continue
 
+            if config_name == CLEAR_CACHE_PLACEHOLDER:
+                cache_label = QLabel()
+                cache_label.setText(CONFIG_NAMES[config_name])
+                self.cache_size_label = QLabel()
+                self.cache_size_label.setText(self.cache_size_text())
+                clear_button = QPushButton("Clear", self)
+                clear_button.clicked.connect(self.clear_cache)
+                clear_button.setEnabled(self.layout_cache is not None)
+
+                current_grid_layout.addWidget(
+                    cache_label, current_grid_row, 0, 1, 1, Qt.AlignRight
+                )
+                current_grid_layout.addWidget(
+                    self.cache_size_label, current_grid_row, 1, 1, 1, Qt.AlignLeft
+                )
+                current_grid_layout.addWidget(
+                    clear_button, current_grid_row, 2, 1, 1, Qt.AlignLeft
+                )
+                current_grid_row += 1
+                continue
+
+            if config_name == SCRIPT_WARNING_PLACEHOLDER:
+                if self.script_warning is None:
+                    continue
+
+                warning_label = QLabel()
+                warning_label.setText(CONFIG_NAMES[config_name])
+                warning_data = QLabel()
+                warning_data.setText(self.script_warning)
+                warning_data.setWordWrap(True)
+                warning_data.setStyleSheet("color: #c0392b;")
+
+                current_grid_layout.addWidget(
+                    warning_label, current_grid_row, 0, 1, 1, Qt.AlignRight
+                )
+                current_grid_layout.addWidget(
+                    warning_data, current_grid_row, 1, 1, 2, Qt.AlignLeft
+                )
+                current_grid_row += 1
+                continue
+
             field_label = QLabel()
             field_label.setText(CONFIG_NAMES[config_name])
 
@@ -107,6 +167,11 @@ class ConfigUI(QDialog):
                 field_data = QCheckBox()
                 field_data.setChecked(field_value)
 
+            elif config_name in CONFIG_CHOICES:
+                field_data = QComboBox()
+                field_data.addItems(CONFIG_CHOICES[config_name])
+                field_data.setCurrentText(field_value)
+
             elif field_type == str:
                 field_data = QLineEdit()
 
@@ -119,14 +184,13 @@ class ConfigUI(QDialog):
 
                 field_data.setText(field_value)
 
-            # Note that all integer configs are percentages (for now)
-            # So we're hardcoding the limits
             elif field_type == int:
+                minimum, maximum, step, suffix = CONFIG_INT_PARAMS[config_name]
                 field_data = QSpinBox()
-                field_data.setRange(5, 10000)
-                field_data.setSingleStep(5)
-                field_data.setSuffix("%")
-                field_data.setValue(field_value or 100)
+                field_data.setRange(minimum, maximum)
+                field_data.setSingleStep(step)
+                field_data.setSuffix(suffix)
+                field_data.setValue(field_value)
 
             if field_data is not None:
                 field_data.setMinimumWidth(FIELD_DATA_WIDTH)
@@ -180,6 +244,8 @@ class ConfigUI(QDialog):
                 field_value = field_data.isChecked()
             elif field_type == int:
                 field_value = field_data.value()
+            elif config_name in CONFIG_CHOICES:
+                field_value = field_data.currentText()
             elif field_type == str:
                 field_value = field_data.text()
 
@@ -0,0 +1,148 @@
+from PyQt5.QtCore import QSize
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional, Tuple
+
+
+# (group IDs, width, height, device pixel ratio)
+FrameKey = Tuple[Tuple[str, ...], int, int, float]
+
+
+def frame_key(group_ids: Iterable[str], size: QSize, dpr: float) -> FrameKey:
+    # Frames are rasterized, so the same groups at another size or pixel
+    # ratio make another frame
+    return tuple(group_ids), size.width(), size.height(), dpr
+
+
+class FrameCache:
+    """Finished frames, least recently used first.
+
+    Frames are rasterized images, so a hit is a single blit. Most strokes
+    are only written once, so a frame is only kept the second time it is
+    asked for; keys seen once are kept in a list of their own, bounded
+    like the cache.
+    """
+
+    __slots__ = [
+        "max_entries", "max_bytes", "frames", "seen",
+        "total_bytes", "hits", "misses", "prefetched", "prefetch_hits"
+    ]
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.frames: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self.seen: "OrderedDict[Hashable, None]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = set()
+        self.prefetch_hits = 0
+
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def resize(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def clear(self) -> None:
+        self.frames.clear()
+        self.seen.clear()
+        self.prefetched.clear()
+        self.total_bytes = 0
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.prefetch_hits = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self.frames.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if key in self.prefetched:
+            self.prefetched.discard(key)
+            self.prefetch_hits += 1
+        self.frames.move_to_end(key)
+        return entry[0]
+
+    def admit(self, key: Hashable) -> bool:
+        """Whether a frame that missed is worth recording, which it is once
+        it has been asked for before."""
+        if not self.enabled():
+            return False
+
+        if key in self.seen:
+            del self.seen[key]
+            return True
+
+        self.seen[key] = None
+        while len(self.seen) > self.max_entries:
+            self.seen.popitem(last=False)
+        return False
+
+    def put(self, key: Hashable, frame: Any, size: int) -> None:
+        # Frames that could never fit are not cached at all, rather than
+        # flushing everything else out of the cache
+        if not self.enabled() or size > self.max_bytes:
+            return
+
+        self.prefetched.discard(key)
+        self.seen.pop(key, None)
+        old_entry = self.frames.pop(key, None)
+        if old_entry is not None:
+            self.total_bytes -= old_entry[1]
+
+        self.frames[key] = (frame, size)
+        self.total_bytes += size
+        self.evict()
+
+    def offer(self, key: Hashable, frame: Any, size: int) -> bool:
+        # Prefetched frames only take up room that is still free, and go to
+        # the least recently used end, so that they never push out frames
+        # that were actually drawn
+        if (
+            not self.enabled() or key in self.frames
+            or len(self.frames) >= self.max_entries
+            or self.total_bytes + size > self.max_bytes
+        ):
+            return False
+
+        self.frames[key] = (frame, size)
+        self.frames.move_to_end(key, last=False)
+        self.total_bytes += size
+        self.prefetched.add(key)
+        return True
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        for key in [key for key in self.frames if predicate(key)]:
+            _, size = self.frames.pop(key)
+            self.prefetched.discard(key)
+            self.total_bytes -= size
+
+        for key in [key for key in self.seen if predicate(key)]:
+            del self.seen[key]
+
+    def evict(self) -> None:
+        while len(self.seen) > self.max_entries:
+            self.seen.popitem(last=False)
+
+        while self.frames and (
+            len(self.frames) > self.max_entries
+            or self.total_bytes > self.max_bytes
+        ):
+            key, (_, size) = self.frames.popitem(last=False)
+            self.prefetched.discard(key)
+            self.total_bytes -= size
+
+    def __len__(self) -> int:
+        return len(self.frames)
@@ -0,0 +1,293 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from collections import Counter
+from itertools import islice
+from time import thread_time
+from typing import Any, Iterable, List, Optional, Tuple
+
+from plover import log
+from plover.steno import Stroke
+
+from plover_svg_layout_display.key_table import KeyTable
+from plover_svg_layout_display.layout_config import RENDER_ATLAS
+from plover_svg_layout_display.layout_script import LayoutScript
+from plover_svg_layout_display.frame_cache import FrameKey, frame_key
+from plover_svg_layout_display.svg_layers import render_image
+
+
+# Strokes written between two prefetch passes, so that the predictions
+# follow what is actually being written
+REFRESH_STROKES = 256
+
+
+def parse_steno(steno: str) -> Optional[Tuple[str, ...]]:
+    # Older Plover versions cannot split a stroke string into keys, in which
+    # case the dictionaries are simply not used for predictions
+    from_steno = getattr(Stroke, "from_steno", None)
+    if from_steno is None:
+        return None
+
+    try:
+        return tuple(from_steno(steno).steno_keys)
+    except ValueError:
+        # Dictionaries can hold strokes the current system has no keys for
+        log.debug("svgld: not predicting invalid stroke %r", steno)
+        return None
+
+
+def count_dictionary_strokes(dictionaries: Any) -> Counter:
+    counts = Counter()
+    if dictionaries is None:
+        return counts
+
+    try:
+        for dictionary in dictionaries.dicts:
+            if not getattr(dictionary, "enabled", True):
+                continue
+
+            for outline in dictionary:
+                counts.update(outline)
+    except Exception:
+        # The dictionaries may be reloaded while they are being counted;
+        # whatever was counted so far is still a fine guess
+        pass
+
+    return counts
+
+
+class PredictTask(QRunnable):
+
+    def __init__(
+        self,
+        prefetcher: "FramePrefetcher",
+        loaded: Any,
+        key_rows: List[List[str]],
+        strokes: List[Tuple[str, ...]],
+        count: int
+    ) -> None:
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.loaded = loaded
+        self.key_rows = key_rows
+        self.strokes = strokes
+        self.count = count
+        self.generation = loaded.generation
+
+    def candidates(self) -> Iterable[Tuple[str, ...]]:
+        yield from self.strokes
+
+        prefetcher = self.prefetcher
+        if prefetcher.dictionary_counts is None:
+            prefetcher.dictionary_counts = count_dictionary_strokes(
+                prefetcher.dictionaries
+            )
+
+        for steno, _ in prefetcher.dictionary_counts.most_common(self.count):
+            stroke = parse_steno(steno)
+            if stroke is not None:
+                yield stroke
+
+    def run(self) -> None:
+        start = thread_time()
+        frames = []
+
+        try:
+            # The strokes are looked up in a table of this task's own, so
+            # nothing the GUI thread converts with is touched. Its frames
+            # hold the raw IDs, which are resolved on the GUI thread.
+            key_table = KeyTable(self.key_rows)
+            strokes = list(islice(self.candidates(), 2 * self.count))
+            frames, _ = key_table.convert_strokes(strokes)
+        except Exception:
+            self.prefetcher.log_failure()
+            frames = []
+
+        self.prefetcher.predicted.emit(
+            self.loaded, frames, self.generation, thread_time() - start
+        )
+
+
+class RenderTask(QRunnable):
+
+    def __init__(
+        self,
+        prefetcher: "FramePrefetcher",
+        loaded: Any,
+        frames: List[Tuple[FrameKey, List[str]]],
+        generation: int
+    ) -> None:
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.loaded = loaded
+        self.frames = frames
+        self.generation = generation
+
+    def run(self) -> None:
+        start = thread_time()
+        loaded = self.loaded
+        results = []
+
+        try:
+            for key, group_ids in self.frames:
+                frame = render_image(
+                    loaded.svg_parser.get_svg_bytes(group_ids),
+                    loaded.svg_size,
+                    key[3]
+                )
+                results.append((key, frame, frame.sizeInBytes()))
+        except Exception:
+            self.prefetcher.log_failure()
+
+        self.prefetcher.finished.emit(
+            loaded, results, self.generation, thread_time() - start
+        )
+
+
+class FramePrefetcher(QObject):
+    """Renders frames for the most likely upcoming strokes on a worker
+    thread, and offers them to the frame cache of the layout on display.
+
+    Only scripts that convert strokes with a `KEYS` table are prefetched for,
+    since converting made up strokes next to the real ones would upset any
+    script that keeps state of its own between strokes.
+    """
+
+    predicted = pyqtSignal(object, object, int, float)
+    finished = pyqtSignal(object, object, int, float)
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.count = 0
+        self.history = Counter()
+        self.dictionaries = None
+        self.dictionary_counts: Optional[Counter] = None
+        self.running = False
+        self.strokes_since = 0
+
+        self.loaded = None
+        self.script: Optional[LayoutScript] = None
+        self.dpr = 1.0
+
+        self.batches = 0
+        self.prefetched = 0
+        self.cpu_time = 0.0
+        self.failed = False
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.predicted.connect(self.on_predicted)
+        self.finished.connect(self.on_finished)
+
+    def set_count(self, count: int) -> None:
+        self.count = count
+
+    def set_dictionaries(self, dictionaries: Any) -> None:
+        self.dictionaries = dictionaries
+        self.dictionary_counts = None
+
+    def set_layout(
+        self,
+        loaded: Any,
+        script: Optional[LayoutScript],
+        dpr: float = 1.0
+    ) -> None:
+        self.loaded = loaded
+        self.script = script
+        self.dpr = dpr
+        self.strokes_since = 0
+        self.start()
+
+    def reset_stats(self) -> None:
+        self.batches = 0
+        self.prefetched = 0
+        self.cpu_time = 0.0
+
+    def record(self, stroke: Tuple[str, ...]) -> None:
+        if self.count <= 0 or not stroke:
+            return
+
+        self.history[stroke] += 1
+        self.strokes_since += 1
+        if self.strokes_since >= REFRESH_STROKES:
+            self.strokes_since = 0
+            self.start()
+
+    def log_failure(self) -> None:
+        # Called from the worker thread; a failing layout would otherwise
+        # log the same error on every pass
+        if not self.failed:
+            self.failed = True
+            log.error("svgld: could not prefetch frames", exc_info=True)
+
+    def start(self) -> None:
+        loaded = self.loaded
+        # Isolated scripts always have code of their own, and never return
+        # table rows
+        key_rows = self.script.table_rows() if self.script is not None else None
+        if (
+            self.count <= 0 or self.running or key_rows is None
+            or loaded is None or loaded.is_invalid
+            or loaded.render_mode == RENDER_ATLAS
+            or not loaded.frame_cache.enabled()
+        ):
+            return
+
+        strokes = [stroke for stroke, _ in self.history.most_common(self.count)]
+        self.running = True
+        self.thread_pool.start(PredictTask(
+            self, loaded, key_rows, strokes, self.count
+        ))
+
+    def on_predicted(
+        self,
+        loaded: Any,
+        frames: List[List[str]],
+        generation: int,
+        cpu_time: float
+    ) -> None:
+        self.cpu_time += cpu_time
+        if generation != loaded.generation:
+            self.running = False
+            return
+
+        # Predictions cannot know the translation, but frames are keyed by
+        # group IDs, so a wrong guess is only wasted work. Strokes that draw
+        # the same frame are only rendered once.
+        seen = set(loaded.frame_cache.frames)
+        resolved = []
+        for group_ids in frames:
+            if len(resolved) >= self.count:
+                break
+
+            group_ids = loaded.svg_parser.resolve(group_ids)
+            key = frame_key(group_ids, loaded.svg_size, self.dpr)
+            if key in seen:
+                continue
+            seen.add(key)
+            resolved.append((key, group_ids))
+
+        if not resolved:
+            self.running = False
+            self.batches += 1
+            return
+
+        self.thread_pool.start(RenderTask(self, loaded, resolved, generation))
+
+    def on_finished(
+        self,
+        loaded: Any,
+        results: list,
+        generation: int,
+        cpu_time: float
+    ) -> None:
+        self.running = False
+        self.batches += 1
+        self.cpu_time += cpu_time
+
+        # Frames drawn from groups that have since been edited are dropped
+        if generation != loaded.generation:
+            return
+
+        for key, frame, size in results:
+            if loaded.frame_cache.offer(key, frame, size):
+                self.prefetched += 1
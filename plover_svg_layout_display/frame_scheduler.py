@@ -0,0 +1,65 @@
+from PyQt5.QtCore import QObject, QTimer, Qt
+
+from time import monotonic
+from typing import Any, Callable
+
+
+class FrameScheduler(QObject):
+
+    def __init__(self, render: Callable[[Any], None], parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.render = render
+        self.max_fps = 0
+        self.pending = None
+        self.has_pending = False
+        self.last_render = 0.0
+
+        self.received = 0
+        self.rendered = 0
+        self.coalesced = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.flush)
+
+    def set_max_fps(self, max_fps: int) -> None:
+        self.max_fps = max_fps
+        if max_fps <= 0 and self.has_pending:
+            self.timer.stop()
+            self.flush()
+
+    def reset_stats(self) -> None:
+        self.received = 0
+        self.rendered = 0
+        self.coalesced = 0
+
+    def submit(self, state: Any) -> None:
+        self.received += 1
+        if self.has_pending:
+            self.coalesced += 1
+
+        # Only the newest state is kept; anything still waiting for the
+        # next frame is simply replaced
+        self.pending = state
+        self.has_pending = True
+
+        if self.max_fps <= 0:
+            self.flush()
+            return
+
+        if not self.timer.isActive():
+            frame_ms = 1000 / self.max_fps
+            elapsed_ms = (monotonic() - self.last_render) * 1000
+            self.timer.start(max(0, int(frame_ms - elapsed_ms)))
+
+    def flush(self) -> None:
+        if not self.has_pending:
+            return
+
+        state = self.pending
+        self.pending = None
+        self.has_pending = False
+        self.last_render = monotonic()
+        self.rendered += 1
+        self.render(state)
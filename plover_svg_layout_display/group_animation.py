@@ -0,0 +1,100 @@
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer, Qt
+
+from time import monotonic
+from typing import Any, List, Optional
+
+
+DEFAULT_ANIMATION_FPS = 60
+
+
+class Fade:
+    """A group that left the display and is fading out over its own
+    duration, in seconds."""
+
+    __slots__ = ["start", "duration"]
+
+    def __init__(self, start: float, duration: float) -> None:
+        self.start = start
+        self.duration = duration
+
+    def end(self) -> float:
+        return self.start + self.duration
+
+    def opacity(self, now: float) -> float:
+        progress = (now - self.start) / self.duration
+        if progress >= 1.0:
+            return 0.0
+
+        # Eases out, so that keys let go of quickly and then linger faintly
+        return (1.0 - max(progress, 0.0)) ** 2
+
+
+class AnimationClock(QObject):
+    """A single timer shared by every widget with something animating.
+
+    The timer only runs while a widget has animations left, so an idle
+    display costs nothing. Animations are driven by the wall clock, and
+    ticks that come due while the GUI thread is busy are skipped rather
+    than run late one after another.
+    """
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.interval = 1 / DEFAULT_ANIMATION_FPS
+        self.animated: List[Any] = []
+        self.next_tick = 0.0
+
+        self.ticks = 0
+        self.skipped = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+    def set_max_fps(self, max_fps: int) -> None:
+        self.interval = 1 / (max_fps if max_fps > 0 else DEFAULT_ANIMATION_FPS)
+
+    def reset_stats(self) -> None:
+        self.ticks = 0
+        self.skipped = 0
+
+    def start(self, animated: Any) -> None:
+        if animated not in self.animated:
+            self.animated.append(animated)
+
+        if not self.timer.isActive():
+            self.next_tick = monotonic() + self.interval
+            self.timer.start(int(self.interval * 1000))
+
+    def stop(self, animated: Any) -> None:
+        if animated in self.animated:
+            self.animated.remove(animated)
+        if not self.animated:
+            self.timer.stop()
+
+    def tick(self) -> None:
+        now = monotonic()
+        self.ticks += 1
+        self.animated = [animated for animated in self.animated if animated.animate(now)]
+        if not self.animated:
+            return
+
+        now = monotonic()
+        self.next_tick += self.interval
+        if self.next_tick < now:
+            missed = int((now - self.next_tick) / self.interval) + 1
+            self.skipped += missed
+            self.next_tick += missed * self.interval
+
+        self.timer.start(max(0, int((self.next_tick - now) * 1000)))
+
+
+_clock: Optional[AnimationClock] = None
+
+
+def animation_clock() -> AnimationClock:
+    global _clock
+    if _clock is None:
+        _clock = AnimationClock(QCoreApplication.instance())
+    return _clock
@@ -0,0 +1,181 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from plover_svg_layout_display.svg_index import ResolvedIds
+
+
+# Upper bound on the number of distinct key combinations remembered
+MAX_CACHED_MASKS = 4096
+
+# Bitmasks of more keys than this do not fit in a NumPy integer
+MAX_MATRIX_KEYS = 62
+
+# Distinct frames, and the index of each stroke's frame among them
+EncodedFrames = Tuple[List[List[str]], Sequence[int]]
+
+_numpy = False
+
+
+def load_numpy():
+    # NumPy is optional, and slow enough to import that it is only loaded
+    # the first time a batch of strokes could use it
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+
+    return _numpy
+
+
+def encode_frames(frames: Iterable[List[str]]) -> EncodedFrames:
+    distinct: List[List[str]] = []
+    codes: Dict[Tuple[str, ...], int] = {}
+    stroke_codes = []
+    for frame in frames:
+        key = tuple(frame)
+        code = codes.get(key)
+        if code is None:
+            code = len(distinct)
+            codes[key] = code
+            distinct.append(frame)
+        stroke_codes.append(code)
+
+    return distinct, stroke_codes
+
+
+def decode_membership(membership, group_ids: Sequence[str]) -> EncodedFrames:
+    """Turns a matrix with one row per stroke and one column per group, in
+    drawing order, into encoded frames."""
+    numpy = load_numpy()
+    rows, codes = numpy.unique(
+        numpy.asarray(membership, dtype=bool), axis=0, return_inverse=True
+    )
+    frames = [
+        [group_ids[column] for column in numpy.flatnonzero(row)]
+        for row in rows
+    ]
+    return frames, codes.reshape(-1)
+
+
+class KeyTable:
+    """Compiled form of a layout script's `KEYS` table.
+
+    Each row is `(key, pressed_id, released_id)`, where either ID may be
+    None to draw nothing. Strokes are turned into a bitmask of the keys they
+    contain, and each bitmask is resolved to its list of group IDs once.
+    Once bound to a layout, IDs the layout lacks are left out of every
+    frame, and frames carry the interned indices of their groups.
+    """
+
+    __slots__ = ["bits", "rows", "frames", "group_index"]
+
+    def __init__(self, keys: Sequence[Tuple[Optional[str], ...]]) -> None:
+        self.bits: Dict[str, int] = {}
+        self.rows: List[Tuple[int, Optional[str], Optional[str]]] = []
+
+        for row in keys:
+            key, pressed = row[0], row[1]
+            released = row[2] if len(row) > 2 else None
+
+            if key not in self.bits:
+                self.bits[key] = 1 << len(self.bits)
+            self.rows.append((self.bits[key], pressed, released))
+
+        self.frames: Dict[int, List[str]] = {}
+        self.group_index: Optional[Dict[str, int]] = None
+
+    def bind(self, group_index: Dict[str, int]) -> Set[str]:
+        self.group_index = group_index
+        self.frames = {}
+
+        unresolved = set()
+        for _, pressed, released in self.rows:
+            for group_id in (pressed, released):
+                if group_id is not None and group_id not in group_index:
+                    unresolved.add(group_id)
+
+        return unresolved
+
+    def mask(self, stroke: Sequence[str]) -> int:
+        bits = self.bits
+        mask = 0
+        for key in stroke:
+            mask |= bits.get(key, 0)
+
+        return mask
+
+    def resolve(self, mask: int) -> List[str]:
+        frame = self.frames.get(mask)
+        if frame is not None:
+            return frame
+
+        group_index = self.group_index
+        if group_index is None:
+            frame = []
+            for bit, pressed, released in self.rows:
+                group_id = pressed if mask & bit else released
+                if group_id is not None:
+                    frame.append(group_id)
+        else:
+            frame = ResolvedIds()
+            indices = []
+            for bit, pressed, released in self.rows:
+                group_id = pressed if mask & bit else released
+                index = group_index.get(group_id)
+                if index is not None:
+                    frame.append(group_id)
+                    indices.append(index)
+            frame.indices = tuple(indices)
+
+        if len(self.frames) < MAX_CACHED_MASKS:
+            self.frames[mask] = frame
+
+        return frame
+
+    def convert_stroke(self, stroke: Tuple[str, ...], _: str) -> List[str]:
+        return self.resolve(self.mask(stroke))
+
+    def key_matrix(self, strokes: Sequence[Tuple[str, ...]]):
+        """One row per stroke and one column per key, in the order the keys
+        first appear in the table."""
+        columns = {key: column for column, key in enumerate(self.bits)}
+        rows = []
+        row_columns = []
+        for index, stroke in enumerate(strokes):
+            for key in stroke:
+                column = columns.get(key)
+                if column is not None:
+                    rows.append(index)
+                    row_columns.append(column)
+
+        numpy = load_numpy()
+        matrix = numpy.zeros((len(strokes), len(columns)), dtype=bool)
+        matrix[rows, row_columns] = True
+        return matrix
+
+    def convert_strokes(self, strokes: Sequence[Tuple[str, ...]]) -> EncodedFrames:
+        # Each distinct key combination is only resolved once per batch
+        numpy = load_numpy()
+        if numpy is None or len(self.bits) > MAX_MATRIX_KEYS:
+            masks = [self.mask(stroke) for stroke in strokes]
+            return encode_frames(self.resolve(mask) for mask in masks)
+
+        weights = numpy.left_shift(
+            numpy.int64(1), numpy.arange(len(self.bits), dtype=numpy.int64)
+        )
+        masks = self.key_matrix(strokes).astype(numpy.int64) @ weights
+        unique_masks, codes = numpy.unique(masks, return_inverse=True)
+        return [self.resolve(int(mask)) for mask in unique_masks], codes.reshape(-1)
+
+
+def is_key_table(keys: object) -> bool:
+    if not isinstance(keys, (list, tuple)) or not keys:
+        return False
+
+    return all(
+        isinstance(row, (list, tuple)) and 2 <= len(row) <= 3
+        and isinstance(row[0], str)
+        for row in keys
+    )
@@ -0,0 +1,222 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from plover_svg_layout_display.qt_utils import load_qt_bytes
+
+
+CACHE_VERSION = 2
+CACHE_MAGIC = b"SVGLDC01"
+CACHE_SUFFIX = ".svgldc"
+
+# Magic, then the length of the JSON metadata that follows; the rest of the
+# file is the group buffer that the metadata's spans point into
+CACHE_HEADER = struct.Struct("<8sQ")
+
+
+def is_resource_path(path: str) -> bool:
+    return path.startswith(":")
+
+
+def file_stamp(path: str) -> Optional[List[int]]:
+    # Qt resources are compiled into the plugin and have no mtime, so they
+    # are always validated by their content hash
+    if is_resource_path(path):
+        return None
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+class CachedLayout:
+
+    __slots__ = ["svg_attribs", "group_spans", "group_data", "key_rows", "content_start"]
+
+    def __init__(
+        self,
+        svg_attribs: str,
+        group_spans: Dict[str, Tuple[int, int]],
+        group_data: Any,
+        key_rows: Optional[List[List[str]]],
+        content_start: Optional[int] = None
+    ) -> None:
+        self.svg_attribs = svg_attribs
+        self.group_spans = group_spans
+        self.group_data = group_data
+        self.key_rows = key_rows
+        self.content_start = content_start
+
+
+class LayoutCache:
+    """Compiled layouts stored on disk, one file per SVG/script pair.
+
+    A file holds the group index and group buffer of the SVG, and the KEYS
+    table of the script when it has one, so that a warm start needs neither
+    XML parsing nor running the script.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def entry_path(self, svg_path: str, py_path: str) -> str:
+        name = hashlib.sha1("{}\0{}".format(svg_path, py_path).encode("utf-8"))
+        return os.path.join(self.directory, name.hexdigest() + CACHE_SUFFIX)
+
+    def is_current(self, path: str, stamp: Optional[List[int]], digest: str) -> bool:
+        current_stamp = file_stamp(path)
+        if current_stamp is not None and current_stamp == stamp:
+            return True
+
+        return content_hash(load_qt_bytes(path)) == digest
+
+    def load(
+        self,
+        svg_path: str,
+        py_path: str,
+        optimized: bool = False
+    ) -> Optional[CachedLayout]:
+        entry_path = self.entry_path(svg_path, py_path)
+
+        try:
+            with open(entry_path, "rb") as entry_file:
+                data = mmap.mmap(entry_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, meta_length = CACHE_HEADER.unpack_from(data)
+            if magic != CACHE_MAGIC:
+                return None
+
+            meta_end = CACHE_HEADER.size + meta_length
+            meta = json.loads(data[CACHE_HEADER.size:meta_end].decode("utf-8"))
+        except (OSError, ValueError, struct.error):
+            return None
+
+        if meta.get("version") != CACHE_VERSION:
+            return None
+        if meta.get("optimized", False) != optimized:
+            return None
+        if not self.is_current(svg_path, meta["svg_stamp"], meta["svg_hash"]):
+            return None
+        if py_path and not self.is_current(py_path, meta["py_stamp"], meta["py_hash"]):
+            return None
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        group_data = memoryview(data)[meta_end:]
+        return CachedLayout(
+            meta["svg_attribs"],
+            {group_id: tuple(span) for group_id, span in meta["group_spans"].items()},
+            group_data,
+            meta["key_rows"],
+            meta["content_start"]
+        )
+
+    def store(
+        self,
+        svg_path: str,
+        py_path: str,
+        svg_data: bytes,
+        svg_attribs: str,
+        group_spans: Dict[str, Tuple[int, int]],
+        group_data: bytes,
+        key_rows: Optional[List[List[str]]],
+        optimized: bool = False,
+        content_start: Optional[int] = None
+    ) -> None:
+        meta = json.dumps({
+            "version": CACHE_VERSION,
+            "optimized": optimized,
+            "svg_stamp": file_stamp(svg_path),
+            "svg_hash": content_hash(svg_data),
+            "py_stamp": file_stamp(py_path) if py_path else None,
+            "py_hash": content_hash(load_qt_bytes(py_path)) if py_path else None,
+            "svg_attribs": svg_attribs,
+            "group_spans": group_spans,
+            "key_rows": key_rows,
+            "content_start": content_start
+        }).encode("utf-8")
+
+        entry_path = self.entry_path(svg_path, py_path)
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Several Plover instances may store the same entry at once,
+            # so each write gets a temporary file of its own
+            temp_fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        except OSError:
+            return
+
+        try:
+            with open(temp_fd, "wb") as entry_file:
+                entry_file.write(CACHE_HEADER.pack(CACHE_MAGIC, len(meta)))
+                entry_file.write(meta)
+                entry_file.write(group_data)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+
+        self.evict()
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+
+        entries = []
+        for name in names:
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        return entries
+
+    def total_bytes(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self) -> None:
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+
+        # Least recently used entries go first; loads touch their entry
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
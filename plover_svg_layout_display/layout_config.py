@@ -1,11 +1,32 @@
 from typing import List, Tuple, Any
 
 
+RENDER_DOCUMENT = "document"
+RENDER_LAYERS = "layers"
+RENDER_ELEMENTS = "elements"
+RENDER_ATLAS = "atlas"
+
 CONFIG_ITEMS = {
     "system_svg": "", 
     "system_py": "", 
     "system_scale": 100,
-    "force_repaint": False
+    "force_repaint": False,
+    "hot_reload": False,
+    "render_mode": RENDER_DOCUMENT,
+    "optimize_svg": False,
+    "frame_cache_entries": 256,
+    "frame_cache_memory": 16,
+    "max_fps": 60,
+    "prefetch_frames": 0,
+    "show_timings": False,
+    "layout_cache": True,
+    "layout_cache_size": 64,
+    "layout_registry_memory": 64,
+    "script_isolation": False,
+    "script_budget": 20,
+    "extra_views": "",
+    "history_strokes": 0,
+    "history_scale": 30
 }
 
 CONFIG_FILE_PARAMS = {
@@ -13,6 +34,24 @@ CONFIG_FILE_PARAMS = {
     "system_py": ("Select Python Script", "Python Script (*.py)")
 }
 
+# (minimum, maximum, step, suffix)
+CONFIG_INT_PARAMS = {
+    "system_scale": (5, 10000, 5, "%"),
+    "frame_cache_entries": (0, 100000, 64, ""),
+    "frame_cache_memory": (1, 4096, 1, " MB"),
+    "max_fps": (0, 1000, 10, " fps"),
+    "prefetch_frames": (0, 10000, 32, ""),
+    "layout_cache_size": (1, 4096, 16, " MB"),
+    "layout_registry_memory": (1, 4096, 16, " MB"),
+    "script_budget": (1, 10000, 5, " ms"),
+    "history_strokes": (0, 100, 1, ""),
+    "history_scale": (5, 100, 5, "%")
+}
+
+CONFIG_CHOICES = {
+    "render_mode": (RENDER_DOCUMENT, RENDER_LAYERS, RENDER_ELEMENTS, RENDER_ATLAS)
+}
+
 CONFIG_TYPES = {k: type(v) for k, v in CONFIG_ITEMS.items()}
 
 CONFIG_NAMES = {
@@ -20,7 +59,25 @@ CONFIG_NAMES = {
     "system_svg": "Layout SVG",
     "system_py": "Layout Python Script",
     "system_scale": "Layout Scale",
-    "force_repaint": "Force Repaint (macOS)"
+    "force_repaint": "Force Repaint (macOS)",
+    "hot_reload": "Reload Layout on File Change",
+    "render_mode": "Render Mode",
+    "optimize_svg": "Optimize Layout SVG",
+    "frame_cache_entries": "Cached Frames",
+    "frame_cache_memory": "Frame Cache Memory",
+    "max_fps": "Frame Rate Limit",
+    "prefetch_frames": "Prefetched Frames",
+    "show_timings": "Show Timing Overlay",
+    "layout_cache": "Cache Compiled Layouts",
+    "layout_cache_size": "Layout Cache Size",
+    "layout_cache_clear": "Cached Layouts",
+    "layout_registry_memory": "Preloaded Layout Memory",
+    "script_isolation": "Run Script in Separate Process",
+    "script_budget": "Script Time Budget",
+    "script_warning": "Warning",
+    "extra_views": "Extra Display Scales",
+    "history_strokes": "Strokes Shown",
+    "history_scale": "Stroke Scale"
 }
 
 CONFIG_ORDER = [
@@ -29,6 +86,34 @@ CONFIG_ORDER = [
     "system_svg",
     "system_py",
     "system_scale",
+    "hot_reload",
+
+    "Rendering",
+    "render_mode",
+    "optimize_svg",
+    "frame_cache_entries",
+    "frame_cache_memory",
+    "max_fps",
+    "prefetch_frames",
+    "show_timings",
+
+    "Layout Cache",
+    "layout_cache",
+    "layout_cache_size",
+    "layout_cache_clear",
+    "layout_registry_memory",
+
+    "Layout Script",
+    "script_isolation",
+    "script_budget",
+    "script_warning",
+
+    "Extra Displays",
+    "extra_views",
+
+    "Stroke History",
+    "history_strokes",
+    "history_scale",
 
     "Force Repaint (macOS Window Shadow)",
     "force_repaint"
@@ -36,6 +121,8 @@ CONFIG_ORDER = [
 
 
 SYSTEM_NAME_PLACEHOLDER = "system_name"
+CLEAR_CACHE_PLACEHOLDER = "layout_cache_clear"
+SCRIPT_WARNING_PLACEHOLDER = "script_warning"
 SYSTEM_PREFIX = "system_"
 
 
@@ -0,0 +1,321 @@
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal
+
+from plover import log
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from plover_svg_layout_display.layout_cache import CachedLayout, LayoutCache
+from plover_svg_layout_display.qt_utils import load_qt_bytes
+from plover_svg_layout_display.layout_script import (
+    LayoutScript, compile_key_table, load_script
+)
+from plover_svg_layout_display.script_watchdog import load_isolated_script
+from plover_svg_layout_display.svg_widget import LoadedSVG, load_layout_svg
+
+
+# (svg path, script path, scale); either path may be None
+LayoutKey = Tuple[Optional[str], Optional[str], int]
+
+# (layout cache, script budget, optimize) of a layout that is being loaded
+# in the background
+WarmSettings = Tuple[Optional[LayoutCache], Optional[float], bool]
+
+
+class LoadedLayout:
+
+    __slots__ = ["svg", "script"]
+
+    def __init__(self, svg: Optional[LoadedSVG], script: Optional[LayoutScript]) -> None:
+        self.svg = svg
+        self.script = script
+
+    def nbytes(self) -> int:
+        return self.svg.nbytes() if self.svg is not None else 0
+
+    def close(self) -> None:
+        if self.script is not None:
+            self.script.close()
+
+    def bind(self) -> None:
+        if self.svg is None or self.svg.is_invalid or self.script is None:
+            return
+
+        svg_parser = self.svg.svg_parser
+        svg_parser.report_unresolved(self.script.bind(svg_parser.group_index))
+
+
+def load_layout_script(
+    py_path: str,
+    script_budget: Optional[float] = None
+) -> Optional[LayoutScript]:
+    if script_budget is not None:
+        return load_isolated_script(py_path, script_budget)
+    return load_script(py_path)
+
+
+class PreparedLayout:
+    """The part of a layout that can be loaded on any thread: its SVG, and
+    its layout cache entry if there is one."""
+
+    __slots__ = ["svg", "cached"]
+
+    def __init__(self, svg: Optional[LoadedSVG], cached: Optional[CachedLayout]) -> None:
+        self.svg = svg
+        self.cached = cached
+
+    def nbytes(self) -> int:
+        return self.svg.nbytes() if self.svg is not None else 0
+
+
+def prepare_layout(
+    svg_path: Optional[str],
+    py_path: Optional[str],
+    scale: int,
+    layout_cache: Optional[LayoutCache],
+    optimize: bool = False
+) -> PreparedLayout:
+    if svg_path is None or not svg_path.strip():
+        layout_cache = None
+
+    cached = None
+    if layout_cache is not None:
+        cached = layout_cache.load(svg_path, py_path or "", optimize)
+
+    svg = None
+    if svg_path is not None:
+        svg = load_layout_svg(svg_path, scale, cached, optimize)
+
+    return PreparedLayout(svg, cached)
+
+
+def finish_layout(
+    prepared: PreparedLayout,
+    svg_path: Optional[str],
+    py_path: Optional[str],
+    layout_cache: Optional[LayoutCache],
+    script_budget: Optional[float] = None,
+    optimize: bool = False
+) -> LoadedLayout:
+    """Loads the script of a prepared layout, which is only done on the GUI
+    thread, and stores the layout in the cache."""
+    if svg_path is None or not svg_path.strip():
+        layout_cache = None
+
+    svg = prepared.svg
+    cached = prepared.cached
+    script = None
+    if py_path is not None:
+        if cached is not None and cached.key_rows is not None:
+            script = compile_key_table(cached.key_rows)
+        else:
+            script = load_layout_script(py_path, script_budget)
+
+    if layout_cache is not None and cached is None and not svg.is_invalid:
+        svg_parser = svg.svg_parser
+
+        # Entries are checked against the file itself, not what it was
+        # optimized into
+        svg_data = load_qt_bytes(svg_path) if optimize else svg_parser.svg_data
+        layout_cache.store(
+            svg_path,
+            py_path or "",
+            svg_data,
+            svg_parser.svg_attribs,
+            svg_parser.group_spans,
+            svg_parser.group_data,
+            script.table_rows() if script is not None else None,
+            optimize,
+            svg_parser.content_start
+        )
+
+    layout = LoadedLayout(svg, script)
+    layout.bind()
+    return layout
+
+
+def build_layout(
+    svg_path: Optional[str],
+    py_path: Optional[str],
+    scale: int,
+    layout_cache: Optional[LayoutCache],
+    script_budget: Optional[float] = None,
+    optimize: bool = False
+) -> LoadedLayout:
+    prepared = prepare_layout(svg_path, py_path, scale, layout_cache, optimize)
+    return finish_layout(
+        prepared, svg_path, py_path, layout_cache, script_budget, optimize
+    )
+
+
+class WarmTask(QRunnable):
+    """Prepares a layout on a worker thread. Its script is left to the GUI
+    thread, since running a script's module code or starting its worker
+    process is not safe to do from here."""
+
+    def __init__(
+        self,
+        key: LayoutKey,
+        generation: int,
+        layout_cache: Optional[LayoutCache],
+        optimize: bool,
+        registry: "LayoutRegistry"
+    ) -> None:
+        super().__init__()
+        self.key = key
+        self.generation = generation
+        self.layout_cache = layout_cache
+        self.optimize = optimize
+        self.registry = registry
+        self.main_thread = QCoreApplication.instance().thread()
+
+    def run(self) -> None:
+        try:
+            prepared = prepare_layout(*self.key, self.layout_cache, self.optimize)
+        except Exception:
+            # The key still has to be released on the GUI thread, or the
+            # layout would never be warmed again
+            log.error("svgld: could not warm layout %s", self.key[0], exc_info=True)
+            self.registry.warmed.emit(self.key, None, self.generation)
+            return
+
+        # The renderer was created on this worker thread, and has to be
+        # handed over before the display can draw with it
+        if prepared.svg is not None:
+            prepared.svg.element_renderer.moveToThread(self.main_thread)
+
+        self.registry.warmed.emit(self.key, prepared, self.generation)
+
+
+class LayoutRegistry(QObject):
+    """Layouts of recently used systems, kept loaded within a memory cap,
+    so that switching systems only swaps references. Clearing it starts a
+    new config generation, and layouts still being warmed with the settings
+    of an older one are thrown away when they arrive."""
+
+    warmed = pyqtSignal(object, object, int)
+    # Emitted with the key of a requested layout once it is loaded, or
+    # once loading it in the background failed
+    ready = pyqtSignal(object)
+
+    def __init__(self, max_bytes: int, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.max_bytes = max_bytes
+        self.layouts: "OrderedDict[LayoutKey, LoadedLayout]" = OrderedDict()
+        self.warming: Dict[LayoutKey, WarmSettings] = {}
+        self.generation = 0
+        self.requested: Optional[LayoutKey] = None
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.warmed.connect(self.on_warmed)
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def get(self, key: LayoutKey) -> Optional[LoadedLayout]:
+        layout = self.layouts.get(key)
+        if layout is not None:
+            self.layouts.move_to_end(key)
+        return layout
+
+    def put(self, key: LayoutKey, layout: LoadedLayout) -> None:
+        self.layouts[key] = layout
+        self.layouts.move_to_end(key)
+        self.evict()
+
+    def discard(self, key: LayoutKey) -> None:
+        layout = self.layouts.pop(key, None)
+        if layout is not None:
+            layout.close()
+
+    def clear(self) -> None:
+        for layout in self.layouts.values():
+            layout.close()
+        self.layouts.clear()
+
+        self.generation += 1
+        self.warming.clear()
+
+    def total_bytes(self) -> int:
+        return sum(layout.nbytes() for layout in self.layouts.values())
+
+    def evict(self) -> None:
+        # The most recently used layout is the one on display, so it is
+        # kept even when it is over the cap on its own
+        total = self.total_bytes()
+        while len(self.layouts) > 1 and total > self.max_bytes:
+            _, layout = self.layouts.popitem(last=False)
+            total -= layout.nbytes()
+            layout.close()
+
+    def warm(
+        self,
+        keys: Iterable[LayoutKey],
+        layout_cache: Optional[LayoutCache],
+        script_budget: Optional[float] = None,
+        optimize: bool = False
+    ) -> None:
+        for key in keys:
+            if key in self.layouts or key in self.warming:
+                continue
+
+            self.warming[key] = (layout_cache, script_budget, optimize)
+            self.thread_pool.start(WarmTask(
+                key, self.generation, layout_cache, optimize, self
+            ))
+
+    def request(
+        self,
+        key: LayoutKey,
+        layout_cache: Optional[LayoutCache],
+        script_budget: Optional[float] = None,
+        optimize: bool = False
+    ) -> bool:
+        """Loads a layout that is about to be shown in the background.
+        Returns True if it is already loaded; otherwise `ready` is emitted
+        with its key once it is."""
+        if key in self.layouts:
+            self.requested = None
+            return True
+
+        self.requested = key
+        self.warm((key,), layout_cache, script_budget, optimize)
+        return False
+
+    def on_warmed(
+        self,
+        key: LayoutKey,
+        prepared: Optional[PreparedLayout],
+        generation: int
+    ) -> None:
+        if generation != self.generation:
+            return
+
+        layout_cache, script_budget, optimize = self.warming.pop(key)
+
+        # The requested layout is going on display, so it is kept like any
+        # layout that was loaded in the foreground
+        if key == self.requested:
+            self.requested = None
+            if prepared is not None and key not in self.layouts:
+                self.put(key, finish_layout(
+                    prepared, key[0], key[1], layout_cache, script_budget, optimize
+                ))
+            self.ready.emit(key)
+            return
+
+        # Layouts loaded in the foreground in the meantime take precedence,
+        # and warmed layouts never push out ones that have been used. Their
+        # scripts are only loaded once they are known to be kept.
+        if (
+            prepared is None or key in self.layouts
+            or self.total_bytes() + prepared.nbytes() > self.max_bytes
+        ):
+            return
+
+        layout = finish_layout(
+            prepared, key[0], key[1], layout_cache, script_budget, optimize
+        )
+        self.layouts[key] = layout
+        self.layouts.move_to_end(key, last=False)
@@ -0,0 +1,218 @@
+from inspect import Parameter, signature
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from plover import log
+
+from plover_svg_layout_display.key_table import (
+    EncodedFrames, KeyTable, decode_membership, encode_frames, is_key_table, load_numpy
+)
+from plover_svg_layout_display.qt_utils import load_qt_text
+
+
+# Values for a script's module level TRANSLATION flag
+TRANSLATION_NONE = "none"
+TRANSLATION_EAGER = "eager"
+TRANSLATION_LAZY = "lazy"
+TRANSLATION_MODES = (TRANSLATION_NONE, TRANSLATION_EAGER, TRANSLATION_LAZY)
+
+
+def no_translation() -> str:
+    return ""
+
+
+class AnimatedIds(list):
+    """Group IDs returned by a script, along with the fade out time in
+    milliseconds it asked for on some of them."""
+
+    __slots__ = ["fades"]
+
+    def __init__(self, group_ids=(), fades: Optional[Dict[str, float]] = None) -> None:
+        super().__init__(group_ids)
+        self.fades = fades or {}
+
+
+def split_result(result) -> List[str]:
+    # Scripts may return `(group_ids, {group_id: fade_ms})` instead of a
+    # plain list of IDs
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], dict):
+        group_ids, fades = result
+        return AnimatedIds(group_ids, {
+            str(group_id): float(fade_ms) for group_id, fade_ms in fades.items()
+        })
+
+    return result
+
+
+class LazyTranslation:
+    """Passed to lazy scripts in place of the translation; calling it looks
+    the translation up the first time and returns the same string after."""
+
+    __slots__ = ["get_translation", "translation"]
+
+    def __init__(self, get_translation: Callable[[], str]) -> None:
+        self.get_translation = get_translation
+        self.translation: Optional[str] = None
+
+    def __call__(self) -> str:
+        if self.translation is None:
+            self.translation = self.get_translation()
+        return self.translation
+
+
+def positional_count(function: Callable) -> Optional[int]:
+    try:
+        parameters = signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    count = 0
+    for parameter in parameters:
+        if parameter.kind == Parameter.VAR_POSITIONAL:
+            return None
+        if parameter.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+            count += 1
+
+    return count
+
+
+def detect_translation_mode(convert_stroke: Callable, flag: object) -> str:
+    if flag in TRANSLATION_MODES:
+        return flag
+
+    try:
+        parameters = list(signature(convert_stroke).parameters.values())
+    except (TypeError, ValueError):
+        return TRANSLATION_EAGER
+
+    # A script whose second parameter is missing or named like an unused
+    # variable (such as "_") never reads the translation
+    if len(parameters) < 2 or parameters[1].name.startswith("_"):
+        return TRANSLATION_NONE
+
+    return TRANSLATION_EAGER
+
+
+class LayoutScript:
+
+    def __init__(
+        self,
+        convert_stroke: Callable,
+        translation_mode: str = TRANSLATION_EAGER
+    ) -> None:
+        self.convert_stroke = convert_stroke
+        self.translation_mode = translation_mode
+        self.key_rows: Optional[List[List[str]]] = None
+        self.key_table: Optional[KeyTable] = None
+        self.batch_convert: Optional[Callable] = None
+        self.batch_groups: Optional[List[str]] = None
+        self.takes_translation = positional_count(convert_stroke) != 1
+
+    def convert(
+        self,
+        stroke: Tuple[str, ...],
+        get_translation: Callable[[], str]
+    ) -> List[str]:
+        if self.translation_mode == TRANSLATION_NONE:
+            if self.takes_translation:
+                return split_result(self.convert_stroke(stroke, ""))
+            return split_result(self.convert_stroke(stroke))
+
+        if self.translation_mode == TRANSLATION_LAZY:
+            return split_result(
+                self.convert_stroke(stroke, LazyTranslation(get_translation))
+            )
+
+        return split_result(self.convert_stroke(stroke, get_translation()))
+
+    def convert_strokes(self, strokes: Sequence[Tuple[str, ...]]) -> EncodedFrames:
+        """Converts many strokes at once, without translations. Returns the
+        distinct frames, and the index of each stroke's frame among them."""
+        strokes = list(strokes)
+        if self.batch_convert is not None:
+            if self.batch_groups is None:
+                return encode_frames(self.batch_convert(strokes))
+
+            if load_numpy() is not None:
+                return decode_membership(
+                    self.batch_convert(self.key_table.key_matrix(strokes)),
+                    self.batch_groups
+                )
+
+        if self.key_table is not None:
+            return self.key_table.convert_strokes(strokes)
+
+        return encode_frames(
+            self.convert(stroke, no_translation) for stroke in strokes
+        )
+
+    def table_rows(self) -> Optional[List[List[str]]]:
+        """The KEYS rows of a script that converts single strokes by looking
+        them up in a table, so that it can be rebuilt from the rows alone;
+        None when the script has code of its own. A batched form does not
+        change what the table draws, so it is left out of the rows."""
+        return self.key_rows
+
+    def bind(self, group_index: Dict[str, int]) -> Set[str]:
+        # Only static tables can be checked against the layout up front;
+        # anything else is resolved as it comes in
+        if self.key_table is None:
+            return set()
+        return self.key_table.bind(group_index)
+
+    def close(self) -> None:
+        pass
+
+
+def compile_key_table(keys: Sequence[Sequence[Optional[str]]]) -> LayoutScript:
+    key_table = KeyTable(keys)
+    layout_script = LayoutScript(key_table.convert_stroke, TRANSLATION_NONE)
+    layout_script.key_table = key_table
+    layout_script.key_rows = [list(row) for row in keys]
+    return layout_script
+
+
+def compile_script(py_text: str) -> Optional[LayoutScript]:
+    globs = {}
+    exec(py_text, globs)
+
+    convert_stroke = globs.get("convert_stroke")
+    convert_strokes = globs.get("convert_strokes")
+    keys = globs.get("KEYS")
+
+    # Scripts that only declare a KEYS table get it compiled into a lookup
+    # table instead of running Python for every key
+    if convert_stroke is None and is_key_table(keys):
+        layout_script = compile_key_table(keys)
+
+        # Batched table scripts work on key matrices, and need to name the
+        # columns of the group matrices they return
+        groups = globs.get("GROUPS")
+        if callable(convert_strokes) and isinstance(groups, (list, tuple)):
+            layout_script.batch_convert = convert_strokes
+            layout_script.batch_groups = list(groups)
+
+        return layout_script
+
+    if not callable(convert_stroke):
+        return None
+
+    layout_script = LayoutScript(
+        convert_stroke,
+        detect_translation_mode(convert_stroke, globs.get("TRANSLATION"))
+    )
+    if callable(convert_strokes):
+        layout_script.batch_convert = convert_strokes
+
+    return layout_script
+
+
+def load_script(py_path: str) -> Optional[LayoutScript]:
+    py_text = load_qt_text(py_path)
+    if not py_text.strip():
+        return None
+
+    try:
+        return compile_script(py_text)
+    except Exception:
+        log.error("svgld: layout script failed to load: %s", py_path, exc_info=True)
+        return None
@@ -1,26 +1,45 @@
-from typing import Any, Callable, Tuple, Union
+import os
 
-from plover import system
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from plover import log, system
 from plover.engine import StenoEngine
-from plover.oslayer.config import PLUGINS_PLATFORM
+from plover.oslayer.config import CONFIG_DIR, PLUGINS_PLATFORM
 from plover.gui_qt.tool import Tool
 from plover.steno import Stroke
 
-from PyQt5.QtWidgets import QAction, QHBoxLayout, QGraphicsView
-from PyQt5.QtGui import QKeySequence, QMouseEvent, QColor
-from PyQt5.QtCore import Qt, QRect, QSettings
+from PyQt5.QtWidgets import QAction, QVBoxLayout, QGraphicsView, QFileDialog, QLabel, QMessageBox
+from PyQt5.QtGui import QKeySequence, QMouseEvent, QPixmap
+from PyQt5.QtCore import Qt, QPoint, QRect, QSettings, QSize, QTimer
 
 from plover_svg_layout_display.resources_rc import *
-from plover_svg_layout_display.config_ui import ConfigUI
 from plover_svg_layout_display.layout_config import CONFIG_ITEMS, CONFIG_TYPES, SYSTEM_PREFIX, LayoutConfig
 from plover_svg_layout_display.svg_widget import LayoutWidget
-from plover_svg_layout_display.qt_utils import load_qt_text
+from plover_svg_layout_display.frame_prefetcher import FramePrefetcher
+from plover_svg_layout_display.frame_scheduler import FrameScheduler
+from plover_svg_layout_display.group_animation import animation_clock
+from plover_svg_layout_display.layout_script import LayoutScript
+from plover_svg_layout_display.layout_view import LayoutView, parse_view_scales
+from plover_svg_layout_display.layout_cache import LayoutCache
+from plover_svg_layout_display.layout_registry import (
+    LayoutKey, LayoutRegistry, build_layout, load_layout_script
+)
+from plover_svg_layout_display.layout_watcher import LayoutWatcher
+from plover_svg_layout_display.script_watchdog import ScriptStats, ScriptTimeout
+from plover_svg_layout_display.stage_timings import STAGES, StageTimings
+from plover_svg_layout_display.stats_overlay import StatsOverlay
+from plover_svg_layout_display.stroke_ribbon import StrokeRibbon
+from plover_svg_layout_display.qt_utils import load_qt_bytes
 
 
 STYLESHEET = "border:0px; background:transparent;"
 DEFAULT_SVG = ":/svgld/en_layout.svg"
 DEFAULT_SCALE = 100
 DEFAULT_PY = ":/svgld/en_convert.py"
+DEFAULT_SYSTEM = "English Stenotype"
+CACHE_DIR = os.path.join(CONFIG_DIR, "svgld_cache")
+PLACEHOLDER_PATH = os.path.join(CACHE_DIR, "last_frame.png")
 
 
 class SVGLayoutDisplayTool(Tool):
@@ -33,19 +52,43 @@ class SVGLayoutDisplayTool(Tool):
         self.setObjectName("svgld")
         engine.signal_connect("stroked", self.on_stroke)
         engine.signal_connect("config_changed", self.on_config_changed)
+        engine.signal_connect("dictionaries_loaded", self.on_dictionaries_loaded)
 
         self.system_name = system.NAME
-        self.repaint_offset = False
-        self.convert_stroke = None
+        self.window_size = None
+        self.layout_script: LayoutScript = None
+        self.script_stats = ScriptStats()
+        self.layout_cache: Optional[LayoutCache] = None
+        self.layout_registry = LayoutRegistry(0, self)
+        self.layout_registry.ready.connect(self.on_layout_ready)
+        self.requested_key: Optional[LayoutKey] = None
+        self.layout_key: Optional[LayoutKey] = None
+        self.layout_watcher = LayoutWatcher(self)
+        self.layout_watcher.file_changed.connect(self.on_layout_file_changed)
+        self.last_stroke: Tuple[str, ...] = tuple()
+        self.timings = None
+        self.frame_scheduler = FrameScheduler(self.render_stroke, self)
+        self.frame_prefetcher = FramePrefetcher(self)
+        self.frame_prefetcher.set_dictionaries(getattr(engine, "dictionaries", None))
+        self.views: List[LayoutView] = []
+        self.view_positions: List[QPoint] = []
+        self.started = False
 
         self.config = LayoutConfig()
         self.restore_state()
         self.setup_actions()
         self.setup_trans()
         self.setup_layout()
-        self.reload_config()
 
+        # The layout is loaded in the background once the window is up, so
+        # that opening the display never waits on parsing the layout or
+        # running its script
+        QTimer.singleShot(0, self.start_display)
+
+        self.finished.connect(self.save_placeholder)
         self.finished.connect(self.save_state)
+        self.finished.connect(self.close_views)
+        self.finished.connect(self.layout_registry.clear)
 
     def _restore_state(self, settings: QSettings) -> None:
         # Cross system settings
@@ -80,6 +123,15 @@ class SVGLayoutDisplayTool(Tool):
                     type=CONFIG_TYPES[sys_field]
                 )
 
+        if settings.contains("view_positions"):
+            self.view_positions = []
+            for position in settings.value("view_positions", type=str).split(";"):
+                try:
+                    x, y = position.split(",")
+                    self.view_positions.append(QPoint(int(x), int(y)))
+                except ValueError:
+                    continue
+
     def _save_state(self, settings: QSettings) -> None:
         for key, value in self.config.get_values():
             settings.setValue(key, value)
@@ -87,6 +139,12 @@ class SVGLayoutDisplayTool(Tool):
         for sys_name, sys_map in self.config.system_map.items():
             for key, value in sys_map.items():
                 settings.setValue(sys_name + "/" + key, value)
+
+        self.store_view_positions()
+        settings.setValue("view_positions", ";".join(
+            "{},{}".format(position.x(), position.y())
+            for position in self.view_positions
+        ))
     
     def view_mouse_move(self, event: QMouseEvent) -> None:
         if event.buttons() & Qt.LeftButton:
@@ -108,6 +166,19 @@ class SVGLayoutDisplayTool(Tool):
         self.settings_action.triggered.connect(self.on_settings)
         self.settings_action.setShortcut(QKeySequence("Ctrl+S"))
         self.addAction(self.settings_action)
+
+        self.dump_timings_action = QAction(self)
+        self.dump_timings_action.setText("Dump Timings")
+        self.dump_timings_action.triggered.connect(self.on_dump_timings)
+        self.dump_timings_action.setShortcut(QKeySequence("Ctrl+T"))
+        self.dump_timings_action.setEnabled(False)
+        self.addAction(self.dump_timings_action)
+
+        self.memory_report_action = QAction(self)
+        self.memory_report_action.setText("Memory Report")
+        self.memory_report_action.triggered.connect(self.on_memory_report)
+        self.memory_report_action.setShortcut(QKeySequence("Ctrl+M"))
+        self.addAction(self.memory_report_action)
     
     def on_stroke(self, stroke: Union[Stroke, Tuple[str, ...]]) -> None:
         if isinstance(stroke, Stroke):
@@ -115,17 +186,238 @@ class SVGLayoutDisplayTool(Tool):
         else:
             stroke_tup = stroke
 
-        if self.convert_stroke is not None:
-            prev_translations = self._engine.translator_state.prev()
-            if not prev_translations:
-                output = ""
-            else:
-                output = prev_translations[-1].english
+        self.frame_prefetcher.record(stroke_tup)
+        self.frame_scheduler.submit(stroke_tup)
+
+    def on_dictionaries_loaded(self, dictionaries: Any) -> None:
+        self.frame_prefetcher.set_dictionaries(dictionaries)
+
+    def get_translation(self) -> str:
+        prev_translations = self._engine.translator_state.prev()
+        if not prev_translations:
+            return ""
+
+        return prev_translations[-1].english
 
-            group_ids = self.convert_stroke(stroke_tup, output)
-            self.svg_widget.update_groups(group_ids)
+    def script_budget(self) -> Optional[float]:
+        if not self.config.script_isolation:
+            return None
+        return self.config.script_budget / 1000
 
+    def run_script(self, stroke_tup: Tuple[str, ...]) -> Optional[List[str]]:
+        stats = self.script_stats
+        start = perf_counter()
+        try:
+            group_ids = self.layout_script.convert(stroke_tup, self.get_translation)
+        except ScriptTimeout:
+            stats.record_timeout()
+            if stats.timeouts == 1:
+                log.warning("svgld: layout script went over its time budget")
+            return None
+        except Exception:
+            stats.record_error()
+            if stats.errors == 1:
+                log.error("svgld: layout script failed", exc_info=True)
+            return None
+
+        elapsed = perf_counter() - start
+        stats.record(elapsed, self.config.script_budget / 1000)
+        if self.timings is not None:
+            self.timings.record("script", elapsed)
+
+        return group_ids
+
+    def render_stroke(self, stroke_tup: Tuple[str, ...]) -> None:
+        timings = self.timings
+        self.last_stroke = stroke_tup
+
+        if self.layout_script is not None:
+            # The script runs once for all views; strokes it fails on keep
+            # showing the last good frame
+            group_ids = self.run_script(stroke_tup)
+            for widget in self.layout_widgets():
+                if group_ids is None:
+                    widget.changed = False
+                else:
+                    widget.update_groups(group_ids, getattr(group_ids, "fades", None))
+
+            if group_ids is not None and stroke_tup:
+                self.push_history()
+
+        if timings is None:
+            self.repaint_windows()
+        else:
+            start = perf_counter()
+            self.repaint_windows()
+            timings.record("window", perf_counter() - start)
+
+    def push_history(self) -> None:
+        ribbon = self.stroke_ribbon
+        widget = self.svg_widget
+        if ribbon.strip is None or widget.svg_size is None or widget.is_invalid:
+            return
+
+        # The widget keeps every frame while the strip is on, so the image
+        # it was just drawn from is reused as is
+        if widget.frame is not None:
+            ribbon.push(widget.frame, self.get_translation())
+
+    def repaint_windows(self) -> None:
         self.repaint()
+        for view in self.views:
+            view.repaint_window(self.config.force_repaint)
+
+    def layout_widgets(self) -> List[LayoutWidget]:
+        return [self.svg_widget] + [view.svg_widget for view in self.views]
+
+    def set_timings_enabled(self, enabled: bool) -> None:
+        if enabled and self.timings is None:
+            self.timings = StageTimings()
+        elif not enabled:
+            self.timings = None
+
+        for widget in self.layout_widgets():
+            widget.timings = self.timings
+        self.dump_timings_action.setEnabled(enabled)
+        self.stats_overlay.set_enabled(enabled)
+
+    def stats_lines(self) -> List[str]:
+        if self.timings is None:
+            return []
+
+        lines = ["{:<9}{:>7}{:>7}{:>7}".format("ms", "last", "p95", "max")]
+        for stage in STAGES:
+            lines.append("{:<9}{:>7.2f}{:>7.2f}{:>7.2f}".format(
+                stage, *self.timings.summary(stage)
+            ))
+
+        frame_cache = self.svg_widget.frame_cache
+        if frame_cache.enabled():
+            lines.append("cache {:.0%} of {} ({} frames)".format(
+                frame_cache.hit_rate(),
+                frame_cache.hits + frame_cache.misses,
+                len(frame_cache)
+            ))
+
+        prefetcher = self.frame_prefetcher
+        if prefetcher.count > 0:
+            lines.append("prefetch {} used {} cpu {:.0f} ms".format(
+                prefetcher.prefetched,
+                frame_cache.prefetch_hits,
+                prefetcher.cpu_time * 1000
+            ))
+
+        loaded = self.svg_widget.loaded
+        if loaded is not None:
+            for report in loaded.atlas_reports():
+                lines.append("atlas {}x{} @{:g}x {:.1f} MB {:.0%} full".format(
+                    report["width"], report["height"], report["dpr"],
+                    report["bytes"] / (1024 * 1024), report["fill"]
+                ))
+
+        if self.stroke_ribbon.strip is not None:
+            lines.append("history {} strokes {:.1f} MB".format(
+                self.stroke_ribbon.length,
+                self.stroke_ribbon.nbytes() / (1024 * 1024)
+            ))
+
+        if self.views:
+            lines.append("views {} own {:.1f} MB".format(
+                len(self.views),
+                sum(
+                    view.svg_widget.loaded.nbytes() for view in self.views
+                    if view.svg_widget.loaded is not None
+                    and view.svg_widget.loaded.base is not None
+                ) / (1024 * 1024)
+            ))
+
+        script_stats = self.script_stats
+        if script_stats.slow or script_stats.timeouts or script_stats.errors:
+            lines.append("script slow {} timeouts {} errors {}".format(
+                script_stats.slow, script_stats.timeouts, script_stats.errors
+            ))
+
+        scheduler = self.frame_scheduler
+        lines.append("strokes {} drawn {} coalesced {}".format(
+            scheduler.received, scheduler.rendered, scheduler.coalesced
+        ))
+
+        clock = animation_clock()
+        if clock.ticks:
+            lines.append("animation {} frames {} skipped".format(
+                clock.ticks, clock.skipped
+            ))
+        return lines
+
+    def on_dump_timings(self) -> None:
+        if self.timings is None:
+            return
+
+        path = QFileDialog.getSaveFileName(
+            self, "Save Timings", "svgld_timings.json", "JSON (*.json)"
+        )[0]
+        if not path:
+            return
+
+        frame_cache = self.svg_widget.frame_cache
+        scheduler = self.frame_scheduler
+        loaded = self.svg_widget.loaded
+        self.timings.dump(path, {
+            "atlases": loaded.atlas_reports() if loaded is not None else [],
+            "frame_cache": {
+                "hits": frame_cache.hits,
+                "misses": frame_cache.misses,
+                "entries": len(frame_cache),
+                "bytes": frame_cache.total_bytes
+            },
+            "prefetch": {
+                "batches": self.frame_prefetcher.batches,
+                "prefetched": self.frame_prefetcher.prefetched,
+                "hits": frame_cache.prefetch_hits,
+                "cpu_ms": self.frame_prefetcher.cpu_time * 1000
+            },
+            "script": {
+                "calls": self.script_stats.calls,
+                "slow": self.script_stats.slow,
+                "timeouts": self.script_stats.timeouts,
+                "errors": self.script_stats.errors
+            },
+            "scheduler": {
+                "received": scheduler.received,
+                "rendered": scheduler.rendered,
+                "coalesced": scheduler.coalesced
+            },
+            "animation": {
+                "frames": animation_clock().ticks,
+                "skipped": animation_clock().skipped
+            },
+            "memory": self.memory_report()
+        })
+
+    def memory_report(self) -> Dict[str, int]:
+        report = {}
+        loaded = self.svg_widget.loaded
+        if loaded is not None:
+            report.update(loaded.memory_report())
+
+        # Views derived from the current layout are already counted by it
+        report["other layouts"] = max(
+            0, self.layout_registry.total_bytes()
+            - (loaded.nbytes() if loaded is not None else 0)
+        )
+        report["stroke history"] = self.stroke_ribbon.nbytes()
+        return report
+
+    def on_memory_report(self) -> None:
+        report = self.memory_report()
+        lines = [
+            "{}: {:.2f} MB".format(name, size / (1024 * 1024))
+            for name, size in report.items()
+        ]
+        lines.append("total: {:.2f} MB".format(sum(report.values()) / (1024 * 1024)))
+
+        log.info("svgld: memory report\n%s", "\n".join(lines))
+        QMessageBox.information(self, "Memory Report", "\n".join(lines))
 
     def setup_trans(self) -> None:
         # For some strange reason, even though this piece of code doesn't
@@ -140,17 +432,91 @@ class SVGLayoutDisplayTool(Tool):
         self.setStyleSheet("QWidget#svgld {background:transparent;}")
 
         self.svg_widget = LayoutWidget()
+        self.placeholder = QLabel()
+        self.placeholder.setStyleSheet(STYLESHEET)
+
+        self.stroke_ribbon = StrokeRibbon()
 
-        self.layout = QHBoxLayout()
+        self.layout = QVBoxLayout()
         self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.addWidget(self.svg_widget)
+        self.layout.setSpacing(0)
+        self.layout.addWidget(self.svg_widget, 0, Qt.AlignLeft)
+        self.layout.addWidget(self.placeholder, 0, Qt.AlignLeft)
+        self.layout.addWidget(self.stroke_ribbon, 0, Qt.AlignLeft)
         self.setLayout(self.layout)
+        self.show_placeholder()
+
+        self.stats_overlay = StatsOverlay(self.stats_lines, self)
 
         self.mouseMoveEvent = self.view_mouse_move
         self.mousePressEvent = self.view_mouse_press
 
         self.show()
 
+    def store_view_positions(self) -> None:
+        for index, view in enumerate(self.views):
+            if index < len(self.view_positions):
+                self.view_positions[index] = view.pos()
+            else:
+                self.view_positions.append(view.pos())
+
+    def close_views(self) -> None:
+        self.store_view_positions()
+        for view in self.views:
+            view.svg_widget.clear_fades()
+            view.close()
+            view.deleteLater()
+        self.views = []
+
+    def setup_views(self) -> None:
+        scales = parse_view_scales(self.config.extra_views)
+        if scales == [view.scale for view in self.views]:
+            return
+
+        self.close_views()
+        for index, scale in enumerate(scales):
+            view = LayoutView(scale, self)
+            if index < len(self.view_positions):
+                view.move(self.view_positions[index])
+            self.views.append(view)
+            view.show()
+
+    def show_placeholder(self) -> None:
+        # The last frame of the previous session stands in for the layout
+        # until it is loaded
+        pixmap = QPixmap(PLACEHOLDER_PATH) if self.config.layout_cache else QPixmap()
+        if pixmap.isNull():
+            self.placeholder.hide()
+            return
+
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self.placeholder.setPixmap(pixmap)
+        self.placeholder.setFixedSize(pixmap.size() / pixmap.devicePixelRatio())
+        self.svg_widget.hide()
+
+    def save_placeholder(self) -> None:
+        if not self.config.layout_cache or self.svg_widget.svg_size is None:
+            return
+
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            self.svg_widget.grab().save(PLACEHOLDER_PATH, "PNG")
+        except OSError:
+            pass
+
+    def start_display(self) -> None:
+        if not self.started:
+            self.reload_config(background=True)
+
+    def on_layout_ready(self, key: LayoutKey) -> None:
+        if key != self.requested_key:
+            return
+
+        # If loading failed in the background, it is done again here so
+        # that its errors are reported as usual
+        self.requested_key = None
+        self.show_layout()
+
     def on_config_changed(self, config: dict) -> None:
         if "system_name" not in config:
             return
@@ -159,67 +525,247 @@ class SVGLayoutDisplayTool(Tool):
         if new_sys_name == self.system_name:
             return
  
-        self.reload_config()
+        self.system_name = new_sys_name
+        if self.started:
+            self.reload_config()
     
     def on_settings(self) -> None:
-        config_dialog = ConfigUI(self.config.copy(), self.system_name, self)
+        # The settings dialog is only needed once it is opened
+        from plover_svg_layout_display.config_ui import ConfigUI
+
+        config_dialog = ConfigUI(
+            self.config.copy(), self.system_name, self, self.layout_cache,
+            self.script_stats.warning()
+        )
         if config_dialog.exec():
+            # Layout paths or scales may have changed underneath the
+            # preloaded layouts, so they are all loaded again
             self.config = config_dialog.temp_config
+            self.layout_registry.clear()
             self.reload_config()
-    
-    def load_py_script(self, py_path: str) -> None:
-        py_text = load_qt_text(py_path)
 
-        if not py_text.strip():
-            self.convert_stroke = None
+    def load_layout(
+        self, 
+        svg_path: Optional[str], 
+        py_path: Optional[str], 
+        scale: int
+    ) -> None:
+        key = (svg_path, py_path, scale)
+        layout = self.layout_registry.get(key)
+        if layout is None:
+            layout = build_layout(
+                svg_path, py_path, scale, self.layout_cache,
+                self.script_budget(), self.config.optimize_svg
+            )
+            self.layout_registry.put(key, layout)
+
+        if layout.svg is not None:
+            self.svg_widget.set_layout(layout.svg)
+            for view in self.views:
+                view.set_layout(layout.svg)
+            self.setup_history()
+
+        if py_path is not None:
+            self.layout_script = layout.script
+            self.script_stats = ScriptStats()
+
+        self.frame_prefetcher.set_layout(
+            self.svg_widget.loaded, self.layout_script,
+            self.svg_widget.devicePixelRatioF()
+        )
+
+    def on_layout_file_changed(self, path: str) -> None:
+        if self.layout_key is None:
             return
 
-        try:
-            globs = {}
-            exec(py_text, globs)
-
-            convert_stroke = globs.get("convert_stroke")
-            if not isinstance(convert_stroke, Callable):
-                self.convert_stroke = None
-            
-            self.convert_stroke = convert_stroke
-
-        except:
-            self.convert_stroke = None
-
-    def reload_config(self) -> None:
-        if self.system_name in self.config.system_map:
-            sys_config = self.config.system_map[self.system_name]
-            if "system_svg" in sys_config:
-                svg_path = sys_config["system_svg"]
-                self.svg_widget.load_svg(
-                    svg_path, 
-                    sys_config.get("system_scale", 100)
-                )
+        svg_path, py_path, scale = self.layout_key
+        start = perf_counter()
 
-            if "system_py" in sys_config:
-                py_path = sys_config["system_py"]
-                self.load_py_script(py_path)
-                
-        elif self.system_name == "English Stenotype":
-            self.svg_widget.load_svg(DEFAULT_SVG, DEFAULT_SCALE)
-            self.load_py_script(DEFAULT_PY)
+        if path == py_path:
+            self.reload_script()
+
+        if path == svg_path:
+            self.reload_svg()
+
+        log.info("svgld: reloaded %s in %.1f ms", path, (perf_counter() - start) * 1000)
+
+    def reload_svg(self) -> None:
+        svg_path, py_path, scale = self.layout_key
+
+        # Only the groups that were edited are thrown away; anything else,
+        # such as a change to the root element, reloads the whole layout
+        loaded = self.svg_widget.loaded
+        patched = None
+        if loaded is not None and not loaded.is_invalid:
+            patched = loaded.svg_parser.patch(load_qt_bytes(svg_path))
+
+        if patched is None:
+            self.layout_registry.discard(self.layout_key)
+            self.load_layout(svg_path, py_path, scale)
+            self.frame_scheduler.submit(self.last_stroke)
+            return
+
+        layout = self.layout_registry.get(self.layout_key)
+        if layout is not None:
+            layout.bind()
+        self.svg_widget.patch_layout(*patched)
+        for view in self.views:
+            view.svg_widget.refresh_groups()
+        self.frame_scheduler.submit(self.last_stroke)
+
+    def reload_script(self) -> None:
+        layout = self.layout_registry.get(self.layout_key)
+        if layout is None:
+            return
+
+        old_script = layout.script
+        layout.script = load_layout_script(self.layout_key[1], self.script_budget())
+        if old_script is not None:
+            old_script.close()
+        layout.bind()
+
+        self.layout_script = layout.script
+        self.script_stats = ScriptStats()
+        self.frame_prefetcher.set_layout(
+            self.svg_widget.loaded, self.layout_script,
+            self.svg_widget.devicePixelRatioF()
+        )
+        self.frame_scheduler.submit(self.last_stroke)
+
+    def system_layout(self, system_name: str) -> Optional[LayoutKey]:
+        if system_name in self.config.system_map:
+            sys_config = self.config.system_map[system_name]
+            return (
+                sys_config.get("system_svg"), 
+                sys_config.get("system_py"), 
+                sys_config.get("system_scale", 100)
+            )
+
+        if system_name == DEFAULT_SYSTEM:
+            return (DEFAULT_SVG, DEFAULT_PY, DEFAULT_SCALE)
+
+        return None
+
+    def warm_layouts(self) -> None:
+        system_names = set(self.config.system_map)
+        system_names.add(DEFAULT_SYSTEM)
+        system_names.discard(self.system_name)
+
+        keys = []
+        for system_name in sorted(system_names):
+            key = self.system_layout(system_name)
+            if key is not None and key[0] is not None:
+                keys.append(key)
+
+        self.layout_registry.warm(
+            keys, self.layout_cache, self.script_budget(), self.config.optimize_svg
+        )
+
+    def reload_config(self, background: bool = False) -> None:
+        self.started = True
+        self.window_size = None
+        self.setup_views()
+        self.frame_scheduler.set_max_fps(self.config.max_fps)
+        animation_clock().set_max_fps(self.config.max_fps)
+        self.frame_prefetcher.set_count(self.config.prefetch_frames)
+        self.set_timings_enabled(self.config.show_timings)
+        for widget in self.layout_widgets():
+            widget.set_render_mode(self.config.render_mode)
+            widget.set_frame_cache_limits(
+                self.config.frame_cache_entries,
+                self.config.frame_cache_memory * 1024 * 1024
+            )
+        self.layout_registry.set_max_bytes(
+            self.config.layout_registry_memory * 1024 * 1024
+        )
+
+        if self.config.layout_cache:
+            self.layout_cache = LayoutCache(
+                CACHE_DIR, self.config.layout_cache_size * 1024 * 1024
+            )
+        else:
+            self.layout_cache = None
+
+        layout_key = self.system_layout(self.system_name)
+        self.layout_key = layout_key
+        self.requested_key = None
+        self.layout_registry.requested = None
+        if (
+            background and layout_key is not None
+            and not self.layout_registry.request(
+                layout_key, self.layout_cache,
+                self.script_budget(), self.config.optimize_svg
+            )
+        ):
+            # The placeholder stays up until the layout is ready
+            self.requested_key = layout_key
+            return
+
+        self.show_layout()
+
+    def show_layout(self) -> None:
+        layout_key = self.layout_key
+        if layout_key is not None:
+            self.load_layout(*layout_key)
+        self.placeholder.hide()
+        self.svg_widget.show()
+
+        if self.config.hot_reload and layout_key is not None:
+            self.layout_watcher.watch(layout_key[:2])
+        else:
+            self.layout_watcher.watch(())
         
         self.on_stroke(tuple())
+        self.warm_layouts()
+
+    def setup_history(self) -> None:
+        svg_size = self.svg_widget.svg_size
+        self.svg_widget.keep_frames = svg_size is not None and self.config.history_strokes > 0
+        if not self.svg_widget.keep_frames:
+            self.stroke_ribbon.configure(0, QSize())
+            return
+
+        frame_size = QSize(svg_size)
+        frame_size.scale(
+            max(1, svg_size.width() * self.config.history_scale // 100),
+            max(1, svg_size.height() * self.config.history_scale // 100),
+            Qt.KeepAspectRatio
+        )
+        self.stroke_ribbon.configure(self.config.history_strokes, frame_size)
+
+    def display_size(self) -> Optional[QSize]:
+        svg_size = self.svg_widget.svg_size
+        if svg_size is None:
+            return None
+
+        strip_size = self.stroke_ribbon.strip_size()
+        if strip_size.isEmpty():
+            return QSize(svg_size)
+
+        return QSize(
+            max(svg_size.width(), strip_size.width()),
+            svg_size.height() + strip_size.height()
+        )
 
     def repaint_rect(self) -> QRect:
-        window_rect = self.rect()
-        if self.repaint_offset:
-            window_rect.setWidth(window_rect.width() - 1)
-        
-        return window_rect
+        return self.rect()
 
     def repaint(self) -> None:
-        self.repaint_offset = not self.repaint_offset
-        svg_size = self.svg_widget.svg_size
+        display_size = self.display_size()
+        if display_size is None:
+            return
+
+        # Geometry only changes when a layout is (re)loaded, so strokes
+        # skip the relayout unless the display size actually changed
+        if display_size != self.window_size:
+            self.window_size = display_size
+            self.layout.setContentsMargins(0, 0, 0, 0)
+            self.setFixedSize(display_size)
+            return
 
-        if svg_size is not None:
-            right_margin_px = 1 * self.config.force_repaint * self.repaint_offset
-            self.layout.setContentsMargins(0, 0, right_margin_px, 0)
-            self.setFixedWidth(svg_size.width() + right_margin_px)
-            self.setFixedHeight(svg_size.height())
+        # macOS only redraws the translucent parts of the window, and its
+        # shadow, for areas that are flushed, so strokes that changed what
+        # is drawn repaint the whole window at once. Resizing the window
+        # is left to layout changes.
+        if self.config.force_repaint and self.svg_widget.changed:
+            super().repaint()
@@ -0,0 +1,84 @@
+from PyQt5.QtWidgets import QGraphicsView, QHBoxLayout, QWidget
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtCore import Qt, QPoint, QSize
+
+from typing import List, Optional
+
+from plover_svg_layout_display.svg_widget import LayoutWidget, LoadedSVG
+
+
+STYLESHEET = "border:0px; background:transparent;"
+
+MIN_VIEW_SCALE = 5
+MAX_VIEW_SCALE = 10000
+
+
+def parse_view_scales(text: str) -> List[int]:
+    scales = []
+    for part in text.replace(";", ",").split(","):
+        part = part.strip().rstrip("%").strip()
+        if not part:
+            continue
+
+        try:
+            scale = int(part)
+        except ValueError:
+            continue
+
+        if MIN_VIEW_SCALE <= scale <= MAX_VIEW_SCALE:
+            scales.append(scale)
+
+    return scales
+
+
+class LayoutView(QWidget):
+    """An extra display window, showing the same layout as the tool at its
+    own scale. Views are handed the group IDs of each stroke by the tool,
+    so the layout script runs once no matter how many views are open."""
+
+    def __init__(self, scale: int, parent: QWidget = None) -> None:
+        super().__init__(
+            parent,
+            Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
+        )
+        self.setObjectName("svgld_view")
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setStyleSheet("QWidget#svgld_view {background:transparent;}")
+
+        self.scale = scale
+        self.window_size: Optional[QSize] = None
+        self.drag_position = QPoint()
+
+        # See SVGLayoutDisplayTool.setup_trans
+        self.trans_view = QGraphicsView(self)
+        self.trans_view.setStyleSheet(STYLESHEET)
+
+        self.svg_widget = LayoutWidget()
+        self.layout = QHBoxLayout()
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.addWidget(self.svg_widget)
+        self.setLayout(self.layout)
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if event.buttons() & Qt.LeftButton:
+            self.move(event.globalPos() - self.drag_position)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.buttons() & Qt.LeftButton:
+            self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
+
+    def set_layout(self, loaded: LoadedSVG) -> None:
+        self.svg_widget.set_layout(loaded.derive(self.scale))
+
+    def repaint_window(self, force_repaint: bool) -> None:
+        svg_size = self.svg_widget.svg_size
+        if svg_size is None:
+            return
+
+        if svg_size != self.window_size:
+            self.window_size = QSize(svg_size)
+            self.setFixedSize(svg_size)
+            return
+
+        if force_repaint and self.svg_widget.changed:
+            self.repaint()
@@ -0,0 +1,71 @@
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+import os
+
+from typing import Iterable, Set
+
+
+# Editors tend to save in several steps (or several times in a row), so
+# changes are only reported once a file has been quiet for this long
+DEBOUNCE_MS = 150
+
+
+class LayoutWatcher(QObject):
+    """Watches the files of the layout on display, and reports each changed
+    file once after a burst of saves."""
+
+    file_changed = pyqtSignal(str)
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.paths: Set[str] = set()
+        self.pending: Set[str] = set()
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_file_changed)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DEBOUNCE_MS)
+        self.timer.timeout.connect(self.flush)
+
+    def watch(self, paths: Iterable[str]) -> None:
+        # Built-in layouts live in Qt resources, and never change
+        paths = {
+            path for path in paths
+            if path and path.strip() and not path.startswith(":")
+        }
+        if paths == self.paths:
+            return
+
+        watched = self.watcher.files()
+        if watched:
+            self.watcher.removePaths(watched)
+
+        self.paths = paths
+        self.pending.clear()
+        self.timer.stop()
+        for path in paths:
+            if os.path.exists(path):
+                self.watcher.addPath(path)
+
+    def on_file_changed(self, path: str) -> None:
+        self.pending.add(path)
+        self.timer.start()
+
+    def flush(self) -> None:
+        watched = set(self.watcher.files())
+        pending = self.pending
+        self.pending = set()
+
+        for path in sorted(pending):
+            if path not in self.paths:
+                continue
+
+            # Saving by replacing the file drops it from the watcher
+            if path not in watched:
+                if not os.path.exists(path):
+                    continue
+                self.watcher.addPath(path)
+
+            self.file_changed.emit(path)
@@ -15,3 +15,15 @@ def load_qt_text(text_path: str) -> str:
         return text
     except:
         return ""
+
+
+def load_qt_bytes(data_path: str) -> bytes:
+    try:
+        file = QFile(data_path)
+        data = b""
+        if file.open(QIODevice.ReadOnly):
+            data = bytes(file.readAll())
+            file.close()
+        return data
+    except:
+        return b""
@@ -0,0 +1,381 @@
+"""Headless replay of a Plover stroke log through a layout.
+
+Renders every stroke of a `strokes.log` (or any file with one stroke per
+line, such as `STKPW` or `["S-", "T-"]`) into PNG frames, a sprite sheet, or
+a single animated SVG, without running Plover:
+
+    svgld-replay strokes.log --svg layout.svg --py layout.py --format png -o frames
+
+The log is streamed, and raster frames are rendered in a pool of worker
+processes. Output only depends on the layout and the strokes, so it can be
+compared between runs as a visual regression test. Translations are not
+recorded in stroke logs, so scripts always receive an empty translation.
+"""
+
+import argparse
+import ast
+import multiprocessing
+import os
+import re
+import sys
+
+from itertools import islice
+from time import perf_counter
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+
+FORMAT_PNG = "png"
+FORMAT_SHEET = "sheet"
+FORMAT_SVG = "svg"
+
+DEFAULT_SVG = ":/svgld/en_layout.svg"
+DEFAULT_PY = ":/svgld/en_convert.py"
+
+STROKE_LOG_PATTERN = re.compile(r"Stroke\(.*?(\[.*\])\)")
+
+# Strokes handed to the pool at a time; bounds memory on long logs
+BATCH_FRAMES = 1024
+
+# Encoded frames remembered per worker, since steno repeats itself a lot
+MAX_CACHED_FRAMES = 256
+
+
+def parse_stroke(line: str) -> Optional[Tuple[str, ...]]:
+    match = STROKE_LOG_PATTERN.search(line)
+    text = match.group(1) if match is not None else line.strip()
+    if not text:
+        return None
+
+    if text.startswith("["):
+        try:
+            return tuple(ast.literal_eval(text))
+        except (ValueError, SyntaxError):
+            return None
+
+    # Lines that are not strokes (such as translations in a Plover log)
+    if match is None and " " in text:
+        return None
+
+    from plover.steno import Stroke
+    try:
+        return tuple(Stroke.from_steno(text).steno_keys)
+    except Exception:
+        return None
+
+
+def read_strokes(lines: Iterable[str]) -> Iterator[Tuple[str, ...]]:
+    for line in lines:
+        stroke = parse_stroke(line)
+        if stroke is not None:
+            yield stroke
+
+
+class Layout:
+    """The parts of a layout needed to turn strokes into group IDs."""
+
+    def __init__(self, svg_path: str, py_path: str, optimize: bool = False) -> None:
+        from plover_svg_layout_display.layout_script import load_script
+        from plover_svg_layout_display.svg_parser import SVGParser
+
+        self.svg_parser = SVGParser()
+        self.svg_parser.load_file(svg_path, optimize=optimize)
+        self.script = load_script(py_path)
+        if self.script is None:
+            raise ValueError("no usable layout script in {}".format(py_path))
+
+        self.script.bind(self.svg_parser.group_index)
+
+    def frames(self, strokes: Iterable[Tuple[str, ...]]) -> Iterator[List[str]]:
+        # Strokes are converted a batch at a time, and each distinct frame
+        # of a batch is only resolved once
+        for batch in batched(strokes, BATCH_FRAMES):
+            frames, codes = self.script.convert_strokes(batch)
+            frames = [self.svg_parser.resolve(frame) for frame in frames]
+            for code in codes:
+                yield frames[code]
+
+
+class FrameRenderer:
+
+    def __init__(
+        self,
+        svg_path: str,
+        scale: int,
+        background: str,
+        optimize: bool = False
+    ) -> None:
+        from PyQt5.QtCore import QByteArray, Qt
+        from PyQt5.QtGui import QColor
+        from PyQt5.QtSvg import QSvgRenderer
+
+        from plover_svg_layout_display.svg_parser import SVGParser
+
+        self.svg_parser = SVGParser()
+        self.svg_parser.load_file(svg_path, optimize=optimize)
+
+        renderer = QSvgRenderer(QByteArray(self.svg_parser.get_svg_bytes(
+            self.svg_parser.group_svgs
+        )))
+        size = renderer.defaultSize()
+        size.scale(
+            int(size.width() * scale / 100),
+            int(size.height() * scale / 100),
+            Qt.KeepAspectRatio
+        )
+
+        self.size = size
+        self.background = QColor(background) if background else QColor(Qt.transparent)
+        self.frames = {}
+
+    def render(self, group_ids: Sequence[str]):
+        from PyQt5.QtCore import QByteArray, QRectF, Qt
+        from PyQt5.QtGui import QImage, QPainter
+        from PyQt5.QtSvg import QSvgRenderer
+
+        image = QImage(self.size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(self.background)
+
+        renderer = QSvgRenderer(QByteArray(self.svg_parser.get_svg_bytes(group_ids)))
+        renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+        painter = QPainter(image)
+        renderer.render(painter, QRectF(0, 0, self.size.width(), self.size.height()))
+        painter.end()
+
+        return image
+
+    def render_png(self, group_ids: List[str]) -> bytes:
+        key = tuple(group_ids)
+        png = self.frames.get(key)
+        if png is None:
+            png = encode_png(self.render(group_ids))
+            if len(self.frames) >= MAX_CACHED_FRAMES:
+                self.frames.pop(next(iter(self.frames)))
+            self.frames[key] = png
+
+        return png
+
+    def render_sheet(self, frames: Sequence[List[str]], columns: int) -> bytes:
+        from PyQt5.QtGui import QImage, QPainter
+        from PyQt5.QtCore import Qt
+
+        width, height = self.size.width(), self.size.height()
+        rows = (len(frames) + columns - 1) // columns
+        sheet = QImage(
+            width * columns, height * rows,
+            QImage.Format_ARGB32_Premultiplied
+        )
+        sheet.fill(Qt.transparent)
+
+        painter = QPainter(sheet)
+        for index, group_ids in enumerate(frames):
+            frame = self.render(group_ids)
+            painter.drawImage((index % columns) * width, (index // columns) * height, frame)
+        painter.end()
+
+        return encode_png(sheet)
+
+
+def encode_png(image) -> bytes:
+    from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return bytes(data)
+
+
+_app = None
+_worker: Optional[FrameRenderer] = None
+
+
+def init_worker(svg_path: str, scale: int, background: str, optimize: bool) -> None:
+    global _app, _worker
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt5.QtGui import QGuiApplication
+
+    _app = QGuiApplication(sys.argv[:1])
+    _worker = FrameRenderer(svg_path, scale, background, optimize)
+
+
+def render_png_task(task: Tuple[str, List[str]]) -> int:
+    path, group_ids = task
+    png = _worker.render_png(group_ids)
+    with open(path, "wb") as frame_file:
+        frame_file.write(png)
+    return 1
+
+
+def render_sheet_task(task: Tuple[str, List[List[str]], int]) -> int:
+    path, frames, columns = task
+    png = _worker.render_sheet(frames, columns)
+    with open(path, "wb") as sheet_file:
+        sheet_file.write(png)
+    return len(frames)
+
+
+def batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def png_tasks(frames: Iterable[List[str]], output: str) -> Iterator:
+    # Plain lists, so the workers resolve the IDs against their own parser
+    for index, group_ids in enumerate(frames):
+        yield (os.path.join(output, "frame_{:06d}.png".format(index)), list(group_ids))
+
+
+def sheet_tasks(
+    frames: Iterable[List[str]],
+    output: str,
+    sheet_frames: int,
+    columns: int
+) -> Iterator:
+    for index, sheet in enumerate(batched(frames, sheet_frames)):
+        yield (
+            os.path.join(output, "sheet_{:04d}.png".format(index)),
+            [list(group_ids) for group_ids in sheet],
+            columns
+        )
+
+
+def run_pool(args, tasks: Iterable, task_function, chunk_size: int) -> int:
+    context = multiprocessing.get_context("spawn")
+    frames = 0
+    with context.Pool(
+        args.jobs,
+        initializer=init_worker,
+        initargs=(args.svg, args.scale, args.background, args.optimize)
+    ) as pool:
+        # Tasks are fed a batch at a time, since the pool would otherwise
+        # read the whole log up front
+        for batch in batched(tasks, chunk_size):
+            for count in pool.imap(task_function, batch, chunksize=16):
+                frames += count
+
+    return frames
+
+
+def write_animated_svg(
+    frames: Iterable[List[str]],
+    svg_parser,
+    out_file: TextIO,
+    frame_time: float
+) -> int:
+    """Writes every group once into the document's defs, and each frame as
+    a set of references that is only visible during its time slot."""
+    out_file.write(svg_parser.svg_header.decode("utf-8"))
+    out_file.write("<defs>\n")
+    for group_id in svg_parser.group_order:
+        out_file.write(svg_parser.group_svgs[group_id])
+        out_file.write("\n")
+    out_file.write("</defs>\n")
+    out_file.write('<g xmlns:xlink="http://www.w3.org/1999/xlink">\n')
+
+    count = 0
+    for index, group_ids in enumerate(frames):
+        out_file.write(
+            '<g visibility="hidden"><set attributeName="visibility" to="visible" '
+            'begin="{:.3f}s" dur="{:.3f}s"/>'.format(index * frame_time, frame_time)
+        )
+        for group_id in group_ids:
+            out_file.write('<use href="#{0}" xlink:href="#{0}"/>'.format(
+                escape_attribute(group_id)
+            ))
+        out_file.write("</g>\n")
+        count += 1
+
+    out_file.write("</g>\n</svg>\n")
+    return count
+
+
+def escape_attribute(value: str) -> str:
+    return (
+        value.replace("&", "&amp;").replace('"', "&quot;")
+        .replace("<", "&lt;").replace(">", "&gt;")
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="svgld-replay",
+        description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("strokes", help="stroke log to replay, or - for stdin")
+    parser.add_argument("--svg", default=DEFAULT_SVG, help="layout SVG (default: the bundled layout)")
+    parser.add_argument("--py", default=DEFAULT_PY, help="layout script (default: the bundled script)")
+    parser.add_argument("--scale", type=int, default=100, help="layout scale in percent")
+    parser.add_argument(
+        "--format", choices=(FORMAT_PNG, FORMAT_SHEET, FORMAT_SVG), default=FORMAT_PNG
+    )
+    parser.add_argument(
+        "-o", "--output", required=True,
+        help="output folder for png and sheet, or file for svg"
+    )
+    parser.add_argument(
+        "--optimize", action="store_true",
+        help="optimize the layout SVG after loading it, as the display can"
+    )
+    parser.add_argument("--background", default="", help="background color (default: transparent)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--sheet-frames", type=int, default=100, help="frames per sprite sheet")
+    parser.add_argument("--sheet-columns", type=int, default=10, help="frames per sheet row")
+    parser.add_argument(
+        "--frame-time", type=float, default=0.5,
+        help="seconds each stroke is shown in an animated SVG"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    if args.strokes == "-":
+        in_file = sys.stdin
+    else:
+        in_file = open(args.strokes, encoding="utf-8", errors="replace")
+
+    start = perf_counter()
+    with in_file:
+        layout = Layout(args.svg, args.py, args.optimize)
+        stroke_frames = layout.frames(read_strokes(in_file))
+
+        if args.format == FORMAT_SVG:
+            with open(args.output, "w", encoding="utf-8") as out_file:
+                frames = write_animated_svg(
+                    stroke_frames, layout.svg_parser, out_file, args.frame_time
+                )
+
+        else:
+            os.makedirs(args.output, exist_ok=True)
+            if args.format == FORMAT_PNG:
+                frames = run_pool(
+                    args, png_tasks(stroke_frames, args.output),
+                    render_png_task, BATCH_FRAMES
+                )
+            else:
+                frames = run_pool(
+                    args,
+                    sheet_tasks(stroke_frames, args.output, args.sheet_frames, args.sheet_columns),
+                    render_sheet_task,
+                    max(1, BATCH_FRAMES // args.sheet_frames)
+                )
+
+    elapsed = perf_counter() - start
+    print(
+        "{} frames in {:.2f} s ({:.1f} frames/sec)".format(
+            frames, elapsed, frames / elapsed if elapsed else 0.0
+        ),
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
-from plover.steno import Stroke
-
-from typing import List, Tuple
-
+# Each row is (key, ID drawn when pressed, ID drawn when released). A script
+# that defines KEYS without a convert_stroke function is compiled into a
+# lookup table when it is loaded.
 KEYS = [
     ("#", "num", "num_n"),
     ("S-", "ls", "ls_n"),
@@ -28,6 +27,17 @@ KEYS = [
     ("-Z", "rz", "rz_n")
 ]
 
+# Groups drawn by the batched form below, in drawing order: the pressed and
+# released IDs of each key in turn
+GROUPS = [group_id for _, pressed, released in KEYS for group_id in (pressed, released)]
+
+
+def convert_strokes(keys):
+    # Takes a boolean matrix with one row per stroke and one column per key
+    # of KEYS, and returns one with a column per entry of GROUPS
+    import numpy
 
-def convert_stroke(stroke: Tuple[str, ...], _: str) -> List[str]:
-    return [pos if key in stroke else neg for (key, pos, neg) in KEYS]
+    groups = numpy.empty((keys.shape[0], 2 * keys.shape[1]), dtype=bool)
+    groups[:, 0::2] = keys
+    groups[:, 1::2] = ~keys
+    return groups
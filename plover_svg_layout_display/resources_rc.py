@@ -0,0 +1,1029 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x13\xa3\
+\x00\
+\x00\x54\xab\x78\x9c\xed\x5c\xc9\x72\x1c\xb9\x11\xbd\xcf\x57\x20\
+\xe8\x33\x4a\xd8\x17\x87\xa8\x89\xf0\xc1\x0e\x9f\xbd\xdc\x69\x89\
+\x23\xd1\x6e\x89\x6a\x89\xa6\xc6\xfa\x7a\xe7\x0a\xa0\xba\x29\xcd\
+\xc4\x2c\xf2\x22\x5e\xd4\x9d\x5d\x55\x28\x20\x97\x97\x2f\x13\xa0\
+\x9e\x7e\xfb\xfd\xeb\x83\xb9\xbf\x7e\xf7\xfe\xe6\xf6\xcd\xe5\x85\
+\xdf\xdc\x85\xb9\x7e\xf3\xfc\xf6\xc5\xcd\x9b\x97\x97\x17\x7f\xf9\
+\xf3\xef\x6d\xbb\xf8\xf6\xd9\x37\x4f\xdf\xdf\xbf\x34\x1f\x6e\x5e\
+\xdc\xbd\x82\x7b\x52\x7b\xfd\xfa\xc2\xbc\xba\xbe\x79\xf9\xea\x0e\
+\x44\x97\x51\x5c\x86\xf0\x20\xdd\x5c\x7f\xf8\xdd\xed\xf7\x97\x17\
+\xce\x38\x03\x0f\x18\xb8\xeb\xc2\xc0\xab\xde\xbc\xbf\xbc\x78\x75\
+\x77\xf7\xf6\xb7\x4f\x9e\x7c\xf8\xf0\x61\xfb\x10\xb7\xdb\x77\x2f\
+\x9f\x04\xe7\xdc\x13\x78\xc5\xc5\xb3\x6f\xcc\xd3\xb7\x57\x77\xaf\
+\xcc\x8b\xcb\x8b\xd7\x1e\x86\x32\xa1\x6d\x35\x87\xe7\xd6\x6d\xbe\
+\x94\x60\x1c\x7c\x89\xce\x85\x64\xe0\x87\x98\x5c\x5a\x64\xfa\xbc\
+\x0f\x65\x0b\xb9\x3d\x77\x26\x6c\xb5\xc2\x3f\x21\xba\x60\xd2\xd6\
+\x7b\xaf\x26\x6f\xf0\x22\x95\xde\xb3\x64\xe1\x96\x30\xae\x59\xbe\
+\x76\x6f\x75\x18\x79\xb1\x3d\x79\x9d\x7c\x66\x95\x3f\x5e\x98\xef\
+\x6e\x0e\x87\xcb\x8b\xdf\x5c\xf7\x17\xfd\xbb\xc0\xa2\xbd\x7d\x7b\
+\xf5\xfc\xe6\xee\x5f\x97\x17\x1b\xfc\xf2\xfe\xee\xdd\xed\x3f\xae\
+\xe1\x96\xea\x5d\xbf\xba\xd2\x1f\x1e\xba\xc9\x8a\xae\xe1\x97\x27\
+\x3b\x9d\x84\xb8\x55\x5f\x59\x2b\xf1\x55\xdf\xd2\x73\x55\x0c\x2a\
+\x80\x94\x12\x9b\x7c\x8d\xf7\x3e\xe1\x0d\x66\x59\x02\x5f\xb4\x72\
+\xc3\x2b\x8b\x23\xec\x74\x2b\x77\xc9\xd7\x78\x6f\x79\x8c\x71\xcf\
+\xb8\xaa\xe3\x7c\xe1\x95\xa7\xb4\xd5\xe6\x3f\xe1\x0f\x31\xc7\x45\
+\x0e\x60\x48\xd0\x81\x43\xfb\xfe\x6c\x7f\xd0\x61\xce\xfd\x81\x5e\
+\xb3\xf8\x05\xc9\x5f\x4a\x2b\xb1\x6c\x31\xc6\xaf\xd1\x1f\x68\xe5\
+\xe9\xd1\x1f\xf6\x5a\x49\x6d\xeb\xf9\x6b\x74\x07\x5e\xf8\xa3\x37\
+\xec\x94\x52\xfc\x96\x4b\xfd\x15\x73\x28\x5c\x2b\xc1\x75\x70\x2f\
+\x50\x7c\xae\xd6\xc3\xaf\xa5\xe0\xc5\xda\x33\x68\x27\xe7\xda\x5f\
+\xc1\x20\xc1\x05\xf1\x44\x4f\xae\x88\x5a\x18\x5a\x5a\x64\x7e\x3d\
+\x26\xdf\xb4\x57\x66\xcc\xc1\xce\xdb\x76\x9f\x5f\x4a\x99\x35\x6f\
+\xb9\x97\xaf\x31\xb6\x64\xe5\x8f\xc1\xb5\xd3\x4a\x6b\x5b\xf0\xe1\
+\x6b\xf4\x07\x5a\x79\x7c\xf4\x87\xbd\x56\xbc\x73\x5b\xfb\x2a\xa9\
+\x98\xac\xfc\xd1\x1f\x4e\xca\xd7\xb8\xa5\xaf\x92\x8b\xc9\xca\x1f\
+\xfd\x61\xaf\x95\x00\xe6\x19\xa5\xbb\x0f\x3f\xdb\x21\x68\x88\xff\
+\x11\x8f\xe0\xb5\x3f\xe0\x11\x44\xe1\xcc\xde\x44\x61\x10\x51\x30\
+\xe5\x54\x82\xf8\x4d\x30\xf3\xae\xdd\x27\x11\x4d\x0f\xb4\x15\x1c\
+\x27\xb7\x04\x0e\x94\x53\x85\x00\xdc\x62\x29\x0d\x3c\x27\x87\xd6\
+\x89\x9a\x0e\x01\xd8\x6b\x8f\x95\xd8\x6b\xab\xa5\x81\x3f\x79\xd7\
+\x1a\x39\x19\xb2\xd7\x5a\x43\x34\xf1\xda\x46\x03\x13\x73\x1e\x20\
+\x2e\xab\x00\x4f\x8d\xef\xb9\x44\x72\x3a\xd6\xb4\xab\xa1\xe2\x47\
+\xc8\x99\xcc\xd1\x63\x47\xb1\x34\x32\x62\xf7\xc1\xdb\x42\x4f\xd6\
+\x31\x30\xb5\x91\x9c\x4f\x85\x3e\xba\xa7\xc7\x7d\xa0\x0f\x17\xf9\
+\x03\x75\xe3\x52\xac\xfc\xf2\x46\x43\x76\xba\x25\xfb\xca\x8f\x57\
+\xdb\xc6\xf4\x5c\xd6\xdf\xf0\xb1\x92\x79\x10\x88\x18\x7e\xf5\xd6\
+\xaf\x6d\x32\x96\x97\x10\x96\xe9\xf0\x6a\xa1\x6c\xd0\xeb\x19\xae\
+\x6f\x05\x25\x16\xf2\x16\x51\xa0\x95\x86\xe6\x6d\x1f\x5a\xa8\xb4\
+\x4e\xb0\x23\x7e\xb4\xa6\xd2\x17\xeb\x07\x40\x01\xd8\x4c\x81\xe8\
+\x4a\xed\x11\x73\x44\x29\xd9\x13\x73\x7f\xd4\xca\xbe\x9e\x09\xd8\
+\x2b\x78\x54\xca\x9e\xd4\x67\xea\x15\x3c\x6a\xe5\x81\x3d\x08\x07\
+\x89\x25\x41\xca\xce\x5b\xfb\x6c\xce\x2e\x3f\x9c\xb2\x71\x88\xcf\
+\xe7\xec\xf2\x1f\x4d\xd9\xef\xae\x9f\xdf\x99\xef\x2f\x2f\x12\x4c\
+\xa3\xb7\x0b\x03\x37\x27\x0f\x46\x85\x07\xe4\xce\x5c\xb7\xd8\xcb\
+\xdc\x00\x2a\x5b\xc3\x1b\xdf\xc1\x43\x5b\x86\xcf\x7f\xf1\xe7\xc9\
+\x24\x3f\x35\xa5\xc3\xcd\x9b\xeb\xe7\x57\x6f\x2f\x2f\xde\xdd\xfe\
+\xf3\xcd\x8b\xdd\xcf\x7f\xbf\xbd\x79\x73\xfa\xbb\xce\x36\xf3\x6c\
+\x5f\xea\x6b\x4e\x46\x1d\x8b\x2a\x29\xc3\xdc\xae\xde\xdd\x5c\xd9\
+\xc3\xd5\xdf\xae\xe1\xd6\x3f\xbe\xb9\xbf\x3a\xdc\xbc\x30\x7f\xfa\
+\xeb\x1f\x0c\x99\xf9\xf6\x1d\x0e\x72\xbd\xe1\xe6\xd3\xda\x50\x04\
+\xbe\x1d\xa1\xa8\x01\x2a\x9b\xf2\x11\xed\x91\x53\xe4\xc4\x17\x5b\
+\x0b\x94\xab\xa3\x8f\xf9\xb0\xfe\x90\x5d\x49\x47\xfa\x02\xd4\x03\
+\x2c\x56\x9d\xaf\x75\xc8\x7e\x03\x97\x6e\x86\x3d\xa4\x35\x0f\x9f\
+\xce\x01\x3c\x03\x75\xf0\x44\x63\x44\x0a\xa9\xc5\x7e\x7a\x11\x7f\
+\x0f\xa5\x70\x5a\x85\xa7\xe9\x42\x88\xed\x00\x6f\x01\x8c\xa7\xac\
+\x0b\xf7\x1f\x61\x6c\x60\x14\x7d\xff\x16\x20\x32\xd9\x10\x65\xe8\
+\xe9\x81\x4f\x5f\x63\x89\xfc\x84\x2b\xde\xdb\xf5\x4a\x63\x5a\x52\
+\x2a\x11\x2f\xfa\xdd\x2e\x23\xab\x1c\xb3\xcb\xa4\x9c\x04\x84\x84\
+\xc6\x76\xdc\xa2\x03\x15\x90\x94\xda\xee\x22\x89\x3e\x77\x5f\xf8\
+\xa9\x5a\x13\x2d\x19\x74\x8c\xef\x8f\x70\x89\xde\x07\xf6\x0b\xbb\
+\xeb\x2c\xcb\x1a\xf1\x5b\xf5\x21\x58\x59\xa3\xce\xd4\xce\x99\xa9\
+\x2c\x6b\xa4\x67\x91\xf3\x2d\x17\x8a\x4b\xcb\x52\x54\x59\xbb\x81\
+\x51\x06\x78\xcc\xa4\xa4\xec\x5b\xea\x6a\x6e\x7c\x32\x24\xcf\xec\
+\x2e\xc7\x55\x4e\xa9\x78\xf6\x18\x88\xe5\xa4\x86\x53\x35\x30\x41\
+\x23\x86\x06\xf7\xfb\xb2\xc8\xa2\x26\xf8\x96\x73\x75\x73\xb2\xe0\
+\x40\xdd\xb3\xc7\x79\x36\x28\x58\x7c\x95\x6a\x38\x8e\x05\xea\x9a\
+\x77\xba\x78\xf8\x93\xac\xcc\x74\x3c\xa4\xd0\x16\x57\x0b\x29\x77\
+\x94\x69\x69\x4c\x4f\x51\xef\x5b\x8d\xae\xfa\x45\x4e\xb5\xa3\xcb\
+\x01\x52\x38\x52\x81\xe8\x38\x00\xa9\x45\xe4\x72\x32\x43\x95\x43\
+\x6e\xa8\x73\xbc\x11\xf0\x8d\x19\xa3\xc7\x11\x36\xdf\x5c\xab\x8b\
+\xd6\x29\x72\x44\x83\x2a\x7e\xa4\xe0\x5f\x69\x4e\x80\xb5\x03\x6f\
+\x2f\x5b\x09\x1e\x35\x10\x5c\x65\xfd\x85\x18\x89\x25\xd3\x7a\x0e\
+\x8b\x3b\x00\xff\xf7\x1c\xaa\x31\x56\xd4\x61\x68\xc1\xe7\x45\xc6\
+\x1b\xd8\x5f\x86\xef\x8b\x47\x87\xee\xa7\xea\x7d\xf1\xb9\x4d\x91\
+\x2f\xd2\xe3\xae\x93\x4b\x84\x1e\xa6\xc8\xd1\x80\xb2\x2f\x8e\x72\
+\x03\xce\x94\x9e\xf3\x8d\x42\xbf\x7b\x42\xfb\x04\x55\x04\xa9\xb9\
+\xb2\xa1\x20\x5e\xf0\x25\x3d\x31\xb1\x0f\xe0\x9c\x78\x37\x98\x37\
+\xaa\xdf\xa0\xf2\x82\xcb\x6d\x91\x69\xf5\xa4\xe6\xa1\x4e\xbd\xe2\
+\x2b\x3b\xbd\x3e\x09\xbe\xda\xcf\xaf\x93\x25\x9b\xc4\x13\x6b\x81\
+\xc2\x85\xe4\xec\xfd\x1a\x46\x03\x11\x44\x46\x24\xd9\x47\xe8\x88\
+\xcc\x2c\x18\xb3\x97\x25\x10\xd7\x58\x96\x78\xa1\xd9\x2c\xf1\x41\
+\xb3\x5d\xe3\x87\x67\x6b\x17\xe8\x14\x2b\x96\x56\xd9\xff\x0a\x55\
+\x49\x29\xf9\x18\x16\xb9\xb4\x5e\xbd\xbc\xb2\x72\x1d\x35\xed\x68\
+\x87\xc9\x7d\xf6\x3d\xda\x13\x0f\x78\x00\x49\x4e\x40\x71\xaa\x6c\
+\x51\x80\x19\xc6\x26\xa4\x8f\x19\x47\xa0\x44\xc2\xe3\x1b\x71\xc5\
+\xe3\x84\x89\x9c\x20\xcc\x0c\xf6\xd8\x20\x46\x16\x39\xb6\xdc\x04\
+\x91\x62\xad\xe4\x4e\xc9\xb9\xb8\x84\x1f\x7a\xbd\x06\x19\x7c\x16\
+\x50\x53\xb8\x97\xd7\x52\x34\x08\x93\xc3\xa8\x3f\xd2\x84\x9c\x43\
+\x44\x1e\xd0\x46\x50\x47\x72\x74\xc5\x2c\xb8\x2c\x72\xf6\x50\x5c\
+\x7f\x22\x73\xec\x17\x3d\xe1\x16\x7e\x57\xf9\x3c\x92\xe3\xd6\x72\
+\xc1\x48\x8e\x81\xc3\x53\x54\x82\x2a\x23\x4b\xf7\x94\x17\x79\xfa\
+\x0c\xd4\xdb\x84\x75\x18\x50\x84\x90\x68\x5b\xf8\xec\x95\x2c\x99\
+\x20\x0e\x0b\x00\x28\x4c\xb3\xd3\xb8\x82\xd1\xae\x48\xb9\x2e\x10\
+\x0e\x3c\x42\xa2\xbe\xb7\x46\xc6\xad\xa9\x96\xd5\xb8\x22\xe3\x3a\
+\xa3\xd9\x63\x6c\xe4\x48\xaa\x6c\x5b\xc2\x20\x90\xab\x07\xd3\x16\
+\xa0\x7e\x09\xf0\xb1\xb4\x5c\x8f\x13\xe6\xc4\x84\x5b\xc2\x9d\x32\
+\x9c\x1e\x19\x76\x44\x04\xa0\x07\xc1\xa5\x03\x2e\x46\x86\xcf\x2e\
+\xac\x73\x62\x4a\x82\xfb\x10\x21\x2c\xb2\xcc\x7d\x66\xf6\x99\xf1\
+\xf1\xc9\x07\x64\x86\x57\x7a\xd4\x53\xaa\x8a\xa8\x37\x98\xaf\x8b\
+\xe1\x01\x2b\x55\x50\x58\x27\xbc\x75\xac\x4d\x4c\xcb\x6b\xa6\x53\
+\x6f\x18\xe8\x81\x33\x52\xb8\xb4\x13\x45\x02\x38\x94\x27\xe4\xca\
+\x89\x12\x5f\xcd\x34\x1d\xd0\xf5\x2e\x35\xb3\x3e\x42\x4f\xc1\x2f\
+\x72\x2e\x29\x72\x24\xb6\xc0\x88\x11\x7d\x23\x44\x24\x0f\xa7\x27\
+\x3a\xbf\x47\x64\x5c\x1d\x03\x70\x8b\xc4\xad\x20\x5e\x70\x7e\xbd\
+\x33\x6e\x24\x17\xa8\xd8\x48\x60\x36\x94\x3b\xa4\x3f\xbf\xc8\x00\
+\xe3\x8d\xb7\x30\x53\x75\xa1\x28\x3e\x12\x92\xd7\x4e\x48\xca\x4c\
+\x68\xc8\x11\x1d\x93\x55\xab\xb8\x97\x5a\x20\x4f\xf1\x99\x3d\x09\
+\x7d\x6f\x51\xbd\x43\xa7\xc0\x27\x01\xde\x18\x05\x03\xc5\x1a\xbd\
+\x7b\x41\x77\x0a\xfa\x25\x88\x71\xa9\x44\x91\x3c\x4d\x2f\x94\x6a\
+\xe6\xe0\x02\xc7\x0c\x65\x78\x3d\xa4\xc4\x09\x80\xb9\x24\x11\x2f\
+\x4d\xb0\x64\x90\xda\xd0\x6f\xf5\x65\x30\xea\x91\xfd\xa3\xec\x08\
+\x21\x51\xb8\x5d\x98\x53\x3c\x09\x59\x22\xf1\xe3\x6b\xd4\x37\xbc\
+\xc8\x83\x83\x97\x0a\x14\x75\x81\x4e\x5c\xdb\xc2\x3b\x06\xc2\x03\
+\xc6\x32\xdf\x23\xbb\x83\x1b\x90\x26\x5a\x0f\x51\xdd\x4d\xfd\x7d\
+\x97\x49\x24\x98\x09\xca\x89\x23\x4e\x31\x62\x32\x25\xdb\x17\x26\
+\x21\x51\x6e\x17\x8a\x1a\x41\xef\x65\x8a\x44\xdd\xb9\xcc\xeb\x99\
+\xf8\x5f\xec\x04\x08\xb9\x83\x49\xef\xd0\x25\x7a\x21\x8d\xf6\x5a\
+\x11\xad\xc5\x95\xe9\x81\x48\xd9\xde\x35\x56\x71\xe3\xe6\x9f\x04\
+\xc9\xf0\x45\x70\xd5\xd0\x96\xd4\x53\x62\x77\x75\x91\x7b\xae\xb1\
+\x9f\xc7\x5e\x83\xfc\x40\x9b\xb1\x39\xb3\xb7\x40\x2a\x83\x40\xf5\
+\xbd\x15\xb2\x90\xef\x8e\x95\x21\xd4\x2c\xe7\x4e\x64\x5b\x3d\x41\
+\xc9\x26\x91\x87\x73\x59\xbf\xd9\x41\xfe\x2c\xd3\x12\x72\xa6\x42\
+\x1d\x80\x56\x73\x5a\xc4\xdc\x0a\x93\xfc\x71\xb9\x36\x2f\x95\x92\
+\xa7\x7c\xa4\x66\x6e\xd5\x31\x5b\x12\x39\x75\x4f\x25\xce\xbc\x4e\
+\x66\xb7\x32\x2b\xb3\xce\x45\xe5\x26\x2c\x5c\xbe\xe9\x15\x23\x6f\
+\x5b\x02\x86\x46\x5b\xe4\xd4\x7a\xce\xbb\xeb\x30\x9b\x73\x05\x43\
+\xe1\x07\x86\x86\xc2\x0f\x30\x90\xe8\x34\xc6\x29\x4f\x0a\xb3\xa3\
+\x15\xb2\x2a\x06\xf6\x0f\xc8\xe4\x12\x0c\x87\xfc\xec\xe9\x15\x92\
+\xf5\x41\x73\x32\xb0\x19\x8f\x99\xf5\x01\xbe\x42\x03\x3d\x20\xcb\
+\x7d\x2b\xac\xac\x57\xec\xfa\x04\x4f\x76\x37\xf2\xc7\xd7\x8a\x64\
+\x1e\xfc\xae\x05\xf6\x24\x25\x85\x9c\x83\x13\x57\xaf\xa3\x4a\x6d\
+\xa5\x2f\x22\x20\x71\xa9\x27\x4c\x80\x19\xe2\xcc\x90\x27\x8c\x71\
+\x65\x02\x03\x12\xf4\xc2\x2e\xac\x3f\x45\x18\x47\x49\xa7\x84\x90\
+\xd9\x1b\xcd\xc5\x4e\xbe\xd6\xa4\x09\xcf\xa2\xac\xc3\x4e\x7e\xa4\
+\xd9\x5f\xf2\xc9\x90\x95\x4e\xcd\xeb\xa5\x4a\x9a\x13\xd4\x3f\xe1\
+\xae\xcb\x14\x1f\xa6\x7e\xbc\x46\x73\x42\x97\x3f\xf3\x29\x03\x9b\
+\xa5\xfa\x97\x38\xa6\xc9\x2c\x32\x32\xde\xb0\xbb\x0e\x8b\x39\xf3\
+\xee\x12\x00\x67\x3c\xc2\x47\x0c\xcc\x83\x1a\x11\x81\x98\x19\x61\
+\x45\xac\x8e\x3b\x08\x0d\xb7\x12\x06\x4f\xf0\xb4\xef\xef\x46\x39\
+\x82\xaf\x5c\x44\x4e\x1d\x3f\x2d\x49\x90\x11\x7b\x96\x4d\x21\x64\
+\x79\x76\xf2\x7e\x65\x31\x94\x94\xd0\x2e\x00\x79\xc4\xad\x90\x1f\
+\x11\x92\xe6\xb2\xf2\x26\xea\xc7\x2c\x72\xea\x3d\x08\x4d\x60\x68\
+\x8d\x8c\xbc\xaa\x32\xb2\xf3\x22\x4f\x18\x02\x1d\x36\xa2\xda\x74\
+\x07\xd3\x21\x12\x03\xc5\xaf\xbe\x08\xc8\x0d\x2d\x58\x65\xcc\xfd\
+\x6c\x35\x09\x0b\x4e\x02\x87\x85\x92\x03\x4f\x3a\x8a\x0a\x71\x5c\
+\x9f\x49\xb1\x15\x82\x0f\xcb\xfc\x42\xeb\xa3\xb2\xd9\x2e\x65\xf3\
+\xd0\xcb\x22\xb3\x73\x28\x2f\x1e\x15\x1f\xee\x94\x51\xd0\xa0\x2d\
+\xc0\x72\xa9\x39\xcc\xc4\xf0\x2a\xed\x28\x04\x42\xb7\xd9\x6b\x28\
+\x90\x78\x76\x09\xc2\x85\x5c\x05\x68\xd3\x22\xd7\xe0\x9d\x00\x2e\
+\xd2\xe5\xe5\xed\x39\x66\xa9\x3b\xa4\x9a\x95\xac\xae\x55\xc4\xe8\
+\x2e\xf0\x48\x8b\x22\x07\x2f\x55\x24\x15\x3a\x02\x24\xa6\x34\x45\
+\x5e\xe3\x46\xe1\xa6\x0d\x85\xd9\xb4\x81\xe7\x0f\x4b\x8c\x6b\x43\
+\x8d\x5b\xc6\x6c\x0e\x6d\x3b\x85\x96\x32\xad\x5d\x19\x97\x76\x37\
+\x26\x6b\xf4\xdc\x9e\x92\xb2\x4f\xc8\x6b\x2c\x89\x5b\x04\x28\x9f\
+\x47\x16\x6e\x18\x66\x93\xf2\x06\x8b\xe5\xd2\x25\x24\xa5\x21\x2b\
+\xcc\x41\x9e\x27\x79\x34\xac\x14\x26\xf7\x85\xb5\xf7\xcd\xef\x2b\
+\x09\x61\x96\xca\x8d\x88\x3f\xac\xb6\x97\xda\x97\xaa\x85\xe5\xfe\
+\xdc\x73\x29\x8b\x2c\x44\x08\xbe\x15\x78\x90\xe2\x47\x9a\x18\xc9\
+\x75\xaa\x99\xe4\x85\x2a\x42\x3e\x11\x64\x56\x8e\x14\x53\xa2\x4f\
+\x6c\xfb\x9c\xeb\x8b\x1c\x44\x57\x6a\xd7\xbc\xcc\xe4\xae\x40\x7e\
+\x25\xd0\xe4\x5a\x41\x7d\x40\xad\xa0\x32\x11\x17\xee\x0e\x62\xf1\
+\x46\x09\xbc\x52\x41\x5c\x1b\x03\x4f\x2a\x40\x00\xad\xf8\x3a\xc8\
+\xbd\x70\x1d\xa4\xf2\x8c\x06\xe9\xe6\x70\x80\xa1\x0e\xba\x2b\x6d\
+\xe0\xf1\x10\x81\xc0\x04\xd1\xb9\x94\x54\xda\x28\x51\x99\xc3\xc9\
+\x2d\x60\x41\xa5\xb2\x9d\x61\x43\xa5\xb1\x15\x35\x2f\xd7\xf1\xf6\
+\xe9\x83\x44\xf6\x8c\x40\x97\x1d\xac\xf3\x44\x84\x7a\xaf\x4b\xa7\
+\x40\x02\x20\xc2\x75\x5a\x1a\xf6\x08\xc8\xa8\xa1\x0c\xa8\x30\xa3\
+\x20\xc7\xfd\x58\xe2\xf5\x39\x87\x40\x81\x42\xe1\xd4\x0a\x37\x02\
+\xb4\xbf\x44\x91\x30\xf1\x6a\xc8\x80\x55\x89\x1b\xd5\xc8\x41\xd1\
+\x4b\x61\x51\xc4\x82\x25\x62\x52\x71\x44\x7e\x43\xc7\xad\x0e\x8f\
+\xfb\xdb\x71\x88\xa3\xcf\x82\x50\xea\x2a\xb5\x70\x28\xdf\xd1\x95\
+\x46\x1c\x4c\xfa\x5e\x5c\xf7\x62\xb2\xea\x3e\x9e\x85\x54\xf5\xc8\
+\x29\x91\x8a\xf9\x14\x8f\x33\x45\x30\x90\x68\xc0\x1a\x29\xc6\x0e\
+\x76\xc6\x04\xd9\x5b\x5d\x0d\xd0\xaf\x66\x4e\x77\xda\x09\x89\x88\
+\xc7\x76\x18\x1c\xb0\x2f\xf0\x8e\x35\x72\x6f\xc3\x55\xfc\x62\x7d\
+\xad\x4a\x38\xcf\xd8\x59\x91\x48\xa1\x2a\x01\x50\x63\x24\x9e\xc0\
+\x0e\x1e\xb0\x9b\xe0\x69\x56\x40\xc9\xf1\xb6\x02\xa9\xb7\xf1\x3a\
+\x02\xcd\x9f\xab\xa2\x29\x17\xf0\xf9\xbc\x27\x18\x52\x0c\x48\x8b\
+\x76\xe9\x2d\x09\x4a\x88\x5e\x87\xcc\x0a\x30\x93\xdf\x13\xcf\x3b\
+\x48\xf1\x64\x66\xdd\xa2\xa5\x37\x22\x6e\x3a\x2e\x32\xb5\xc4\xc4\
+\xf5\x3c\xf6\x1c\xda\x61\xc6\xae\x16\xa7\x58\x43\x59\xd4\xab\x6b\
+\x0a\x39\xb8\x9e\x0e\xac\x13\xdb\x1b\x51\xf2\xa1\x7a\x2b\xeb\x47\
+\x1b\x57\x9c\xe6\x46\x30\xa9\x16\x55\x94\x4f\xb3\x50\x44\x4d\x0f\
+\x62\x9e\xd1\xce\x54\x73\x0d\x96\x34\x50\x55\x8b\x6c\x64\x86\xe7\
+\x8e\x95\x30\x47\x21\x0b\xea\xdd\xaf\x8e\x55\x93\xa3\xc7\x0b\xb6\
+\x1a\xb0\xaa\x6a\x44\xdb\x75\xfb\x81\xfc\x1a\xdb\x34\x81\xf2\x1b\
+\x8b\x52\x12\xb2\xbb\xb7\xce\xa9\x02\x91\xd2\xce\x80\x10\xc2\xa1\
+\x62\xef\x5a\x59\x95\x90\xb8\xef\x9b\x02\x96\xc7\xa1\xe5\xb4\xc4\
+\x11\x39\x8c\xd1\x1d\x9e\x91\xbb\x87\xf7\xd6\x40\x26\x83\xb2\x2b\
+\xa7\x45\x9e\xbc\x00\x50\x80\x1a\x83\x4a\xe5\x91\xce\x0c\x4e\xbe\
+\xc8\xb1\xc5\xa4\x0d\xa0\xb6\x6b\xc0\x8f\xb4\xb4\xaa\xdc\x2e\x9d\
+\x25\x6d\x9c\xe6\x28\x3b\x40\xa4\x4b\x72\x49\x47\xf5\xb7\x76\xe2\
+\x34\x68\x01\xa4\x7d\x5f\x64\xea\x85\x31\xa4\xd6\xc6\x7b\x9e\xea\
+\x0f\xad\xad\x6d\x6f\x45\xa7\x99\x20\x58\x1d\xda\x25\x67\xd9\x43\
+\x30\x7b\xde\xcd\x82\xec\x16\x39\x13\x72\xe9\x5e\xf0\x49\x33\x9b\
+\x20\x5a\x02\x49\xa6\x19\xf2\xac\x65\xa8\x72\x52\xb5\x2a\xa5\xa2\
+\x7a\x82\xd2\x0f\x04\xa5\x9d\xac\xb2\x94\xc6\x75\xb0\x90\x3a\x9f\
+\x08\x32\x69\xb3\xc3\x0e\x7e\x3c\xca\xe4\x11\xe2\x43\x9e\x1d\x73\
+\xd1\xb9\xb2\x21\x2d\x80\x46\xef\xf1\xac\x00\x92\x34\xa0\x0c\x99\
+\xd2\x95\x19\xfb\x0e\xd4\x16\x43\x18\x04\xbf\x1a\xe2\x5a\x8d\x9c\
+\xb6\x09\x3f\xb9\x51\xa8\x71\x46\xdc\x7d\x79\x31\x19\xf3\x3c\xce\
+\x2a\xa6\x16\x6c\x14\x42\x6a\x3f\x6a\x92\xe4\x06\x1c\x26\x14\x45\
+\x5c\x66\x6e\xf8\x77\x82\x30\x30\xf0\xd2\x7d\x19\xa9\x95\xd0\x27\
+\xca\xc8\xb3\x8d\x87\x9f\x52\x46\x1e\x06\x75\x44\xf0\x89\xf7\x56\
+\xd8\x84\xf6\xa0\xed\xcc\x29\xca\x41\xe9\xfa\x61\xf9\x81\xfa\x0b\
+\xc7\xf1\x6a\x33\x2a\x1b\x75\x18\x05\x27\x82\x7b\x33\x3b\x7a\x2a\
+\x93\xa3\x4f\xf5\x1a\xb7\x54\x4c\xba\xe8\xfd\xa7\x30\x37\xf2\x22\
+\xaf\x25\xef\x8a\xb0\xd2\xea\x18\x9e\x23\xed\x3e\x02\x68\x33\xd2\
+\xb0\x4e\x40\xdb\xa1\xea\x3e\x5a\x60\x69\xf0\x6b\x28\xab\x9c\x7a\
+\x12\x0f\x82\x1f\xc8\xb9\x07\xc0\x70\x50\x0f\xa6\xa1\x72\xf7\x4d\
+\x1a\xa8\x63\x4b\x8c\xa9\x07\x36\xc2\x83\x42\xa4\x91\xd4\x81\x39\
+\x95\xf1\x09\x25\x6a\x52\x20\x67\x0c\xa0\x29\x47\x89\x54\x2a\x0d\
+\x2b\x53\x5f\xf0\x8b\x22\x61\x49\x98\x11\xf3\x9b\x91\x7d\x02\xb3\
+\x10\xa6\x54\xd3\x94\xd1\xff\xa8\xe4\x0f\x85\x21\x5e\xd9\x7b\x86\
+\x8a\x25\x2c\x32\x35\x67\x19\x64\x90\x0a\x29\x9c\xa9\x6a\xad\x1b\
+\xbb\xc1\x2a\x23\x0d\xe4\x60\x25\x1d\x29\x00\x68\xd6\xb7\xd3\xe3\
+\xb5\xcc\xa3\x29\xab\x7c\x16\x5b\x0d\x74\x53\x1f\x9b\xf0\x8f\x4d\
+\xf8\x1f\xd5\x5f\x79\x6c\xc2\xff\x92\x4d\xf8\x16\x11\xf4\xa9\x8b\
+\xd6\x33\x1f\xf8\x71\xe2\xd3\x63\x0f\x9e\xeb\xbc\xa1\x15\x39\xf1\
+\x82\x45\xfd\x72\x95\x0d\x6d\xa7\xa7\x52\x2e\x39\xe8\x3c\x3d\xb8\
+\x48\xd6\x46\xc6\xe2\x40\x2a\xa2\x81\xb0\x8b\xc4\x2d\x58\x4d\x50\
+\x21\x47\x49\xfe\x92\xb0\x46\xcd\x3a\xab\x05\xb6\xd1\x28\x26\x76\
+\xa2\xf8\x8d\x95\x68\x30\x23\x03\x06\x60\xc1\xe1\x6e\x2f\x1e\x34\
+\x98\xc0\xaf\x12\xb2\xff\x05\x58\x34\x71\x62\x5b\xc8\x0e\x3f\xc2\
+\xe6\x15\x79\x44\xa3\xb7\xa9\x2c\xfd\x7c\xbb\xac\xf2\xac\xb9\x9a\
+\xf7\x5b\xcc\x72\xaa\x06\xc5\xc3\x00\x58\x8e\x12\x75\x5f\x0d\x5d\
+\x55\xb1\x75\x63\x8b\x9f\x53\x9f\x4a\x1c\xb8\xea\xb1\x4b\xe2\xd0\
+\x93\x27\x3f\xb4\xa9\x3f\x4e\x4c\xa8\xfa\xb1\xa5\x6a\x66\x46\x96\
+\xf2\x4b\x37\xb4\x71\xd5\x83\xf6\x88\x63\x4f\x1c\x21\x0e\x7d\x9c\
+\xd0\x89\x70\xc4\x7d\x48\xe9\x97\x89\x1c\xb2\x1c\x28\x1b\xfe\xa3\
+\x50\x93\x2a\xeb\x70\xd4\x41\x2c\x4b\xff\xf1\x41\x7e\xf5\x23\x0e\
+\x76\x9c\x47\x42\xde\x6a\xa1\xa3\x37\xb9\x77\xb6\x3d\x51\x1f\x85\
+\x93\x35\xc4\xf4\x28\x8f\x6c\x48\x28\x34\xe4\xe2\x47\xcb\x0f\xcd\
+\x94\x3a\x15\x37\x2a\x53\x07\x42\x0e\xe2\x10\x95\xd0\x50\xc2\xa2\
+\x7a\xfa\xe6\xc8\xf7\x22\xf2\x55\x2b\x45\x80\x9d\xfd\x73\x95\x23\
+\x0f\x67\x27\x05\x08\xb5\x52\xde\x1a\x0d\x36\xa9\xca\xa3\xb4\x6e\
+\x72\x0a\x9c\x44\xba\x16\x28\x54\x7e\x42\x59\xd6\xea\x0e\x8e\xa5\
+\x00\x92\x3c\x35\x0b\x22\xde\x96\xb7\x2b\x97\x15\x74\x18\xc4\x7e\
+\x2f\x4b\xaf\x90\x0c\x2e\xbd\x76\x85\x55\x09\x11\x64\x68\xf4\xa0\
+\x63\xa7\x95\x5a\x22\x22\xbb\x9a\x9c\x56\xeb\x70\x12\x3d\xfe\x61\
+\x03\x82\xe5\x38\x5e\x03\x4e\x16\xcd\x94\x29\xff\x9a\x5d\x08\xc9\
+\x06\x08\xc1\xeb\x02\xee\x78\x5a\x62\x8a\xcb\xb9\x98\x9f\x14\x42\
+\x73\x0f\x4b\x19\x89\xf2\x50\xcd\xc6\xd2\xd0\x1b\x32\x18\xc8\xc5\
+\x19\x74\x76\xa6\xd2\x81\x7d\x7a\xa0\x09\xf9\x9c\x82\x81\x5e\x3f\
+\xcc\xbc\x8d\x2f\x3a\x4e\xdf\xd4\xbe\x10\xbe\x80\x14\xc8\xe9\x47\
+\x7d\x48\xab\x1e\xe9\x7f\x0e\x91\x39\x28\xb9\x4a\x6f\x34\x2e\x26\
+\xcd\x35\xf3\x4b\x7f\x8a\xb2\x84\xc1\x63\x21\xe0\x09\x07\x37\xcf\
+\xd1\x49\x5f\x4d\xc3\x96\x32\xf6\x71\x9a\x5f\xdb\x7e\xba\x99\x07\
+\xb1\x52\x97\x4d\x38\xa6\x1d\x2a\x30\x4c\x1a\x77\x5e\xd3\x4b\x63\
+\x76\x9e\x0b\xdd\x9d\x91\xfc\x54\xa8\xe3\x5f\x58\x44\x0e\xf5\x70\
+\xb2\x75\xd0\x4b\x4f\x76\xc2\x15\xf1\x2d\x3b\xf7\x59\x04\xb5\x00\
+\xf0\x77\xe7\xb6\xf4\x3c\x0b\x25\x12\xcb\x44\xcf\xcc\xce\x2a\xd5\
+\x53\x18\x6e\x89\xdb\x67\x2a\xa3\x6e\x38\xc9\xd3\x31\x44\x33\xcf\
+\x75\x69\x01\xaf\xfe\xae\x18\xa1\xc5\x85\x80\xaf\x26\x24\xad\x3d\
+\xba\x97\x46\x35\xb2\x04\xa3\x87\x85\xb0\x35\xc6\x8e\x49\x32\x55\
+\x1f\xb4\xcf\x18\x20\x43\x46\x4a\xfb\xba\x6b\xc6\x9d\x7e\xed\xb5\
+\xea\xfc\x95\x7f\x51\xff\x60\x91\xb1\x01\xd2\xee\xe6\xec\x48\x0d\
+\x47\xa7\xc7\x61\x47\x3b\x5e\xc8\xd2\x90\x07\xd8\xeb\xfe\xe6\xd8\
+\x01\x90\xf6\xdb\xd8\xb1\x91\x7d\xb3\x59\xdb\xf0\x69\xb8\x2e\xf6\
+\xc8\x2e\x91\x57\x77\xd4\xd3\x99\x9d\x7b\xc0\x95\x20\xb9\x29\x85\
+\x8a\x2c\x8d\x29\xe5\xc2\xba\x17\x3f\xe4\x71\xda\x52\x0e\x33\xe2\
+\x86\x11\xa3\x96\x70\x44\x05\x65\x4c\x25\xcb\x2e\x0d\xcd\x97\xf4\
+\xa8\xe7\x04\xe4\xfe\xe2\xa9\x85\x33\xb9\x81\x6c\x78\x69\xd7\x41\
+\xed\x4b\x04\xfb\xe0\xb4\x77\x10\xe9\xdc\xdc\xc2\xee\xe6\x19\x01\
+\x91\x19\x4f\xf4\x9b\x95\x2b\xf7\xc8\x89\x21\x00\x8f\x7c\x12\xb0\
+\xcb\x89\x4e\xde\x2c\x92\x21\xc6\x51\x40\xb6\x91\xae\x60\x90\x16\
+\x6d\x45\xef\x06\x36\xa3\x0d\x6b\x86\x5a\x46\xa5\x0a\x4b\x72\xf3\
+\x98\x30\xb6\xba\xb9\xea\xe1\x53\xc3\x5a\x3f\x1a\xa7\xa7\x2f\x46\
+\x4a\xd7\xae\x69\xaa\xab\x98\xa0\x14\x97\x43\xdc\x5c\xc7\x29\x95\
+\x40\xa5\x9f\x1b\xb9\x60\x7b\x0a\x5b\xeb\x2e\x53\xde\xe6\x5a\xcc\
+\x4a\x33\x11\x63\xc6\x43\x4a\x51\x63\x2d\x94\x44\x77\x85\x74\xab\
+\x78\x34\x72\x74\x27\x79\xb4\x12\xe5\xdb\x72\x42\x43\x39\x06\x37\
+\x01\x66\x31\xa5\x47\x13\xb4\xf0\x90\x73\x6f\xca\xdc\x46\x01\xcb\
+\x26\x01\x1e\xc1\x7b\x1c\x7a\xfe\x7e\x1c\x75\x41\xd4\x95\xa3\x0b\
+\x3d\x2f\x27\xea\x69\xd7\xe1\x6e\x11\x41\xc5\x47\xee\x10\xb2\x7f\
+\xca\x71\xc6\xea\x61\xce\x56\x71\x54\x0f\xef\x8e\xca\x5e\xe4\x25\
+\x8f\xaf\xdd\x77\xfb\x19\x42\xad\xe7\xdc\x75\xa6\xca\xff\x05\xe6\
+\xc7\x1e\x91\xec\x6a\x8a\x48\xdb\x30\x4b\xbc\x14\x34\xd2\x3d\xe1\
+\x6d\x8f\x85\x02\x87\xdb\x10\x94\xa0\xfd\x1a\x48\x22\x8b\x17\xda\
+\x35\x24\xa2\x6c\x86\xab\x67\x6b\x8e\x43\x78\x39\x2c\x39\x1e\x4f\
+\x93\x4f\xbf\x97\x8a\x5a\x7b\x5d\xb1\x94\xcc\x49\x86\x56\x3a\x76\
+\x7e\xa1\x62\xb3\xb8\x41\xd7\x06\x62\xd9\x41\xb5\x78\xdf\x6e\x91\
+\x69\x1b\x51\xf6\x81\x13\xef\x18\x8f\x1d\x3b\x9d\x86\x9e\x1c\x47\
+\xf1\xdc\x8b\x2b\x66\xc0\xc7\xb3\x3a\xee\xf1\xac\xce\xff\xe1\x59\
+\x9d\xde\xf1\xbc\xc9\xaf\x74\xd4\x4f\xff\x3e\xa2\xc8\xc9\x87\xff\
+\xce\xa3\x7e\x69\x97\x39\x7f\xe9\xa3\x7e\xf8\x1f\x57\xf0\xee\x44\
+\xa1\x5d\x40\x24\x62\xd2\xca\x6c\x81\x89\x87\x50\x37\x6d\x7c\x2b\
+\xe5\x51\x19\xe2\x56\x76\xbd\xca\xae\x83\xe5\x37\xf9\x4b\x27\xdc\
+\x08\xa4\xaa\x13\x93\xbd\xe1\x81\xd3\x22\xcf\x92\x41\xf3\xee\xe8\
+\x5d\xca\xe1\x1a\x29\x9e\x54\x04\x1f\x0e\x52\x24\xa9\x35\x65\x7b\
+\x6a\xb4\x95\xa5\xb6\xd0\x96\x97\x3c\x41\xd8\x8c\xc9\xa4\x07\x8e\
+\xe5\x14\x4b\x3e\xf2\xfb\x92\xe2\x9a\x99\x87\x27\x34\xb5\x28\xa9\
+\xd4\xa2\x0e\x7b\xae\x79\x91\xc7\xd1\x71\x3a\x44\x21\xc9\x8f\x30\
+\x27\x51\x0d\x30\x8e\x5c\x60\xc6\xb0\xca\x16\x61\x76\x9c\x56\x5c\
+\x58\x9b\x0f\x2a\x73\xd7\x6e\x4d\xe4\x0b\x20\x99\xf1\x0e\x91\x84\
+\x19\xe1\x4b\xe5\xbc\x90\x1e\xbb\xd2\xe6\x3c\xd9\xcb\xcc\xca\xa7\
+\xfa\x56\x46\x25\x44\xbd\x51\x7c\x01\x32\xfb\xce\x7f\x1f\x20\x5d\
+\x6e\x3b\xab\x0e\xf9\x93\x10\x6d\xeb\x8f\xbf\x90\xe2\x78\x29\x0d\
+\xee\x3b\xcc\x0d\x64\x2a\xc0\x8f\xac\x64\x3b\x0b\x59\xdd\xfb\x1c\
+\x7b\xa2\xb2\xff\x22\xfb\x2c\xb9\x79\xaf\x7f\x36\x74\x7e\x1c\x02\
+\x08\xd9\x26\x1d\xff\xca\x7d\x36\xfc\x9b\x82\x95\xcd\x8e\x2e\x27\
+\xef\x0f\x9f\x88\x93\xfd\x8e\xce\xae\x5c\x90\x46\xc5\x78\x8c\x5b\
+\x55\x73\x54\x96\xe5\x29\xb3\x3e\x20\x4d\xad\xc6\x65\x39\xbe\x6f\
+\x8a\xb3\x4f\xaf\x8c\x54\x7e\x5f\x66\xbb\xf8\xe9\x3a\x0b\xa9\x3e\
+\x9f\x3e\x79\xf9\xec\x9b\xa7\xf8\x5f\x83\x3e\xfb\xe6\xdf\x3a\xf2\
+\xca\x7b\
+\x00\x00\x05\x74\
+\x66\
+\x72\x6f\x6d\x20\x70\x6c\x6f\x76\x65\x72\x2e\x73\x74\x65\x6e\x6f\
+\x20\x69\x6d\x70\x6f\x72\x74\x20\x53\x74\x72\x6f\x6b\x65\x0a\x0a\
+\x66\x72\x6f\x6d\x20\x74\x79\x70\x69\x6e\x67\x20\x69\x6d\x70\x6f\
+\x72\x74\x20\x4c\x69\x73\x74\x2c\x20\x54\x75\x70\x6c\x65\x0a\x0a\
+\x23\x20\x45\x61\x63\x68\x20\x72\x6f\x77\x20\x69\x73\x20\x28\x6b\
+\x65\x79\x2c\x20\x49\x44\x20\x64\x72\x61\x77\x6e\x20\x77\x68\x65\
+\x6e\x20\x70\x72\x65\x73\x73\x65\x64\x2c\x20\x49\x44\x20\x64\x72\
+\x61\x77\x6e\x20\x77\x68\x65\x6e\x20\x72\x65\x6c\x65\x61\x73\x65\
+\x64\x29\x2e\x20\x41\x20\x73\x63\x72\x69\x70\x74\x0a\x23\x20\x74\
+\x68\x61\x74\x20\x64\x65\x66\x69\x6e\x65\x73\x20\x4b\x45\x59\x53\
+\x20\x77\x69\x74\x68\x6f\x75\x74\x20\x61\x20\x63\x6f\x6e\x76\x65\
+\x72\x74\x5f\x73\x74\x72\x6f\x6b\x65\x20\x66\x75\x6e\x63\x74\x69\
+\x6f\x6e\x20\x69\x73\x20\x63\x6f\x6d\x70\x69\x6c\x65\x64\x20\x69\
+\x6e\x74\x6f\x20\x61\x0a\x23\x20\x6c\x6f\x6f\x6b\x75\x70\x20\x74\
+\x61\x62\x6c\x65\x20\x77\x68\x65\x6e\x20\x69\x74\x20\x69\x73\x20\
+\x6c\x6f\x61\x64\x65\x64\x2e\x0a\x4b\x45\x59\x53\x20\x3d\x20\x5b\
+\x0a\x20\x20\x20\x20\x28\x22\x23\x22\x2c\x20\x22\x6e\x75\x6d\x22\
+\x2c\x20\x22\x6e\x75\x6d\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\
+\x28\x22\x53\x2d\x22\x2c\x20\x22\x6c\x73\x22\x2c\x20\x22\x6c\x73\
+\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x54\x2d\x22\x2c\
+\x20\x22\x6c\x74\x22\x2c\x20\x22\x6c\x74\x5f\x6e\x22\x29\x2c\x0a\
+\x20\x20\x20\x20\x28\x22\x4b\x2d\x22\x2c\x20\x22\x6c\x6b\x22\x2c\
+\x20\x22\x6c\x6b\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\
+\x50\x2d\x22\x2c\x20\x22\x6c\x70\x22\x2c\x20\x22\x6c\x70\x5f\x6e\
+\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x57\x2d\x22\x2c\x20\x22\
+\x6c\x77\x22\x2c\x20\x22\x6c\x77\x5f\x6e\x22\x29\x2c\x0a\x20\x20\
+\x20\x20\x28\x22\x48\x2d\x22\x2c\x20\x22\x6c\x68\x22\x2c\x20\x22\
+\x6c\x68\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x52\x2d\
+\x22\x2c\x20\x22\x6c\x72\x22\x2c\x20\x22\x6c\x72\x5f\x6e\x22\x29\
+\x2c\x0a\x20\x20\x20\x20\x28\x22\x41\x2d\x22\x2c\x20\x22\x6c\x61\
+\x22\x2c\x20\x22\x6c\x61\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\
+\x28\x22\x4f\x2d\x22\x2c\x20\x22\x6c\x6f\x22\x2c\x20\x22\x6c\x6f\
+\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x2a\x22\x2c\x20\
+\x22\x73\x74\x61\x72\x22\x2c\x20\x22\x73\x74\x61\x72\x5f\x6e\x22\
+\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x2d\x45\x22\x2c\x20\x22\x72\
+\x65\x22\x2c\x20\x22\x72\x65\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\
+\x20\x28\x22\x2d\x55\x22\x2c\x20\x22\x72\x75\x22\x2c\x20\x22\x72\
+\x75\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x2d\x46\x22\
+\x2c\x20\x22\x72\x66\x22\x2c\x20\x22\x72\x66\x5f\x6e\x22\x29\x2c\
+\x0a\x20\x20\x20\x20\x28\x22\x2d\x52\x22\x2c\x20\x22\x72\x72\x22\
+\x2c\x20\x22\x72\x72\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\
+\x22\x2d\x50\x22\x2c\x20\x22\x72\x70\x22\x2c\x20\x22\x72\x70\x5f\
+\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x2d\x42\x22\x2c\x20\
+\x22\x72\x62\x22\x2c\x20\x22\x72\x62\x5f\x6e\x22\x29\x2c\x0a\x20\
+\x20\x20\x20\x28\x22\x2d\x4c\x22\x2c\x20\x22\x72\x6c\x22\x2c\x20\
+\x22\x72\x6c\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x2d\
+\x47\x22\x2c\x20\x22\x72\x67\x22\x2c\x20\x22\x72\x67\x5f\x6e\x22\
+\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x2d\x54\x22\x2c\x20\x22\x72\
+\x74\x22\x2c\x20\x22\x72\x74\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\
+\x20\x28\x22\x2d\x53\x22\x2c\x20\x22\x72\x73\x22\x2c\x20\x22\x72\
+\x73\x5f\x6e\x22\x29\x2c\x0a\x20\x20\x20\x20\x28\x22\x2d\x44\x22\
+\x2c\x20\x22\x72\x64\x22\x2c\x20\x22\x72\x64\x5f\x6e\x22\x29\x2c\
+\x0a\x20\x20\x20\x20\x28\x22\x2d\x5a\x22\x2c\x20\x22\x72\x7a\x22\
+\x2c\x20\x22\x72\x7a\x5f\x6e\x22\x29\x0a\x5d\x0a\x0a\x23\x20\x47\
+\x72\x6f\x75\x70\x73\x20\x64\x72\x61\x77\x6e\x20\x62\x79\x20\x74\
+\x68\x65\x20\x62\x61\x74\x63\x68\x65\x64\x20\x66\x6f\x72\x6d\x20\
+\x62\x65\x6c\x6f\x77\x2c\x20\x69\x6e\x20\x64\x72\x61\x77\x69\x6e\
+\x67\x20\x6f\x72\x64\x65\x72\x3a\x20\x74\x68\x65\x20\x70\x72\x65\
+\x73\x73\x65\x64\x20\x61\x6e\x64\x0a\x23\x20\x72\x65\x6c\x65\x61\
+\x73\x65\x64\x20\x49\x44\x73\x20\x6f\x66\x20\x65\x61\x63\x68\x20\
+\x6b\x65\x79\x20\x69\x6e\x20\x74\x75\x72\x6e\x0a\x47\x52\x4f\x55\
+\x50\x53\x20\x3d\x20\x5b\x67\x72\x6f\x75\x70\x5f\x69\x64\x20\x66\
+\x6f\x72\x20\x5f\x2c\x20\x70\x72\x65\x73\x73\x65\x64\x2c\x20\x72\
+\x65\x6c\x65\x61\x73\x65\x64\x20\x69\x6e\x20\x4b\x45\x59\x53\x20\
+\x66\x6f\x72\x20\x67\x72\x6f\x75\x70\x5f\x69\x64\x20\x69\x6e\x20\
+\x28\x70\x72\x65\x73\x73\x65\x64\x2c\x20\x72\x65\x6c\x65\x61\x73\
+\x65\x64\x29\x5d\x0a\x0a\x0a\x64\x65\x66\x20\x63\x6f\x6e\x76\x65\
+\x72\x74\x5f\x73\x74\x72\x6f\x6b\x65\x73\x28\x6b\x65\x79\x73\x29\
+\x3a\x0a\x20\x20\x20\x20\x23\x20\x54\x61\x6b\x65\x73\x20\x61\x20\
+\x62\x6f\x6f\x6c\x65\x61\x6e\x20\x6d\x61\x74\x72\x69\x78\x20\x77\
+\x69\x74\x68\x20\x6f\x6e\x65\x20\x72\x6f\x77\x20\x70\x65\x72\x20\
+\x73\x74\x72\x6f\x6b\x65\x20\x61\x6e\x64\x20\x6f\x6e\x65\x20\x63\
+\x6f\x6c\x75\x6d\x6e\x20\x70\x65\x72\x20\x6b\x65\x79\x0a\x20\x20\
+\x20\x20\x23\x20\x6f\x66\x20\x4b\x45\x59\x53\x2c\x20\x61\x6e\x64\
+\x20\x72\x65\x74\x75\x72\x6e\x73\x20\x6f\x6e\x65\x20\x77\x69\x74\
+\x68\x20\x61\x20\x63\x6f\x6c\x75\x6d\x6e\x20\x70\x65\x72\x20\x65\
+\x6e\x74\x72\x79\x20\x6f\x66\x20\x47\x52\x4f\x55\x50\x53\x0a\x20\
+\x20\x20\x20\x69\x6d\x70\x6f\x72\x74\x20\x6e\x75\x6d\x70\x79\x0a\
+\x0a\x20\x20\x20\x20\x67\x72\x6f\x75\x70\x73\x20\x3d\x20\x6e\x75\
+\x6d\x70\x79\x2e\x65\x6d\x70\x74\x79\x28\x28\x6b\x65\x79\x73\x2e\
+\x73\x68\x61\x70\x65\x5b\x30\x5d\x2c\x20\x32\x20\x2a\x20\x6b\x65\
+\x79\x73\x2e\x73\x68\x61\x70\x65\x5b\x31\x5d\x29\x2c\x20\x64\x74\
+\x79\x70\x65\x3d\x62\x6f\x6f\x6c\x29\x0a\x20\x20\x20\x20\x67\x72\
+\x6f\x75\x70\x73\x5b\x3a\x2c\x20\x30\x3a\x3a\x32\x5d\x20\x3d\x20\
+\x6b\x65\x79\x73\x0a\x20\x20\x20\x20\x67\x72\x6f\x75\x70\x73\x5b\
+\x3a\x2c\x20\x31\x3a\x3a\x32\x5d\x20\x3d\x20\x7e\x6b\x65\x79\x73\
+\x0a\x20\x20\x20\x20\x72\x65\x74\x75\x72\x6e\x20\x67\x72\x6f\x75\
+\x70\x73\x0a\
+\x00\x00\x11\xd8\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
+\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
+\x6e\x6f\x22\x3f\x3e\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x76\x65\
+\x72\x73\x69\x6f\x6e\x3d\x22\x31\x22\x0a\x20\x20\x20\x76\x69\x65\
+\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x34\x38\x20\x34\x38\x22\
+\x0a\x20\x20\x20\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\
+\x72\x6f\x75\x6e\x64\x3d\x22\x6e\x65\x77\x20\x30\x20\x30\x20\x34\
+\x38\x20\x34\x38\x22\x0a\x20\x20\x20\x69\x64\x3d\x22\x73\x76\x67\
+\x31\x30\x22\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x0a\x20\x20\x20\
+\x20\x20\x69\x64\x3d\x22\x6b\x65\x79\x22\x0a\x20\x20\x20\x20\x20\
+\x73\x74\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x23\x65\x39\x64\
+\x39\x66\x32\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x31\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x23\x37\x31\x30\x39\x61\
+\x61\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x31\
+\x2e\x38\x38\x39\x37\x36\x3b\x73\x74\x72\x6f\x6b\x65\x2d\x6f\x70\
+\x61\x63\x69\x74\x79\x3a\x31\x22\x0a\x20\x20\x20\x20\x20\x64\x3d\
+\x22\x6d\x20\x37\x2e\x38\x36\x37\x30\x39\x35\x31\x2c\x33\x2e\x37\
+\x34\x32\x30\x33\x32\x35\x20\x63\x20\x2d\x30\x2e\x34\x33\x32\x34\
+\x36\x32\x31\x2c\x30\x20\x2d\x30\x2e\x37\x37\x39\x38\x38\x38\x39\
+\x2c\x30\x2e\x33\x34\x39\x37\x33\x32\x31\x20\x2d\x30\x2e\x37\x37\
+\x39\x38\x38\x38\x39\x2c\x30\x2e\x37\x38\x33\x33\x37\x34\x38\x20\
+\x56\x20\x33\x31\x2e\x36\x36\x30\x33\x38\x20\x63\x20\x30\x2c\x30\
+\x2e\x34\x33\x33\x36\x34\x33\x20\x30\x2e\x33\x34\x37\x34\x32\x36\
+\x38\x2c\x30\x2e\x37\x38\x32\x30\x31\x38\x20\x30\x2e\x37\x37\x39\
+\x38\x38\x38\x39\x2c\x30\x2e\x37\x38\x32\x30\x31\x38\x20\x68\x20\
+\x37\x2e\x30\x38\x32\x32\x38\x31\x39\x20\x63\x20\x30\x2e\x36\x31\
+\x33\x36\x36\x39\x2c\x36\x2e\x36\x34\x36\x39\x31\x39\x20\x36\x2e\
+\x31\x35\x38\x35\x37\x36\x2c\x31\x31\x2e\x38\x31\x36\x37\x31\x33\
+\x20\x31\x32\x2e\x39\x35\x33\x30\x34\x34\x2c\x31\x31\x2e\x38\x31\
+\x36\x37\x31\x33\x20\x37\x2e\x30\x30\x39\x32\x31\x36\x2c\x30\x20\
+\x31\x32\x2e\x36\x38\x39\x38\x34\x37\x2c\x2d\x35\x2e\x35\x30\x32\
+\x31\x37\x35\x20\x31\x32\x2e\x39\x39\x37\x33\x35\x38\x2c\x2d\x31\
+\x32\x2e\x34\x35\x31\x37\x35\x37\x20\x30\x2e\x30\x30\x37\x38\x2c\
+\x2d\x30\x2e\x30\x34\x37\x37\x35\x20\x30\x2e\x30\x31\x33\x30\x31\
+\x2c\x2d\x30\x2e\x30\x39\x36\x35\x34\x20\x30\x2e\x30\x31\x33\x30\
+\x31\x2c\x2d\x30\x2e\x31\x34\x36\x38\x39\x36\x20\x56\x20\x33\x31\
+\x2e\x32\x31\x34\x31\x36\x31\x20\x34\x2e\x35\x32\x35\x34\x38\x35\
+\x36\x20\x63\x20\x30\x2c\x2d\x30\x2e\x31\x38\x39\x36\x38\x36\x31\
+\x20\x2d\x30\x2e\x30\x36\x36\x33\x35\x2c\x2d\x30\x2e\x33\x36\x33\
+\x36\x39\x31\x31\x20\x2d\x30\x2e\x31\x37\x37\x34\x36\x2c\x2d\x30\
+\x2e\x34\x39\x38\x38\x39\x37\x39\x20\x2d\x30\x2e\x30\x31\x35\x36\
+\x31\x2c\x2d\x30\x2e\x30\x31\x38\x32\x36\x34\x20\x2d\x30\x2e\x30\
+\x33\x32\x35\x33\x2c\x2d\x30\x2e\x30\x33\x38\x30\x39\x34\x20\x2d\
+\x30\x2e\x30\x34\x39\x37\x2c\x2d\x30\x2e\x30\x35\x35\x33\x31\x34\
+\x20\x2d\x30\x2e\x30\x35\x32\x38\x32\x2c\x2d\x30\x2e\x30\x35\x33\
+\x32\x32\x37\x20\x2d\x30\x2e\x31\x31\x33\x37\x31\x2c\x2d\x30\x2e\
+\x30\x39\x38\x36\x32\x36\x20\x2d\x30\x2e\x31\x38\x30\x30\x36\x33\
+\x2c\x2d\x30\x2e\x31\x33\x34\x38\x39\x33\x37\x20\x2d\x30\x2e\x30\
+\x33\x38\x32\x35\x2c\x2d\x30\x2e\x30\x32\x30\x38\x37\x33\x20\x2d\
+\x30\x2e\x30\x37\x39\x33\x36\x2c\x2d\x30\x2e\x30\x33\x38\x33\x35\
+\x35\x20\x2d\x30\x2e\x31\x32\x30\x39\x39\x35\x2c\x2d\x30\x2e\x30\
+\x35\x32\x37\x30\x35\x20\x2d\x30\x2e\x30\x30\x35\x32\x2c\x2d\x30\
+\x2e\x30\x30\x32\x30\x36\x20\x2d\x30\x2e\x30\x31\x33\x30\x31\x2c\
+\x2d\x30\x2e\x30\x30\x35\x32\x32\x20\x2d\x30\x2e\x30\x31\x38\x32\
+\x31\x2c\x2d\x30\x2e\x30\x30\x37\x38\x33\x20\x2d\x33\x2e\x39\x65\
+\x2d\x34\x2c\x2d\x31\x2e\x33\x30\x34\x65\x2d\x34\x20\x2d\x36\x2e\
+\x37\x36\x65\x2d\x34\x2c\x31\x2e\x33\x30\x35\x65\x2d\x34\x20\x2d\
+\x30\x2e\x30\x30\x31\x34\x2c\x30\x20\x2d\x30\x2e\x30\x37\x33\x31\
+\x32\x2c\x2d\x30\x2e\x30\x32\x33\x34\x38\x32\x20\x2d\x30\x2e\x31\
+\x35\x30\x36\x35\x39\x2c\x2d\x30\x2e\x30\x33\x34\x39\x36\x33\x20\
+\x2d\x30\x2e\x32\x33\x31\x33\x32\x33\x2c\x2d\x30\x2e\x30\x33\x34\
+\x39\x36\x33\x20\x7a\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x67\x0a\x20\
+\x20\x20\x20\x20\x61\x72\x69\x61\x2d\x6c\x61\x62\x65\x6c\x3d\x22\
+\x53\x56\x47\x22\x0a\x20\x20\x20\x20\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x73\x63\x61\x6c\x65\x28\x30\x2e\x39\x39\x38\
+\x36\x33\x37\x36\x37\x2c\x31\x2e\x30\x30\x31\x33\x36\x34\x32\x29\
+\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x74\x65\x78\x74\x22\
+\x0a\x20\x20\x20\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x6f\x6e\
+\x74\x2d\x77\x65\x69\x67\x68\x74\x3a\x36\x30\x30\x3b\x66\x6f\x6e\
+\x74\x2d\x73\x69\x7a\x65\x3a\x31\x34\x2e\x37\x30\x37\x32\x70\x78\
+\x3b\x6c\x69\x6e\x65\x2d\x68\x65\x69\x67\x68\x74\x3a\x31\x2e\x32\
+\x35\x3b\x66\x6f\x6e\x74\x2d\x66\x61\x6d\x69\x6c\x79\x3a\x27\x49\
+\x6f\x73\x65\x76\x6b\x61\x20\x54\x65\x72\x6d\x27\x3b\x74\x65\x78\
+\x74\x2d\x61\x6c\x69\x67\x6e\x3a\x63\x65\x6e\x74\x65\x72\x3b\x74\
+\x65\x78\x74\x2d\x61\x6e\x63\x68\x6f\x72\x3a\x6d\x69\x64\x64\x6c\
+\x65\x3b\x66\x69\x6c\x6c\x3a\x23\x37\x31\x30\x39\x61\x61\x3b\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x2e\x39\x39\
+\x39\x39\x39\x38\x22\x3e\x0a\x20\x20\x20\x20\x3c\x70\x61\x74\x68\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x64\x3d\x22\x6d\x20\x31\x36\x2e\
+\x36\x34\x32\x33\x34\x32\x2c\x32\x34\x2e\x31\x31\x36\x35\x30\x32\
+\x20\x71\x20\x30\x2e\x36\x30\x32\x39\x39\x35\x2c\x30\x20\x31\x2e\
+\x31\x37\x36\x35\x37\x36\x2c\x2d\x30\x2e\x31\x37\x36\x34\x38\x37\
+\x20\x30\x2e\x35\x37\x33\x35\x38\x31\x2c\x2d\x30\x2e\x31\x37\x36\
+\x34\x38\x36\x20\x31\x2e\x30\x30\x30\x30\x38\x39\x2c\x2d\x30\x2e\
+\x36\x30\x32\x39\x39\x35\x20\x30\x2e\x34\x34\x31\x32\x31\x36\x2c\
+\x2d\x30\x2e\x34\x32\x36\x35\x30\x39\x20\x30\x2e\x36\x34\x37\x31\
+\x31\x37\x2c\x2d\x30\x2e\x39\x38\x35\x33\x38\x32\x20\x30\x2e\x32\
+\x32\x30\x36\x30\x38\x2c\x2d\x30\x2e\x35\x37\x33\x35\x38\x31\x20\
+\x30\x2e\x32\x32\x30\x36\x30\x38\x2c\x2d\x31\x2e\x31\x36\x31\x38\
+\x36\x39\x20\x30\x2c\x2d\x30\x2e\x35\x37\x33\x35\x38\x31\x20\x2d\
+\x30\x2e\x32\x33\x35\x33\x31\x35\x2c\x2d\x31\x2e\x31\x31\x37\x37\
+\x34\x37\x20\x2d\x30\x2e\x32\x32\x30\x36\x30\x38\x2c\x2d\x30\x2e\
+\x35\x34\x34\x31\x36\x37\x20\x2d\x30\x2e\x36\x33\x32\x34\x31\x2c\
+\x2d\x30\x2e\x39\x35\x35\x39\x36\x38\x20\x2d\x30\x2e\x33\x39\x37\
+\x30\x39\x34\x2c\x2d\x30\x2e\x34\x31\x31\x38\x30\x32\x20\x2d\x30\
+\x2e\x38\x39\x37\x31\x33\x39\x2c\x2d\x30\x2e\x37\x30\x35\x39\x34\
+\x36\x20\x2d\x30\x2e\x34\x38\x35\x33\x33\x37\x2c\x2d\x30\x2e\x32\
+\x39\x34\x31\x34\x34\x20\x2d\x30\x2e\x39\x38\x35\x33\x38\x32\x2c\
+\x2d\x30\x2e\x35\x35\x38\x38\x37\x33\x20\x68\x20\x2d\x30\x2e\x30\
+\x31\x34\x37\x31\x20\x71\x20\x2d\x30\x2e\x33\x39\x37\x30\x39\x35\
+\x2c\x2d\x30\x2e\x31\x39\x31\x31\x39\x34\x20\x2d\x30\x2e\x37\x36\
+\x34\x37\x37\x35\x2c\x2d\x30\x2e\x34\x32\x36\x35\x30\x39\x20\x2d\
+\x30\x2e\x33\x35\x32\x39\x37\x33\x2c\x2d\x30\x2e\x32\x35\x30\x30\
+\x32\x33\x20\x2d\x30\x2e\x35\x37\x33\x35\x38\x31\x2c\x2d\x30\x2e\
+\x36\x33\x32\x34\x31\x20\x2d\x30\x2e\x32\x32\x30\x36\x30\x38\x2c\
+\x2d\x30\x2e\x33\x39\x37\x30\x39\x34\x20\x2d\x30\x2e\x32\x32\x30\
+\x36\x30\x38\x2c\x2d\x30\x2e\x38\x32\x33\x36\x30\x33\x20\x30\x2c\
+\x2d\x30\x2e\x33\x36\x37\x36\x38\x20\x30\x2e\x31\x34\x37\x30\x37\
+\x32\x2c\x2d\x30\x2e\x37\x32\x30\x36\x35\x33\x20\x30\x2e\x31\x34\
+\x37\x30\x37\x32\x2c\x2d\x30\x2e\x33\x36\x37\x36\x38\x20\x30\x2e\
+\x34\x37\x30\x36\x33\x31\x2c\x2d\x30\x2e\x35\x35\x38\x38\x37\x33\
+\x20\x30\x2e\x33\x33\x38\x32\x36\x35\x2c\x2d\x30\x2e\x31\x39\x31\
+\x31\x39\x34\x20\x30\x2e\x37\x32\x30\x36\x35\x33\x2c\x2d\x30\x2e\
+\x31\x39\x31\x31\x39\x34\x20\x30\x2e\x33\x35\x32\x39\x37\x32\x2c\
+\x30\x20\x30\x2e\x36\x36\x31\x38\x32\x34\x2c\x30\x2e\x31\x36\x31\
+\x37\x37\x39\x20\x30\x2e\x33\x32\x33\x35\x35\x38\x2c\x30\x2e\x31\
+\x36\x31\x37\x37\x39\x20\x30\x2e\x34\x37\x30\x36\x33\x2c\x30\x2e\
+\x34\x38\x35\x33\x33\x38\x20\x30\x2e\x31\x36\x31\x37\x37\x39\x2c\
+\x30\x2e\x33\x32\x33\x35\x35\x38\x20\x30\x2e\x31\x36\x31\x37\x37\
+\x39\x2c\x30\x2e\x36\x37\x36\x35\x33\x31\x20\x68\x20\x31\x2e\x35\
+\x38\x38\x33\x37\x38\x20\x71\x20\x30\x2c\x2d\x30\x2e\x35\x35\x38\
+\x38\x37\x34\x20\x2d\x30\x2e\x32\x30\x35\x39\x30\x31\x2c\x2d\x31\
+\x2e\x30\x38\x38\x33\x33\x33\x20\x2d\x30\x2e\x31\x39\x31\x31\x39\
+\x34\x2c\x2d\x30\x2e\x35\x34\x34\x31\x36\x36\x20\x2d\x30\x2e\x36\
+\x30\x32\x39\x39\x35\x2c\x2d\x30\x2e\x39\x34\x31\x32\x36\x31\x20\
+\x2d\x30\x2e\x34\x31\x31\x38\x30\x32\x2c\x2d\x30\x2e\x33\x39\x37\
+\x30\x39\x34\x20\x2d\x30\x2e\x39\x37\x30\x36\x37\x35\x2c\x2d\x30\
+\x2e\x35\x35\x38\x38\x37\x33\x20\x2d\x30\x2e\x35\x34\x34\x31\x36\
+\x37\x2c\x2d\x30\x2e\x31\x36\x31\x37\x37\x39\x20\x2d\x31\x2e\x31\
+\x30\x33\x30\x34\x2c\x2d\x30\x2e\x31\x36\x31\x37\x37\x39\x20\x2d\
+\x30\x2e\x35\x38\x38\x32\x38\x38\x2c\x30\x20\x2d\x31\x2e\x31\x34\
+\x37\x31\x36\x32\x2c\x30\x2e\x31\x37\x36\x34\x38\x36\x20\x2d\x30\
+\x2e\x35\x35\x38\x38\x37\x34\x2c\x30\x2e\x31\x37\x36\x34\x38\x36\
+\x20\x2d\x30\x2e\x39\x37\x30\x36\x37\x35\x2c\x30\x2e\x36\x31\x37\
+\x37\x30\x32\x20\x2d\x30\x2e\x34\x31\x31\x38\x30\x32\x2c\x30\x2e\
+\x34\x32\x36\x35\x30\x39\x20\x2d\x30\x2e\x36\x30\x32\x39\x39\x35\
+\x2c\x30\x2e\x39\x38\x35\x33\x38\x33\x20\x2d\x30\x2e\x31\x39\x31\
+\x31\x39\x34\x2c\x30\x2e\x35\x35\x38\x38\x37\x33\x20\x2d\x30\x2e\
+\x31\x39\x31\x31\x39\x34\x2c\x31\x2e\x31\x34\x37\x31\x36\x31\x20\
+\x30\x2c\x30\x2e\x34\x34\x31\x32\x31\x36\x20\x30\x2e\x31\x33\x32\
+\x33\x36\x35\x2c\x30\x2e\x38\x38\x32\x34\x33\x32\x20\x30\x2e\x31\
+\x33\x32\x33\x36\x35\x2c\x30\x2e\x34\x32\x36\x35\x30\x39\x20\x30\
+\x2e\x33\x39\x37\x30\x39\x34\x2c\x30\x2e\x37\x39\x34\x31\x38\x39\
+\x20\x30\x2e\x32\x36\x34\x37\x33\x2c\x30\x2e\x33\x36\x37\x36\x38\
+\x20\x30\x2e\x36\x30\x32\x39\x39\x35\x2c\x30\x2e\x36\x36\x31\x38\
+\x32\x34\x20\x30\x2e\x33\x35\x32\x39\x37\x33\x2c\x30\x2e\x32\x39\
+\x34\x31\x34\x34\x20\x30\x2e\x37\x33\x35\x33\x36\x2c\x30\x2e\x35\
+\x32\x39\x34\x35\x39\x20\x30\x2e\x33\x38\x32\x33\x38\x38\x2c\x30\
+\x2e\x32\x32\x30\x36\x30\x38\x20\x30\x2e\x37\x37\x39\x34\x38\x32\
+\x2c\x30\x2e\x34\x32\x36\x35\x30\x39\x20\x30\x2e\x34\x31\x31\x38\
+\x30\x32\x2c\x30\x2e\x31\x39\x31\x31\x39\x34\x20\x30\x2e\x37\x39\
+\x34\x31\x38\x39\x2c\x30\x2e\x34\x34\x31\x32\x31\x36\x20\x30\x2e\
+\x33\x38\x32\x33\x38\x37\x2c\x30\x2e\x32\x33\x35\x33\x31\x35\x20\
+\x30\x2e\x36\x31\x37\x37\x30\x32\x2c\x30\x2e\x36\x33\x32\x34\x31\
+\x20\x30\x2e\x32\x35\x30\x30\x32\x33\x2c\x30\x2e\x33\x39\x37\x30\
+\x39\x34\x20\x30\x2e\x32\x35\x30\x30\x32\x33\x2c\x30\x2e\x38\x33\
+\x38\x33\x31\x20\x30\x2c\x30\x2e\x33\x39\x37\x30\x39\x35\x20\x2d\
+\x30\x2e\x31\x37\x36\x34\x38\x37\x2c\x30\x2e\x37\x36\x34\x37\x37\
+\x35\x20\x2d\x30\x2e\x31\x36\x31\x37\x37\x39\x2c\x30\x2e\x33\x36\
+\x37\x36\x38\x20\x2d\x30\x2e\x35\x32\x39\x34\x35\x39\x2c\x30\x2e\
+\x35\x34\x34\x31\x36\x36\x20\x2d\x30\x2e\x33\x35\x32\x39\x37\x33\
+\x2c\x30\x2e\x31\x37\x36\x34\x38\x36\x20\x2d\x30\x2e\x37\x35\x30\
+\x30\x36\x37\x2c\x30\x2e\x31\x37\x36\x34\x38\x36\x20\x2d\x30\x2e\
+\x33\x35\x32\x39\x37\x33\x2c\x30\x20\x2d\x30\x2e\x37\x30\x35\x39\
+\x34\x36\x2c\x2d\x30\x2e\x31\x34\x37\x30\x37\x32\x20\x2d\x30\x2e\
+\x33\x33\x38\x32\x36\x35\x2c\x2d\x30\x2e\x31\x34\x37\x30\x37\x32\
+\x20\x2d\x30\x2e\x35\x32\x39\x34\x35\x39\x2c\x2d\x30\x2e\x34\x37\
+\x30\x36\x33\x20\x2d\x30\x2e\x31\x37\x36\x34\x38\x36\x2c\x2d\x30\
+\x2e\x33\x33\x38\x32\x36\x36\x20\x2d\x30\x2e\x31\x37\x36\x34\x38\
+\x36\x2c\x2d\x30\x2e\x36\x39\x31\x32\x33\x38\x20\x68\x20\x2d\x31\
+\x2e\x35\x38\x38\x33\x37\x38\x20\x71\x20\x30\x2c\x30\x2e\x35\x37\
+\x33\x35\x38\x20\x30\x2e\x32\x32\x30\x36\x30\x38\x2c\x31\x2e\x31\
+\x31\x37\x37\x34\x37\x20\x30\x2e\x32\x32\x30\x36\x30\x38\x2c\x30\
+\x2e\x35\x32\x39\x34\x35\x39\x20\x30\x2e\x36\x34\x37\x31\x31\x37\
+\x2c\x30\x2e\x39\x32\x36\x35\x35\x33\x20\x30\x2e\x34\x34\x31\x32\
+\x31\x36\x2c\x30\x2e\x33\x38\x32\x33\x38\x38\x20\x31\x2e\x30\x30\
+\x30\x30\x38\x39\x2c\x30\x2e\x35\x34\x34\x31\x36\x37\x20\x30\x2e\
+\x35\x35\x38\x38\x37\x34\x2c\x30\x2e\x31\x34\x37\x30\x37\x32\x20\
+\x31\x2e\x31\x33\x32\x34\x35\x35\x2c\x30\x2e\x31\x34\x37\x30\x37\
+\x32\x20\x7a\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3d\x22\
+\x70\x61\x74\x68\x36\x30\x35\x31\x22\x20\x2f\x3e\x0a\x20\x20\x20\
+\x20\x3c\x70\x61\x74\x68\x0a\x20\x20\x20\x20\x20\x20\x20\x64\x3d\
+\x22\x6d\x20\x32\x33\x2e\x31\x31\x33\x35\x31\x2c\x32\x33\x2e\x39\
+\x39\x38\x38\x34\x34\x20\x68\x20\x31\x2e\x38\x32\x33\x36\x39\x33\
+\x20\x4c\x20\x32\x37\x2e\x31\x38\x37\x34\x30\x34\x2c\x31\x33\x2e\
+\x31\x38\x39\x30\x35\x32\x20\x48\x20\x32\x35\x2e\x35\x36\x39\x36\
+\x31\x32\x20\x4c\x20\x32\x34\x2e\x32\x31\x36\x35\x35\x2c\x32\x30\
+\x2e\x33\x39\x35\x35\x38\x20\x71\x20\x2d\x30\x2e\x30\x34\x34\x31\
+\x32\x2c\x30\x2e\x32\x35\x30\x30\x32\x33\x20\x2d\x30\x2e\x31\x30\
+\x32\x39\x35\x31\x2c\x30\x2e\x35\x31\x34\x37\x35\x32\x20\x2d\x30\
+\x2e\x30\x34\x34\x31\x32\x2c\x30\x2e\x32\x35\x30\x30\x32\x33\x20\
+\x2d\x30\x2e\x30\x38\x38\x32\x34\x2c\x30\x2e\x35\x30\x30\x30\x34\
+\x35\x20\x2d\x30\x2e\x30\x34\x34\x31\x32\x2c\x2d\x30\x2e\x32\x35\
+\x30\x30\x32\x32\x20\x2d\x30\x2e\x31\x30\x32\x39\x35\x2c\x2d\x30\
+\x2e\x35\x30\x30\x30\x34\x35\x20\x2d\x30\x2e\x30\x34\x34\x31\x32\
+\x2c\x2d\x30\x2e\x32\x36\x34\x37\x32\x39\x20\x2d\x30\x2e\x30\x38\
+\x38\x32\x34\x2c\x2d\x30\x2e\x35\x31\x34\x37\x35\x32\x20\x6c\x20\
+\x2d\x31\x2e\x33\x33\x38\x33\x35\x36\x2c\x2d\x37\x2e\x32\x30\x36\
+\x35\x32\x38\x20\x68\x20\x2d\x31\x2e\x36\x33\x32\x34\x39\x39\x20\
+\x7a\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\
+\x74\x68\x36\x30\x35\x33\x22\x20\x2f\x3e\x0a\x20\x20\x20\x20\x3c\
+\x70\x61\x74\x68\x0a\x20\x20\x20\x20\x20\x20\x20\x64\x3d\x22\x6d\
+\x20\x33\x30\x2e\x37\x33\x31\x38\x34\x2c\x32\x34\x2e\x31\x31\x36\
+\x35\x30\x32\x20\x71\x20\x30\x2e\x35\x30\x30\x30\x34\x34\x2c\x30\
+\x20\x30\x2e\x39\x35\x35\x39\x36\x38\x2c\x2d\x30\x2e\x32\x32\x30\
+\x36\x30\x38\x20\x30\x2e\x34\x37\x30\x36\x33\x2c\x2d\x30\x2e\x32\
+\x32\x30\x36\x30\x38\x20\x30\x2e\x37\x33\x35\x33\x36\x2c\x2d\x30\
+\x2e\x36\x34\x37\x31\x31\x37\x20\x30\x2e\x32\x37\x39\x34\x33\x36\
+\x2c\x2d\x30\x2e\x34\x32\x36\x35\x30\x39\x20\x30\x2e\x34\x31\x31\
+\x38\x30\x31\x2c\x2d\x30\x2e\x39\x31\x31\x38\x34\x36\x20\x76\x20\
+\x31\x2e\x36\x36\x31\x39\x31\x33\x20\x68\x20\x31\x2e\x34\x32\x36\
+\x35\x39\x39\x20\x76\x20\x2d\x35\x2e\x39\x38\x35\x38\x33\x20\x68\
+\x20\x2d\x32\x2e\x38\x38\x32\x36\x31\x32\x20\x76\x20\x31\x2e\x34\
+\x32\x36\x35\x39\x38\x20\x68\x20\x31\x2e\x32\x39\x34\x32\x33\x34\
+\x20\x76\x20\x31\x2e\x35\x37\x33\x36\x37\x31\x20\x71\x20\x30\x2c\
+\x30\x2e\x32\x39\x34\x31\x34\x34\x20\x2d\x30\x2e\x30\x35\x38\x38\
+\x33\x2c\x30\x2e\x36\x30\x32\x39\x39\x35\x20\x2d\x30\x2e\x30\x35\
+\x38\x38\x33\x2c\x30\x2e\x32\x39\x34\x31\x34\x34\x20\x2d\x30\x2e\
+\x32\x32\x30\x36\x30\x38\x2c\x30\x2e\x35\x35\x38\x38\x37\x33\x20\
+\x2d\x30\x2e\x31\x36\x31\x37\x37\x39\x2c\x30\x2e\x32\x35\x30\x30\
+\x32\x33\x20\x2d\x30\x2e\x34\x34\x31\x32\x31\x36\x2c\x30\x2e\x33\
+\x38\x32\x33\x38\x38\x20\x2d\x30\x2e\x32\x36\x34\x37\x32\x39\x2c\
+\x30\x2e\x31\x33\x32\x33\x36\x34\x20\x2d\x30\x2e\x35\x37\x33\x35\
+\x38\x31\x2c\x30\x2e\x31\x33\x32\x33\x36\x34\x20\x2d\x30\x2e\x33\
+\x30\x38\x38\x35\x31\x2c\x30\x20\x2d\x30\x2e\x36\x30\x32\x39\x39\
+\x35\x2c\x2d\x30\x2e\x31\x31\x37\x36\x35\x37\x20\x2d\x30\x2e\x32\
+\x39\x34\x31\x34\x34\x2c\x2d\x30\x2e\x31\x31\x37\x36\x35\x38\x20\
+\x2d\x30\x2e\x34\x38\x35\x33\x33\x37\x2c\x2d\x30\x2e\x33\x36\x37\
+\x36\x38\x20\x2d\x30\x2e\x31\x39\x31\x31\x39\x34\x2c\x2d\x30\x2e\
+\x32\x36\x34\x37\x33\x20\x2d\x30\x2e\x32\x36\x34\x37\x33\x2c\x2d\
+\x30\x2e\x35\x37\x33\x35\x38\x31\x20\x2d\x30\x2e\x30\x35\x38\x38\
+\x33\x2c\x2d\x30\x2e\x33\x30\x38\x38\x35\x31\x20\x2d\x30\x2e\x30\
+\x35\x38\x38\x33\x2c\x2d\x30\x2e\x36\x31\x37\x37\x30\x32\x20\x76\
+\x20\x2d\x34\x2e\x38\x33\x38\x36\x36\x39\x20\x71\x20\x30\x2c\x2d\
+\x30\x2e\x33\x30\x38\x38\x35\x31\x20\x30\x2e\x30\x35\x38\x38\x33\
+\x2c\x2d\x30\x2e\x36\x30\x32\x39\x39\x35\x20\x30\x2e\x30\x37\x33\
+\x35\x34\x2c\x2d\x30\x2e\x33\x30\x38\x38\x35\x32\x20\x30\x2e\x32\
+\x35\x30\x30\x32\x32\x2c\x2d\x30\x2e\x35\x35\x38\x38\x37\x34\x20\
+\x30\x2e\x31\x39\x31\x31\x39\x34\x2c\x2d\x30\x2e\x32\x36\x34\x37\
+\x33\x20\x30\x2e\x34\x37\x30\x36\x33\x31\x2c\x2d\x30\x2e\x33\x38\
+\x32\x33\x38\x37\x20\x30\x2e\x32\x39\x34\x31\x34\x34\x2c\x2d\x30\
+\x2e\x31\x33\x32\x33\x36\x35\x20\x30\x2e\x36\x30\x32\x39\x39\x35\
+\x2c\x2d\x30\x2e\x31\x33\x32\x33\x36\x35\x20\x30\x2e\x33\x35\x32\
+\x39\x37\x33\x2c\x30\x20\x30\x2e\x36\x37\x36\x35\x33\x31\x2c\x30\
+\x2e\x31\x34\x37\x30\x37\x32\x20\x30\x2e\x33\x33\x38\x32\x36\x36\
+\x2c\x30\x2e\x31\x34\x37\x30\x37\x32\x20\x30\x2e\x35\x30\x30\x30\
+\x34\x35\x2c\x30\x2e\x34\x38\x35\x33\x33\x38\x20\x30\x2e\x31\x37\
+\x36\x34\x38\x36\x2c\x30\x2e\x33\x32\x33\x35\x35\x38\x20\x30\x2e\
+\x31\x37\x36\x34\x38\x36\x2c\x30\x2e\x36\x37\x36\x35\x33\x31\x20\
+\x68\x20\x31\x2e\x35\x38\x38\x33\x37\x38\x20\x71\x20\x30\x2c\x2d\
+\x30\x2e\x35\x37\x33\x35\x38\x31\x20\x2d\x30\x2e\x32\x30\x35\x39\
+\x30\x31\x2c\x2d\x31\x2e\x31\x30\x33\x30\x34\x20\x2d\x30\x2e\x32\
+\x30\x35\x39\x30\x31\x2c\x2d\x30\x2e\x35\x34\x34\x31\x36\x37\x20\
+\x2d\x30\x2e\x36\x33\x32\x34\x30\x39\x2c\x2d\x30\x2e\x39\x32\x36\
+\x35\x35\x34\x20\x2d\x30\x2e\x34\x32\x36\x35\x30\x39\x2c\x2d\x30\
+\x2e\x33\x39\x37\x30\x39\x34\x20\x2d\x30\x2e\x39\x38\x35\x33\x38\
+\x33\x2c\x2d\x30\x2e\x35\x34\x34\x31\x36\x36\x20\x2d\x30\x2e\x35\
+\x35\x38\x38\x37\x33\x2c\x2d\x30\x2e\x31\x36\x31\x37\x37\x39\x20\
+\x2d\x31\x2e\x31\x31\x37\x37\x34\x37\x2c\x2d\x30\x2e\x31\x36\x31\
+\x37\x37\x39\x20\x2d\x30\x2e\x34\x38\x35\x33\x33\x38\x2c\x30\x20\
+\x2d\x30\x2e\x39\x37\x30\x36\x37\x35\x2c\x30\x2e\x31\x31\x37\x36\
+\x35\x37\x20\x2d\x30\x2e\x34\x38\x35\x33\x33\x38\x2c\x30\x2e\x31\
+\x30\x32\x39\x35\x31\x20\x2d\x30\x2e\x38\x38\x32\x34\x33\x32\x2c\
+\x30\x2e\x33\x39\x37\x30\x39\x35\x20\x2d\x30\x2e\x33\x39\x37\x30\
+\x39\x35\x2c\x30\x2e\x32\x39\x34\x31\x34\x34\x20\x2d\x30\x2e\x36\
+\x36\x31\x38\x32\x34\x2c\x30\x2e\x37\x32\x30\x36\x35\x32\x20\x2d\
+\x30\x2e\x32\x35\x30\x30\x32\x33\x2c\x30\x2e\x34\x31\x31\x38\x30\
+\x32\x20\x2d\x30\x2e\x33\x35\x32\x39\x37\x33\x2c\x30\x2e\x38\x39\
+\x37\x31\x34\x20\x2d\x30\x2e\x31\x30\x32\x39\x35\x2c\x30\x2e\x34\
+\x38\x35\x33\x33\x37\x20\x2d\x30\x2e\x31\x30\x32\x39\x35\x2c\x30\
+\x2e\x39\x37\x30\x36\x37\x35\x20\x76\x20\x34\x2e\x38\x33\x38\x36\
+\x36\x39\x20\x71\x20\x30\x2c\x30\x2e\x34\x34\x31\x32\x31\x36\x20\
+\x30\x2e\x30\x35\x38\x38\x33\x2c\x30\x2e\x38\x38\x32\x34\x33\x32\
+\x20\x30\x2e\x30\x37\x33\x35\x34\x2c\x30\x2e\x34\x32\x36\x35\x30\
+\x38\x20\x30\x2e\x32\x33\x35\x33\x31\x36\x2c\x30\x2e\x38\x33\x38\
+\x33\x31\x20\x30\x2e\x31\x37\x36\x34\x38\x36\x2c\x30\x2e\x34\x31\
+\x31\x38\x30\x32\x20\x30\x2e\x34\x37\x30\x36\x33\x2c\x30\x2e\x37\
+\x35\x30\x30\x36\x37\x20\x30\x2e\x33\x30\x38\x38\x35\x31\x2c\x30\
+\x2e\x33\x32\x33\x35\x35\x39\x20\x30\x2e\x37\x32\x30\x36\x35\x33\
+\x2c\x30\x2e\x34\x38\x35\x33\x33\x38\x20\x30\x2e\x34\x32\x36\x35\
+\x30\x39\x2c\x30\x2e\x31\x34\x37\x30\x37\x32\x20\x30\x2e\x38\x36\
+\x37\x37\x32\x35\x2c\x30\x2e\x31\x34\x37\x30\x37\x32\x20\x7a\x22\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\x74\x68\
+\x36\x30\x35\x35\x22\x20\x2f\x3e\x0a\x20\x20\x3c\x2f\x67\x3e\x0a\
+\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x10\x03\
+\x00\
+\x00\x66\xa9\x78\x9c\xed\x1d\x6b\x6f\x1c\xb9\xed\xfb\xfd\x0a\xc1\
+\xfd\x56\x60\x26\x7a\x6b\xa6\x48\xae\x68\xd1\x17\xd0\x02\x2d\xfa\
+\x40\x81\x7e\x29\x7c\x89\x2f\x36\x6e\xf3\x58\xc7\xe7\xb4\xf9\xf5\
+\x25\x29\x52\xe2\xcc\x78\x37\x77\x4d\x37\xa8\x1d\xa3\xc0\x6d\x38\
+\xd2\x48\x14\xdf\xa4\x38\xee\xd3\x9f\xff\xeb\xd5\xce\xdc\x5e\x5c\
+\xbf\xbb\x7a\xf3\xfa\xd9\x99\x1b\xed\x99\xb9\x78\xfd\xfc\xcd\x8b\
+\xab\xd7\x2f\x9f\x9d\xfd\xed\xaf\xbf\x19\xa6\xb3\x9f\x7f\xfd\xd5\
+\xd3\x77\xb7\x2f\xcd\xfb\xab\x17\x37\x97\x30\x27\x4e\xaf\x5e\x9d\
+\x99\xcb\x8b\xab\x97\x97\x37\x00\xda\x84\xa0\x5a\xc2\x01\x74\x75\
+\xf1\xfe\x97\x6f\xfe\xf5\xec\xcc\x1a\x6b\xe0\x05\x03\xb3\xce\x0c\
+\x6c\xf5\xfa\xdd\xb3\xb3\xcb\x9b\x9b\xb7\x3f\x7b\xf2\xe4\xfd\xfb\
+\xf7\xe3\xfb\x30\xbe\xb9\x7e\xf9\xc4\x5b\x6b\x9f\xc0\x16\x67\x5f\
+\x7f\x65\x9e\xbe\x34\x57\x2f\x9e\x9d\xed\xde\xfd\xf3\x35\x82\xe6\
+\xe9\xdb\xf3\x9b\x4b\x03\x4f\x5e\x39\x58\xda\xf8\x69\x2c\xc9\x3f\
+\x1f\xec\xe8\x72\xf6\xc6\xc2\x3f\x82\xb5\x3e\x1a\x78\x10\xa2\x8d\
+\x0a\xa6\xdf\x5b\x9f\x47\x9f\xa6\xe7\xd6\xf8\xb1\x14\xf8\x8f\x0f\
+\xd6\x9b\x38\xce\xf3\x5c\x4c\x1a\x61\xe3\x06\xd1\x04\xcb\x0f\x07\
+\x98\xe9\xdb\x94\xa1\x4e\xb9\x1d\x64\x35\xde\x7f\x58\xed\xca\xbf\
+\x49\xe0\x0f\x67\xe6\xdb\xab\xdd\xee\xd9\xd9\x4f\x2e\xe6\x17\xf3\
+\xb7\xbe\x82\xc3\x9b\xb7\xe7\xcf\xaf\x6e\xfe\xfd\xec\x6c\x84\x27\
+\xef\x6e\xae\xdf\x7c\x77\x01\x53\x8a\xb3\xf3\xf9\xb9\x3c\xb8\x6b\
+\xd2\xc0\x2c\x80\x27\x4f\x90\x54\x4f\x5e\x2a\x82\xdd\x6c\x08\xe6\
+\xc3\x58\x5c\xa9\x24\x0b\x97\xf3\x18\x9f\x0b\xd5\x90\x3a\x44\xb1\
+\x30\xf1\x3f\xc3\xad\x8b\x38\xc1\xa8\x83\xd5\xc1\x81\x27\x5c\x0e\
+\xb8\xc2\x82\xf0\x3c\x8b\xff\x19\x6e\x87\xba\x46\x9b\xd3\x46\x65\
+\x9d\xcf\x49\x8f\xef\x0e\xd1\x23\xc6\xb1\x4c\xee\x80\x08\x85\x14\
+\x14\xec\x81\xe9\x40\x19\x8b\xb2\xf0\x03\x44\xe8\xdd\x51\xd9\x91\
+\x65\xb6\xb2\x43\xdb\x28\x19\x22\xf8\x73\xd2\xea\xed\x86\x56\x21\
+\x8f\x21\x84\x2f\x55\x76\xde\xdf\x4d\x8f\xf8\x28\x3b\x5b\x5a\x5d\
+\x6e\x68\x15\xa7\x71\x4e\x5f\xaa\xe8\x5c\x1f\x20\xc7\xa3\xe4\xac\
+\x49\xf5\xee\xe6\x7c\x4b\xac\xec\xc6\x94\xcb\x69\xdd\x7c\xf6\x76\
+\x06\x61\x04\x86\xa4\x32\x38\x78\x9a\x33\x0e\x96\x39\x01\xd5\x52\
+\x2a\xf3\x25\x2c\xe2\xad\x67\xb9\x75\x24\xb8\x48\x9d\x46\x3d\x05\
+\xd7\xed\x31\x30\x88\x4b\x22\x87\xe4\x87\x3e\x6d\xf1\xfb\x19\x89\
+\x7c\xfd\xed\x86\xc4\x25\x8d\x69\xce\x5f\xa8\x7e\x5e\x6f\x45\x8e\
+\xe9\xf1\xa8\xa0\x1b\x5a\x6d\xc3\x82\x69\x1a\xbd\xf3\x5f\xaa\xec\
+\x7c\x73\x37\x3d\xc2\x09\x65\xe7\x07\x65\x25\xff\xc7\x22\xb4\xdb\
+\xa6\x71\xd6\x8e\xd3\x97\x1a\x59\x5e\xbf\x3c\x44\x8f\x47\xf3\xb3\
+\xa1\xd5\x36\xa3\x75\x2e\x8c\xf1\x4b\x0d\x2d\xaf\xef\x2a\x89\x10\
+\x3d\x1e\x65\x67\x43\xab\x17\x5b\x5a\x79\x60\x65\xab\x86\x38\xff\
+\xc9\xc2\x43\x4b\xdc\x1f\xe9\xf9\x70\x88\x22\x77\x48\x0f\x45\xa9\
+\x66\xc9\x4e\xdf\x62\x6d\x60\x7b\x27\x0d\xcb\x98\x37\x7d\xd6\xe2\
+\x97\x62\x69\x07\x91\x39\x08\x59\x9a\x22\x08\x5b\x8a\x05\x54\x78\
+\x0c\x39\x4f\x20\x65\xc9\x4f\x33\x45\xdf\x0d\x80\x00\x7d\x0e\x85\
+\x02\xf4\xa9\xe4\x09\x64\xcf\xd9\x69\x22\x81\xc4\x00\xbd\x14\x1f\
+\x4c\xb8\x18\x82\x01\xc4\xac\x03\xd3\x99\x04\x80\xb7\xda\xbf\x53\
+\x0e\x24\xa0\x95\xfe\xb6\xf8\x82\x3f\x3e\x25\x62\xd2\x1c\x66\x04\
+\xf3\x44\xac\x9d\x9d\x77\x43\xa6\x37\x4b\x5b\x98\xaa\x78\xd6\xc5\
+\x4c\x3f\xb3\xa3\xd7\x9d\xa7\x1f\x1b\xea\x0f\xd2\xc6\xc6\x50\xea\
+\xe6\x13\x2d\x39\xd3\x94\xe4\x4a\x7d\xbd\x0c\x53\x43\xcf\x26\x79\
+\x86\xaf\xe5\x54\x17\x01\xed\xaa\x5b\x8f\xf3\xc5\x10\xcd\x50\x8f\
+\xe0\x15\x3a\xf5\xb4\x90\x19\xc9\x78\x82\xf1\x31\x23\x54\x81\x34\
+\x06\x04\xe8\xa4\x7e\x72\xc3\xdc\xa8\x50\xe8\x9c\xc0\x47\xfc\x99\
+\x26\x81\x3e\x67\x46\x7c\xbe\x2d\xa6\x40\x46\x3c\x99\x0c\x9a\x18\
+\xa7\x47\xab\xa5\x48\xf5\x66\x43\xaa\xe4\x28\x39\x79\xa4\xd5\xc6\
+\x9e\x5d\x6c\x13\x39\x8f\x85\x96\x47\x52\x6d\x48\xf5\xfd\x36\x6f\
+\x49\x54\x66\x39\x1d\xad\xee\x79\xde\xf2\xfa\xfb\x57\x07\xee\x9f\
+\x2c\xb8\xb3\x08\xe1\x43\x1a\xa7\xa3\xf1\x43\xfe\x78\xf8\x80\x4b\
+\x1c\x8f\x1f\xf2\xff\x4d\xf8\xb0\x7b\xf7\x10\x6f\xe3\x0e\x11\x47\
+\x08\x91\x88\x10\x48\x03\x7e\xf1\xc0\x3c\x9f\x63\x9a\xce\xcc\xf9\
+\xf5\xd5\xf9\xb0\x3b\xff\xe6\x02\xa6\xfe\x85\xe8\xa5\x09\x96\x20\
+\xcc\xca\x26\xe6\x31\x27\xb7\xc7\x70\xc8\xc5\x2a\x3b\x31\xb9\x44\
+\x51\x46\x2e\x25\xdc\x00\xb2\x53\xa0\xb8\x84\x66\xec\xf1\x6c\x73\
+\x20\xd9\xc8\x21\xcf\xa8\x8a\x71\x0a\x38\x1f\x22\x0e\x87\x42\x65\
+\xa7\x98\x31\xa4\xf0\x1e\x5c\xbb\x82\x63\x4c\xb3\xab\xf1\x1c\x8e\
+\xe0\x0e\xb3\x0d\x18\xc8\x44\x88\xb3\x28\x5a\x91\x37\x21\x34\x20\
+\x35\x8b\xbe\xe0\x38\xc6\x66\x18\x2a\xb8\x44\x54\x74\x69\xaa\x54\
+\x8d\x91\x5e\xf7\xc5\xce\x84\xd0\x94\x29\xac\x72\xce\xd3\x74\x42\
+\x08\xc7\x5d\x8c\xf3\x25\xae\x0f\x61\xd8\xbe\xaf\x63\x4b\x15\x60\
+\x3f\x87\xe4\xe4\x40\xc4\xb5\x54\x63\xa2\x19\x7c\x9d\x42\x57\xd0\
+\x11\x34\x65\x19\x06\x83\xcb\x58\xc8\xc5\x81\xe8\x9c\x33\x14\xf5\
+\xc5\x44\x08\xe6\x34\x31\x1c\xd5\xb8\x9b\x2c\x89\x09\x21\x88\xb0\
+\x9f\x89\xd2\x84\x98\xe1\xf7\x14\x4c\x88\xd5\xf2\x6f\x42\x21\xb6\
+\xb5\x74\x0c\xef\xc5\x4a\x79\x81\x71\x5d\xc3\x04\x39\x32\xcf\xc3\
+\xf9\xe2\xa5\x1d\x01\xef\xbc\xb7\x82\x08\x6d\x38\x5b\x44\x24\xba\
+\x92\x67\x4d\x29\x61\x0c\x8a\x02\x31\xc6\x2d\x38\xc2\x14\x09\xc5\
+\x93\xb1\x96\xe5\xe4\x35\xda\x97\xf8\x1d\x48\x82\x04\xf6\x3e\x41\
+\xbc\x6d\x49\x46\x2c\x63\x8c\xb2\x27\x4b\x21\xaa\xa1\xd8\xb2\x97\
+\xad\x4c\x67\x16\xcb\x6d\x63\x76\xa3\x5d\x3b\x4a\x85\x79\x65\xc3\
+\xf2\x4b\xdc\xb0\x64\x03\xc3\x94\x4b\x07\x45\xaa\xf1\x28\x64\x27\
+\xe2\x74\xd3\x77\x01\xba\xef\x1b\x1f\xaa\xa0\xe1\xd3\xc9\x7b\x1a\
+\xb5\x81\xc8\x0e\xf2\x90\x45\xf0\xab\xaf\x72\x79\xb1\x74\x3d\x82\
+\xa0\x86\x7b\x28\xbc\xda\xeb\xa8\x1d\x72\x74\xc3\xe2\x67\x58\x2c\
+\x3b\x86\x02\x06\xef\x4a\xa8\x07\x64\xb9\x44\x1a\x9a\x2e\xde\x4d\
+\x0a\x50\xfa\x86\x86\xad\x30\x47\x0e\x45\xaf\xe1\xf0\x54\x26\x0d\
+\xf3\xb8\xd2\xb7\x26\xce\x22\xb6\x0c\xe3\xc2\x43\x97\xee\xb6\x80\
+\x4c\x93\x0d\x72\xf2\xa4\x96\x55\xfc\xcc\xca\x62\x18\xb6\x0b\x9a\
+\x90\x8c\x31\x1a\x1c\x3c\x71\x4a\xf9\x0e\xba\x91\xbd\x92\x83\x99\
+\xae\x5d\x84\x1e\xae\x1a\x22\x69\x07\xc1\x1f\xd8\xa4\x56\xe7\xb2\
+\xec\x60\xb8\x87\xfd\x0b\x27\xf4\x20\x7f\x5d\x7b\x10\x20\x04\xbc\
+\x6c\x20\x7b\x0a\xbe\xb0\x15\xb9\x1d\x02\xfc\x3a\x0f\xe0\x04\xa9\
+\x67\xbc\x05\x34\x31\xc1\x76\x97\xe0\x33\x43\x9c\xdc\xad\xc0\x3c\
+\xe1\x08\xfd\xbf\x7b\x60\xfd\x12\x27\xe4\xcd\xef\x37\xbc\x29\x63\
+\x00\xd5\x49\x11\xcc\x83\x6b\xbc\x71\x80\x62\x98\x77\x80\x79\x89\
+\xe4\x70\xd9\x66\x34\x87\x21\xaa\x93\xa6\x02\x54\x71\x23\xfa\x0b\
+\x7c\x3b\xdb\xb8\x83\xb7\x6d\xa6\xfa\x87\xcf\x21\x1a\x86\xdc\x38\
+\x4d\xc9\x93\x16\x17\x50\xc4\x1d\xfc\x63\x0e\xc0\x07\x18\xc7\x3d\
+\x70\x4f\xfc\x15\x35\x3f\xc2\xee\xb7\xf7\xb0\xe5\xe3\x84\x2c\xfd\
+\xd3\x9a\xa5\x11\xe3\x97\xa0\xd5\x2d\x54\x9e\x66\xd4\xb6\x30\xcd\
+\xb1\xec\xc5\x44\xa2\x95\xb3\xb6\x50\x14\x87\xe1\x1c\x1e\x66\x2e\
+\x49\x60\xb2\x92\xda\x75\x8b\x15\xa5\xe0\x69\xaa\x0e\x97\x63\x0f\
+\x71\x03\xce\x96\x3a\x1f\xd9\x29\xd6\x56\x39\x68\x5a\x77\xe0\x7d\
+\x14\x4c\x78\xd4\xa8\x48\x63\x80\x6f\xce\x89\xfc\x90\xc5\x7f\x28\
+\xb7\xa1\x17\x1e\xd4\xc6\x8c\xe0\x02\x31\x1d\xb5\x21\xe2\x3a\x26\
+\x91\xe7\xab\x6d\x35\x61\x32\xca\xe5\x3c\x87\xe8\x3f\xbc\x62\x8a\
+\x62\x7d\x2f\x97\x84\x84\x8d\x21\x14\x45\x5a\x1d\x7d\x41\xdc\xa4\
+\x42\x06\x74\x6c\x1d\x6c\xd1\x9c\xb8\x79\xf6\x5e\x74\x10\x1d\x35\
+\x88\x3f\x07\x31\x2b\x7a\x19\x86\xc9\x3f\x56\x87\x2e\x01\xa9\x8c\
+\x88\x03\xc6\xc0\x43\xc5\x8d\x8b\x95\x87\xd5\xce\xc3\x0a\xb3\x41\
+\xc5\x83\x4c\x9a\x76\x2e\x84\x8f\xa8\xea\xfb\x07\xd6\x8d\x74\x42\
+\x35\xfe\xfb\x1d\x6a\xec\x9d\xb2\xcc\x10\xab\xcd\x61\x27\xe2\x0c\
+\x4e\x72\xa2\x20\xa6\xaa\x5d\x05\xd5\xac\x38\x03\x2f\xe1\xe0\x2e\
+\x4e\xa5\xda\x54\x10\xd9\x5d\x53\xcb\x00\x49\x08\xa5\x3e\xc4\x49\
+\x14\xe5\x94\xc9\x38\xd7\xf7\x1b\x8b\xeb\x80\x48\x14\x8e\xcf\xbe\
+\xa6\x34\x14\x1b\x62\x8d\x3c\x87\x1f\x60\xb3\x2f\xef\x5f\xab\xd5\
+\x09\x79\xfd\xbb\x35\xaf\x13\xde\x2e\xb8\x75\x84\x04\x2e\x33\x21\
+\x44\x76\xe7\x56\xa0\x3a\xa6\x39\x0b\x30\x3a\xcf\xe8\x9a\x91\xaa\
+\xde\xb4\x3e\xf8\x08\x67\xae\x1f\x56\xd7\xd7\x09\xb9\xf6\xe7\x03\
+\x5c\xdb\xc4\x4e\xe4\x67\x29\xf7\xd8\x61\xf0\x0a\x29\x08\x3f\xcb\
+\x90\x51\x14\x54\xae\x69\xca\x0e\x43\xa2\x5c\x4b\x2a\x52\x8f\x90\
+\xc4\x43\xea\x15\xcd\x85\x8a\x19\x16\x97\x4b\x4a\xab\x5d\x6e\xf5\
+\xa8\x32\x9d\xbd\x00\x55\x43\x4c\xf7\x9b\x6e\x76\xb3\x53\x30\xf9\
+\xab\xa5\xc7\xd5\x23\x83\x7e\xb3\x8e\x4b\x46\xd8\xea\x2c\x6a\xe3\
+\x41\xe1\x25\x75\x12\x8d\xf7\x50\xf3\xb0\x85\xc3\xe5\xeb\x29\x70\
+\x87\x7a\x53\x00\x2f\x31\x88\x04\x5f\x54\xbd\xed\x5d\xce\x16\x52\
+\xb3\x89\x52\xec\xea\x0c\x55\xb6\x47\xc5\x14\xa3\x9c\x16\x3b\x5f\
+\x8e\x37\x24\xb9\xa6\xd2\x85\xf6\xb6\x96\xc2\x1d\x49\xa2\x17\x2e\
+\x53\xc1\x74\xc6\x9b\x61\xf5\x60\x4f\x0f\x7c\x6a\x5e\x7e\xe8\x0b\
+\x8a\x8f\x95\xda\x8c\x84\x29\x1a\x1f\xc5\x5c\xa6\x46\x3f\x8d\x9d\
+\x0e\xab\x2f\xf6\x22\x3e\x76\x22\x9e\x58\xf1\x7f\xba\x56\xfc\x0c\
+\x49\x93\xf3\x68\x24\x13\x39\x13\x29\x84\x66\xd0\xeb\x06\x1b\x05\
+\x93\x33\xe6\x2c\x6a\xe0\xc4\x16\xe7\x97\x42\x05\x89\xc9\xc7\x5e\
+\xde\x1a\xba\x3d\x20\x67\x0c\xbf\x30\xcd\xcf\x52\xa0\x51\x61\x18\
+\x24\x54\xa1\xd9\xf8\x5d\x0f\xd9\xe9\xb9\xbc\xa7\xf5\x91\xcb\x7c\
+\xb4\xae\xec\x6b\xfa\xbe\x84\x97\x61\xbc\x0e\x0b\xdd\xf5\xb7\xf7\
+\xb0\x33\xf3\x84\xf2\xf1\x9b\xb5\x7c\x94\x19\xc2\xdc\x4d\xc1\x03\
+\xf4\x04\x94\xfa\xd2\x81\xa6\x97\xac\xea\x1d\xf2\x00\x7e\x21\x2a\
+\x87\xf1\x98\x6c\x5e\xd4\x43\x6c\xb6\xfe\x08\x3b\xd6\x16\xe0\xbe\
+\x37\x86\x7e\x4e\x1f\x0e\xac\x72\xe0\x43\xef\xb7\x0f\xbf\x59\xbb\
+\xee\xfd\x27\xfa\xee\x9b\x95\xb3\xde\x9f\xd6\x5b\xc7\x2f\xc4\x5b\
+\x5f\xaf\x4b\x57\xf7\xa1\x2d\xf9\x73\x96\xae\x66\xac\x12\xfa\x2f\
+\xbb\x74\x45\x4a\xf8\x09\xa5\xab\xb4\xae\x5d\xa5\xc7\xe2\xd5\x7f\
+\x53\xbc\xba\xfe\xe6\x61\xf6\xcc\x9f\x50\x9f\x7f\x79\x97\x3e\xdb\
+\x20\xde\x15\x9c\x44\x98\xf2\xbe\xe9\x8f\x59\x25\x9a\x5a\x83\x19\
+\x6e\xce\x4a\x2e\xc2\x45\x83\x59\xca\x44\x41\x58\x8a\x2a\xaf\x45\
+\x31\xd4\x7c\xbe\x01\x64\x6b\xdd\xf4\x97\x5d\x19\x2a\x69\xbd\xb0\
+\xac\xea\x29\xd7\xcd\x4d\x7b\xe5\xfe\x92\xb1\xe3\x69\xcd\xc5\xb3\
+\x36\x37\xad\x0e\x81\x2e\xc5\xf9\xb6\xba\x3d\x6f\xf7\xb4\x29\xea\
+\x51\xd1\x7d\xb9\x2b\xe6\xd9\x72\x19\xdc\x8c\x8e\xdc\x46\x8b\x69\
+\xa9\xd7\xd1\x38\x22\xf7\xa7\x32\x92\x16\xc9\xbc\x78\xf8\x16\x00\
+\xf8\x42\x36\x5f\xba\x16\xf8\x16\x58\xba\x33\x2a\x76\xed\x4c\x8c\
+\x9d\xa4\x2e\xed\x39\x2f\xda\xc2\x0e\xb5\x27\x85\x03\x80\xdd\x87\
+\x57\xf5\x17\x24\x39\x7a\x97\xd0\x0a\xd1\x45\x2d\x85\xba\x65\xa6\
+\xb8\x00\xe1\xbd\x95\x2b\x59\xb1\xc9\xda\xe1\x8b\xbd\x10\x87\xcc\
+\xb6\xb9\x5d\x01\xb3\x75\x6a\x9d\x14\xd5\x3a\x55\x8b\xae\xc8\xdb\
+\x02\x00\x69\x29\x11\xff\x2f\xe3\xcc\x9c\x26\x81\x7c\x29\x2e\xad\
+\x27\xeb\xc0\x8c\xe3\x85\x6e\xd8\xeb\x1d\x32\xc1\x60\x66\x21\x5c\
+\x9c\x4a\x5c\x1c\x39\x78\xea\xa1\x68\x47\xee\xa1\x90\x18\x24\x7c\
+\xf7\x46\xcb\x0d\x9c\x69\xdf\x2f\xee\xdb\x7d\x3e\x93\x44\xe6\x35\
+\xe5\x69\xa6\xb5\xc2\xbc\xee\xc2\xb4\xf2\x08\xaa\x8b\x32\xb5\x4d\
+\x6d\xda\xca\xd2\x77\xa3\x76\xd6\x32\x2b\x44\xd0\x3b\x0e\xab\x93\
+\x1c\x31\xad\xbb\x7b\xf8\x6d\xcd\x09\xed\xe6\x1f\x36\x3d\x57\x36\
+\x8e\xa9\x48\x1c\x84\x8d\xe4\x49\xdf\x90\x83\xd3\x9e\xd3\xd4\xae\
+\xd0\x87\x8f\x15\x79\xaf\x5f\x3e\xb0\x6f\x77\x4e\xc8\x8b\xdf\x6e\
+\x79\x91\xc0\x9c\xa0\x0f\x73\xa1\x3a\x2f\xca\xc0\xd8\x39\xb5\x6e\
+\x34\x53\xed\x70\x50\x30\x5a\x9c\x20\x96\x55\x5b\x7a\xdd\xde\x43\
+\x7e\x64\x86\x28\x17\x98\x18\xca\x84\x71\x2e\x71\xf9\x16\x69\x07\
+\x87\xa7\xfa\x00\xac\xab\xfa\x21\xe2\x9c\x0b\xf6\x47\x50\x24\x47\
+\xfd\x30\xd2\xc8\x06\x46\xad\x66\x45\xb5\xeb\x8a\xc1\x36\x3a\x91\
+\x83\x69\x0d\x4f\x54\x98\xeb\x6e\x00\x63\x4f\xe5\x7f\xc4\xc0\x71\
+\x82\xa3\xcc\x2d\xe6\x53\x6d\x0b\xf1\x4e\xd2\x52\x47\x36\x6b\x20\
+\x7b\x1d\x87\x9e\x65\xd6\x1f\x65\x7c\xb3\x0a\x67\x19\xa4\x64\x8e\
+\xaf\x3d\xa8\xcb\xac\x25\x59\x32\x5e\x7b\xab\xd0\x94\xeb\xd1\x6a\
+\x9a\xa4\x79\xa7\xef\x6b\xba\x6b\x94\x96\x9f\x46\x0a\x76\x13\x72\
+\x0a\x76\x22\x8b\xd8\x37\x19\x9d\x9d\x4a\xf0\xcb\x30\xa7\xe1\xbd\
+\x71\xae\x34\x3b\xda\xc1\x6d\xdb\x9c\x9c\xbf\x2c\xba\xdb\x8a\xee\
+\x7d\x6b\xbd\x8c\xab\x62\xb9\x74\xcc\x71\xab\xa2\xcc\xee\xcc\xe4\
+\x8e\x39\xee\x90\x64\x18\x11\xac\xa9\xc9\x26\x89\x11\xd4\xc5\x83\
+\x73\x7b\x5b\xeb\x9d\xec\x61\x7c\x8d\x0a\x54\xc2\x64\xb9\xaf\x8c\
+\x03\x6c\x20\x1b\xa5\x5b\x1c\x0f\xe1\x8a\xa6\x8b\x04\x83\xb4\xff\
+\x2d\x33\x57\x42\x33\xd3\x84\xb4\x75\xd7\x79\x22\x74\xcb\xfb\xc1\
+\xfd\x1a\xdb\xfa\x4f\x84\xce\x92\xd0\xa1\xc6\x75\x77\xdf\x44\x42\
+\xf8\x80\xf8\x16\xc5\xa6\xb6\x2a\x5f\x11\x60\xa4\x16\x04\x3e\x62\
+\x3f\xd7\x1d\x5e\xf7\xe1\x7b\xbe\xcf\xd9\xe1\xe5\x5c\x19\x21\xfc\
+\x39\xd6\xe1\x95\x3e\xa1\xc3\xeb\x7a\xdb\xc4\x7d\xbf\xbf\x1f\xfc\
+\xac\xfd\xdb\x6e\x02\xf4\xba\xff\x5a\xf6\x6f\x27\x15\xea\xa2\x75\
+\xd2\xfd\xa0\xd8\xe4\x15\x94\xdd\xbd\xab\x9f\x3b\x89\x4d\x32\xd5\
+\xbf\x68\x57\x51\xc1\xbb\xbb\xb9\x87\x45\x33\xf7\x8f\xec\xe5\xa6\
+\xe4\x4a\xf5\x72\x57\x5f\xd2\x7b\xb9\x8b\x18\xc6\x4b\xfa\x3a\xee\
+\x47\x76\x72\x27\x85\xaa\xaa\x31\x2c\x1b\xb9\x0f\xf6\x71\xaf\xdb\
+\xb8\xd5\xe8\x7f\xd3\xc5\x9d\x0f\x74\x71\x2f\xba\xb5\xb7\x5d\xdc\
+\x6e\xe1\x8c\x7c\xcb\x06\x0e\xf4\x70\x0f\x8b\x0e\xee\xa8\xb9\xf1\
+\xe3\x1b\xb8\xd3\xc2\x1d\x7d\x5a\x03\x77\x32\x9d\x47\x88\x0a\x89\
+\x65\x6f\xe0\x6e\x5d\xbb\x1d\xbc\x5f\xed\xdb\xc9\xd8\x45\xfb\x76\
+\x2b\x41\x9b\xee\x64\xb9\x79\xfb\x60\xeb\xb6\xe9\xe2\x2c\x9c\x3f\
+\xdc\xb8\x9d\x85\xe4\x43\xf5\x9a\x1a\x5e\x36\x6e\xd3\xf2\x77\x34\
+\x6e\xa7\xba\xb0\xab\xd1\x45\xef\xdc\xd6\xd3\x2a\x78\xb4\x6f\x7b\
+\xd5\xb6\xbd\xea\xda\x26\xe7\xdc\xbb\xb6\xa3\xa2\x36\x59\x25\x39\
+\x15\xf3\x5f\x94\x0d\x5f\xd3\x5d\xdb\xc7\x7c\xfa\x8b\x7b\xf9\x9d\
+\xf5\x09\x3d\xc7\xaf\x36\x9e\xc3\xcf\x2a\x0b\xb5\xe3\x9c\xc2\xec\
+\x96\xf5\x77\xb2\x6f\xad\xaa\xc0\xd5\x33\xa9\xbe\xb3\x9e\xea\x60\
+\x6d\x51\xbf\x05\x75\x21\x61\x62\xad\xea\xb5\x3b\xd6\x0f\xa9\xdd\
+\x49\xe0\xca\x99\x48\x95\x12\x86\x10\x05\xba\x20\x08\xce\xef\x75\
+\x09\xaf\x0f\x57\x94\x7c\x1f\x5b\x2c\x3c\xf4\x34\xa4\x5d\x85\x69\
+\xc4\xd4\xf3\xf5\xe7\x42\x52\x38\x53\xc7\x5e\x6c\xc9\x5d\xa3\x48\
+\x35\x2c\xbc\xd3\x3f\x7a\x10\xc4\xf1\x32\x86\x49\x36\x05\xec\xdd\
+\x23\x78\xdf\xfc\x85\x78\x04\xd3\x49\xda\xfc\x8c\x50\x9c\x4d\x46\
+\x4b\x6f\x38\xeb\xb1\x8b\xd9\xbd\x04\x5f\xe3\x72\xf9\x7e\xa3\x82\
+\xb4\xc7\xad\x50\x50\x59\x0f\x19\x67\x2a\xe8\xb7\x87\xd5\xe2\xec\
+\x39\x4d\x4f\xf4\x34\x62\xc3\x72\x4f\xa7\x3d\xe4\x47\x0a\x45\x1f\
+\x1e\x3f\xfd\x7f\xfc\xf4\xdf\x1e\xf8\xf4\xff\x84\xb6\xf0\x1f\x07\
+\x6c\x21\xdf\x64\x78\xbc\xb6\x5d\xf6\x70\x24\xe7\xcb\xae\xfe\xb0\
+\x46\x2f\x12\x1e\x9a\x2f\x30\xcf\xe6\xb7\x4c\x9d\x7e\xa4\x47\xf3\
+\xfc\x61\xfd\x1d\x82\x13\xf2\xed\x17\x9b\x2e\x6a\x70\xc2\x39\x98\
+\x32\xa1\x60\x61\xf4\x0b\x41\x49\x50\x1f\xb6\xcc\x71\x22\xdf\x46\
+\xad\x50\xbb\x1e\x4b\xcb\x73\x88\x5b\x27\xfa\x58\x05\x7b\x40\x74\
+\xd7\x2d\xd0\xa2\x5a\x75\x08\x85\x1c\x57\x64\x25\x7a\x05\xd0\xe3\
+\x5d\xaa\x45\x4f\xc3\xb6\xb1\x5e\x16\xd4\x26\xea\xd6\xc4\x81\x77\
+\x10\x83\xdd\xde\x25\x54\x0f\x87\x6f\x1b\x35\xca\xd7\xa2\x3c\xca\
+\xf7\x17\x7d\x6d\xb9\x41\x83\xff\xed\x18\x11\xfc\x32\xa7\x1c\x11\
+\xac\x37\x0f\xec\xaf\x36\x9c\x50\xb2\xfe\xb8\xe9\xfe\xcd\x18\x76\
+\xa3\x64\x39\xeb\x97\x75\x61\x8e\x2b\x9a\xd7\x96\x42\x18\xb7\x29\
+\x50\x26\x32\xf4\x12\x5b\xeb\x0c\xe2\xb8\x48\x3a\x71\x30\xc3\xed\
+\x2e\xb5\x65\x15\x72\x8d\x87\x55\x63\x25\x35\x9b\x7a\x1e\xd5\xdb\
+\x74\x35\x55\x1a\x78\xf4\x84\x61\xb5\xc0\xa0\x37\xe0\xeb\x4d\xb5\
+\xff\xa0\xd1\xab\xd9\xaa\xe4\xe7\x12\x1c\xa9\xc3\x0d\x76\x7b\x37\
+\xa9\x69\xd3\xb1\xd6\x61\xde\xa1\xfa\x24\xa2\xd3\x33\x9f\xa3\xf5\
+\x49\x09\x80\x84\xb2\x1c\xab\xe8\x02\xa5\x4e\xc8\xdb\x6d\xf3\xba\
+\x44\xa9\x51\x30\x0a\xc5\xf6\x3e\x97\x15\xdb\xfa\x95\x25\x7a\x7b\
+\xd3\x71\x63\x76\x4a\x38\xcc\x57\xd8\xfa\x5c\x7a\xcf\x16\x45\x2b\
+\xb2\x80\xc1\x11\xa7\xb2\x97\xc0\xb5\x46\x3f\xba\x1c\x7f\xb3\x66\
+\x26\xd7\xe3\xc3\xa4\xb8\xb9\x29\xc8\x57\xc2\xf5\x8a\x7c\x6d\x40\
+\x39\x52\x92\xef\x13\x4c\x2d\xdb\xea\xa2\xbc\xac\xdf\xab\xf2\x41\
+\x33\xa6\x61\xb7\x2a\xcb\xf3\xa1\x97\xc7\x51\x95\x7f\x84\xf7\x5d\
+\x55\x5a\xe3\x4f\x63\x04\x67\xe4\x9c\x71\xeb\xfb\xcb\x64\x14\x3a\
+\xd2\x52\xd2\x4e\xc3\x97\xc3\x74\x5c\x25\x00\x8d\x1c\x6a\x5c\xc8\
+\xa3\xc7\x65\xfd\x56\xdf\x57\xfb\x0f\x2b\x41\x19\x96\xf8\x2f\x6e\
+\x36\x3e\xd2\x92\x72\xf1\xb0\xfe\x72\xcc\x09\xcd\xf5\xaf\x37\x8d\
+\x9e\x19\x63\x74\x09\x04\x6a\x4f\xed\xf2\x4a\x95\xba\x6e\x1d\x28\
+\x1c\x64\x00\xff\xfb\x26\xdd\xef\x1f\xe6\x5f\xb2\x39\x21\x0b\xff\
+\xb6\xe9\x26\xc2\x92\x52\x54\x1e\xb7\x6a\x95\xe9\xb5\xe2\x6e\x0f\
+\x94\xd7\x31\xbd\xe5\xa5\xd9\x5e\xf1\x59\xdc\x07\xc8\x39\x6c\xcb\
+\x4a\xdb\x95\x28\xbb\x5c\xae\x6b\x89\xa9\xee\x1e\xb3\x06\x8b\xcd\
+\x45\x21\x1a\x94\xd0\x83\xc1\x68\xdf\x66\x55\x70\x7d\x4f\x9b\x16\
+\xf7\x8f\xcd\x9e\xb4\x9b\xda\xbc\xba\xaa\xb5\xf3\x02\x31\xf5\x97\
+\x0c\x54\x00\xb9\xbd\xab\xed\xc6\x46\x5b\x7b\xbe\xc4\x6d\x05\x7d\
+\x5c\x66\x2f\xfb\x74\xef\xd0\xfe\xcc\x8a\xa0\x71\xd0\x4b\x38\xfc\
+\xe6\xec\xc8\xb9\x9b\x23\xad\x31\xec\xa2\xab\xd9\x74\x42\xca\x35\
+\x6b\x23\x74\xfb\x0b\x16\xec\x49\xb9\x92\x21\x8c\xd2\x41\x80\xe1\
+\xc6\x2b\xed\x62\x85\x3f\x12\x78\xc9\xb6\x08\x1f\xd6\xd5\xd7\xdf\
+\xbf\xba\x87\x7f\x42\xe9\x84\x9a\xf8\x93\x8d\x31\x0d\x20\x33\xc9\
+\x78\xb4\xa9\xb3\x7c\x75\x7a\xcb\x46\x12\xb3\x26\xb0\x8a\xf8\x51\
+\x22\x83\xeb\x61\xfa\x1e\x46\x19\xcf\xf6\x04\xff\xee\xc0\x9c\x8e\
+\xcf\xa0\x35\x06\x59\xb4\xc3\x75\xcf\x23\x13\xea\x0a\xba\x8d\xc2\
+\x91\xb3\xa7\x2d\x0f\x8d\x63\x8a\x57\x3f\xc3\xa9\x9d\xfe\x0a\x47\
+\x39\x24\x82\x5b\x61\x7a\x8a\xff\xc7\x30\x5f\x7f\xf5\x1f\xb5\xfd\
+\xc3\x41\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x7a\xce\x24\
+\x00\x73\
+\x00\x76\x00\x67\x00\x6c\x00\x64\
+\x00\x0b\
+\x02\x17\xe3\xc7\
+\x00\x69\
+\x00\x6e\x00\x76\x00\x61\x00\x6c\x00\x69\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x04\x42\x38\x79\
+\x00\x65\
+\x00\x6e\x00\x5f\x00\x63\x00\x6f\x00\x6e\x00\x76\x00\x65\x00\x72\x00\x74\x00\x2e\x00\x70\x00\x79\
+\x00\x08\
+\x0a\x61\x57\x27\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x0e\x4b\x0a\x67\
+\x00\x65\
+\x00\x6e\x00\x5f\x00\x6c\x00\x61\x00\x79\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x13\xa7\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x19\x1f\
+\x00\x00\x00\x62\x00\x01\x00\x00\x00\x01\x00\x00\x2a\xfb\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x82\xde\x33\x96\x38\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x13\xa7\
+\x00\x00\x01\xa1\x4e\x10\xd2\xcc\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x19\x1f\
+\x00\x00\x01\x82\xde\x33\x96\x38\
+\x00\x00\x00\x62\x00\x01\x00\x00\x00\x01\x00\x00\x2a\xfb\
+\x00\x00\x01\x82\xde\x33\x96\x38\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,295 @@
+import traceback
+
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from plover import log
+
+from plover_svg_layout_display.layout_script import (
+    TRANSLATION_NONE, AnimatedIds, LayoutScript, compile_key_table, compile_script
+)
+from plover_svg_layout_display.qt_utils import load_qt_text
+
+
+# Seconds a script gets to load before it is given up on
+START_TIMEOUT = 5.0
+
+# Seconds a call may run past its budget before the worker is restarted
+HUNG_TIMEOUT = 2.0
+
+# Share of strokes over budget, after enough strokes, that is worth a warning
+SLOW_MIN_CALLS = 20
+SLOW_WARN_RATIO = 0.1
+
+READY_SEQ = 0
+
+
+class ScriptTimeout(Exception):
+    pass
+
+
+class ScriptError(Exception):
+    pass
+
+
+def serve_script(conn, py_text: str) -> None:
+    try:
+        layout_script = compile_script(py_text)
+    except Exception:
+        conn.send((READY_SEQ, "error", traceback.format_exc()))
+        return
+
+    if layout_script is None:
+        conn.send((READY_SEQ, "error", "no convert_stroke function or KEYS table"))
+        return
+
+    conn.send((READY_SEQ, "ready", (layout_script.translation_mode, layout_script.key_rows)))
+    if layout_script.key_rows is not None:
+        return
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+
+        if request is None:
+            return
+
+        seq, stroke, translation = request
+        try:
+            group_ids = layout_script.convert(stroke, lambda: translation)
+            conn.send((seq, "ok", (list(group_ids), getattr(group_ids, "fades", None))))
+        except Exception:
+            conn.send((seq, "error", traceback.format_exc()))
+
+
+class IsolatedScript:
+    """A layout script running in its own process. Each call waits at most
+    the time budget for an answer; a call that is still running makes the
+    following strokes fail fast until it returns, or until the process is
+    restarted for hanging. Strokes also fail fast while the process starts,
+    and a script that turns out to be a plain KEYS table is then run as one
+    inside Plover."""
+
+    def __init__(self, py_text: str, translation_mode: str, budget: float) -> None:
+        self.py_text = py_text
+        self.translation_mode = translation_mode
+        self.takes_translation = translation_mode != TRANSLATION_NONE
+        self.key_rows: Optional[List[List[str]]] = None
+        self.budget = budget
+        self.table: Optional[LayoutScript] = None
+        self.group_index: Optional[Dict[str, int]] = None
+
+        self.process = None
+        self.conn = None
+        self.starting = False
+        self.started_at = 0.0
+        self.failed = False
+        self.seq = READY_SEQ
+        self.busy_seq: Optional[int] = None
+        self.busy_since = 0.0
+
+    def start(self) -> None:
+        import multiprocessing
+
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=serve_script,
+            args=(child_conn, self.py_text),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        self.starting = True
+        self.started_at = monotonic()
+        self.busy_seq = None
+
+    def table_rows(self) -> Optional[List[List[str]]]:
+        if self.table is None:
+            return None
+        return self.table.table_rows()
+
+    def bind(self, group_index: Dict[str, int]) -> Set[str]:
+        # The script is only known to be a table once it has started, at
+        # which point it is bound to the same groups
+        self.group_index = group_index
+        if self.table is None:
+            return set()
+        return self.table.bind(group_index)
+
+    def adopt_table(self, key_rows: List[List[str]]) -> None:
+        self.close()
+        self.key_rows = key_rows
+        self.table = compile_key_table(key_rows)
+        if self.group_index is None:
+            return
+
+        unresolved = self.table.bind(self.group_index)
+        if unresolved:
+            log.warning(
+                "svgld: layout has no groups with the IDs %s",
+                ", ".join(sorted(map(str, unresolved)))
+            )
+
+    def close(self) -> None:
+        if self.process is None:
+            return
+
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+
+        self.process.terminate()
+        self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def restart(self) -> None:
+        log.warning("svgld: restarting layout script worker after a hung call")
+        self.close()
+        self.start()
+
+    def receive(self, seq: int, kind: str, payload) -> Optional[List[str]]:
+        if seq == READY_SEQ:
+            self.starting = False
+            if kind == "error":
+                self.failed = True
+                log.error("svgld: layout script failed to load:\n%s", payload)
+                self.close()
+                return None
+
+            translation_mode, key_rows = payload
+            if key_rows is not None:
+                self.adopt_table(key_rows)
+                return None
+
+            self.translation_mode = translation_mode
+            self.takes_translation = translation_mode != TRANSLATION_NONE
+            return None
+
+        if seq != self.busy_seq and seq != self.seq:
+            return None
+
+        self.busy_seq = None
+        if kind == "error":
+            raise ScriptError(payload)
+
+        group_ids, fades = payload
+        return AnimatedIds(group_ids, fades) if fades else group_ids
+
+    def drain(self) -> None:
+        # Receiving the ready message of a table or a failed script closes
+        # the connection
+        while self.conn is not None and self.conn.poll(0):
+            try:
+                self.receive(*self.conn.recv())
+            except ScriptError:
+                # A late failure of a call that was already given up on
+                pass
+
+    def convert(
+        self,
+        stroke: Tuple[str, ...],
+        get_translation: Callable[[], str]
+    ) -> List[str]:
+        if self.table is not None:
+            return self.table.convert(stroke, get_translation)
+        if self.failed:
+            raise ScriptError("layout script failed to load")
+
+        try:
+            # A worker that has just finished starting may already have
+            # exited, leaving its ready message behind
+            if self.conn is not None:
+                self.drain()
+            if self.table is not None:
+                return self.table.convert(stroke, get_translation)
+            if self.failed:
+                raise ScriptError("layout script failed to load")
+
+            if self.process is None or not self.process.is_alive():
+                self.close()
+                self.start()
+
+            if self.starting:
+                if monotonic() - self.started_at > START_TIMEOUT:
+                    log.error("svgld: layout script took too long to load")
+                    self.failed = True
+                    self.close()
+                    raise ScriptError("layout script took too long to load")
+                raise ScriptTimeout("layout script is still starting")
+
+            if self.busy_seq is not None:
+                if monotonic() - self.busy_since > HUNG_TIMEOUT:
+                    self.restart()
+                raise ScriptTimeout("layout script is still busy")
+
+            translation = ""
+            if self.translation_mode != TRANSLATION_NONE:
+                translation = get_translation()
+
+            self.seq += 1
+            self.conn.send((self.seq, stroke, translation))
+            if not self.conn.poll(self.budget):
+                self.busy_seq = self.seq
+                self.busy_since = monotonic()
+                raise ScriptTimeout("layout script went over its time budget")
+
+            return self.receive(*self.conn.recv())
+        except (EOFError, OSError) as error:
+            self.close()
+            raise ScriptError("layout script worker stopped") from error
+
+
+def load_isolated_script(py_path: str, budget: float) -> Optional[LayoutScript]:
+    py_text = load_qt_text(py_path)
+    if not py_text.strip():
+        return None
+
+    # The worker is not waited for, so loading never holds up Plover while
+    # a new interpreter starts; strokes time out until it is ready
+    isolated_script = IsolatedScript(py_text, TRANSLATION_NONE, budget)
+    isolated_script.start()
+    return isolated_script
+
+
+class ScriptStats:
+
+    __slots__ = ["calls", "slow", "timeouts", "errors"]
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.slow = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    def record(self, elapsed: float, budget: float) -> None:
+        self.calls += 1
+        if elapsed > budget:
+            self.slow += 1
+
+    def record_timeout(self) -> None:
+        self.calls += 1
+        self.timeouts += 1
+
+    def record_error(self) -> None:
+        self.calls += 1
+        self.errors += 1
+
+    def warning(self) -> Optional[str]:
+        over_budget = self.slow + self.timeouts
+        if self.calls >= SLOW_MIN_CALLS and over_budget / self.calls >= SLOW_WARN_RATIO:
+            return "The layout script went over its time budget on {:.0%} of strokes.".format(
+                over_budget / self.calls
+            )
+
+        if self.errors:
+            return "The layout script failed on {} of {} strokes; see the Plover log.".format(
+                self.errors, self.calls
+            )
+
+        return None
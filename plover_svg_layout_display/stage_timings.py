@@ -0,0 +1,94 @@
+import json
+
+from typing import Dict, List, Tuple
+
+
+STAGES = ("script", "assemble", "render", "paint", "window")
+
+# Upper bounds (ms) of the histogram buckets written by dump
+HISTOGRAM_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+
+
+class StageTimings:
+
+    __slots__ = ["capacity", "samples", "positions", "counts", "maximums"]
+
+    def __init__(self, capacity: int = 512) -> None:
+        self.capacity = capacity
+        self.samples: Dict[str, List[float]] = {
+            stage: [0.0] * capacity for stage in STAGES
+        }
+        self.positions = dict.fromkeys(STAGES, 0)
+        self.counts = dict.fromkeys(STAGES, 0)
+        self.maximums = dict.fromkeys(STAGES, 0.0)
+
+    def record(self, stage: str, seconds: float) -> None:
+        position = self.positions[stage]
+        self.samples[stage][position] = seconds
+        self.positions[stage] = (position + 1) % self.capacity
+        self.counts[stage] += 1
+
+        if seconds > self.maximums[stage]:
+            self.maximums[stage] = seconds
+
+    def recent(self, stage: str) -> List[float]:
+        count = min(self.counts[stage], self.capacity)
+        position = self.positions[stage]
+        samples = self.samples[stage]
+
+        if count < self.capacity:
+            return samples[:count]
+        return samples[position:] + samples[:position]
+
+    def last(self, stage: str) -> float:
+        if not self.counts[stage]:
+            return 0.0
+        return self.samples[stage][self.positions[stage] - 1]
+
+    def percentile(self, stage: str, fraction: float) -> float:
+        recent = sorted(self.recent(stage))
+        if not recent:
+            return 0.0
+        return recent[min(len(recent) - 1, int(fraction * len(recent)))]
+
+    def summary(self, stage: str) -> Tuple[float, float, float]:
+        """Returns the last, p95 and maximum times of a stage, in ms."""
+        return (
+            self.last(stage) * 1000,
+            self.percentile(stage, 0.95) * 1000,
+            self.maximums[stage] * 1000
+        )
+
+    def histogram(self, stage: str) -> List[int]:
+        buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        for seconds in self.recent(stage):
+            ms = seconds * 1000
+            index = 0
+            while index < len(HISTOGRAM_BUCKETS) and ms > HISTOGRAM_BUCKETS[index]:
+                index += 1
+            buckets[index] += 1
+
+        return buckets
+
+    def dump(self, path: str, extra: dict = None) -> None:
+        stages = {}
+        for stage in STAGES:
+            last, p95, maximum = self.summary(stage)
+            stages[stage] = {
+                "count": self.counts[stage],
+                "last_ms": last,
+                "p95_ms": p95,
+                "max_ms": maximum,
+                "histogram": self.histogram(stage),
+                "samples_ms": [seconds * 1000 for seconds in self.recent(stage)]
+            }
+
+        report = {
+            "bucket_bounds_ms": list(HISTOGRAM_BUCKETS),
+            "stages": stages
+        }
+        if extra:
+            report.update(extra)
+
+        with open(path, "w", encoding="utf-8") as dump_file:
+            json.dump(report, dump_file, indent=2)
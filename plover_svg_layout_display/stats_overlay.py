@@ -0,0 +1,48 @@
+from PyQt5.QtWidgets import QLabel, QWidget
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont
+
+from typing import Callable, List
+
+
+OVERLAY_STYLESHEET = (
+    "background: rgba(0, 0, 0, 160); color: white;"
+    "border-radius: 3px; padding: 3px;"
+)
+REFRESH_INTERVAL_MS = 500
+
+
+class StatsOverlay(QLabel):
+
+    def __init__(self, get_lines: Callable[[], List[str]], parent: QWidget = None) -> None:
+        super().__init__(parent)
+        self.get_lines = get_lines
+
+        font = QFont("monospace")
+        font.setStyleHint(QFont.TypeWriter)
+        font.setPointSize(7)
+        self.setFont(font)
+        self.setStyleSheet(OVERLAY_STYLESHEET)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.move(2, 2)
+        self.hide()
+
+        # The text is refreshed on its own timer rather than per stroke, so
+        # that the overlay never adds to the cost of drawing a stroke
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def set_enabled(self, enabled: bool) -> None:
+        if enabled:
+            self.refresh()
+            self.show()
+            self.raise_()
+            self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
+            self.hide()
+
+    def refresh(self) -> None:
+        self.setText("\n".join(self.get_lines()))
+        self.adjustSize()
@@ -0,0 +1,153 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import QRect, QRectF, QSize, Qt
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QImage, QPainter, QPaintEvent, QPixmap
+
+from typing import Optional
+
+
+TEXT_COLOR = QColor("#888888")
+TEXT_POINT_SIZE = 8
+
+# Pixels between two frames of the strip
+CELL_SPACING = 2
+
+
+class StrokeRibbon(QWidget):
+    """The last few strokes, oldest first, as a strip of small frames with
+    the translation of each one underneath.
+
+    Frames are drawn into the slots of a single pixmap used as a ring
+    buffer. A stroke only draws its own slot, and the strip is scrolled by
+    blitting the two halves of the ring in order, so a stroke costs the
+    same however long the strip is, and the strip never takes more memory
+    than its pixmap.
+    """
+
+    def __init__(self, parent: QWidget = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("stroke_ribbon")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+
+        font = QFont()
+        font.setPointSize(TEXT_POINT_SIZE)
+        self.setFont(font)
+        self.text_height = QFontMetrics(font).height()
+
+        self.length = 0
+        self.frame_size = QSize()
+        self.cell_width = 0
+        self.dpr = 1.0
+        self.strip: Optional[QPixmap] = None
+        self.head = 0
+        self.count = 0
+        self.hide()
+
+    def strip_size(self) -> QSize:
+        if self.length <= 0 or self.frame_size.isEmpty():
+            return QSize(0, 0)
+
+        return QSize(
+            self.length * self.cell_width,
+            self.frame_size.height() + self.text_height
+        )
+
+    def configure(self, length: int, frame_size: QSize) -> None:
+        dpr = self.devicePixelRatioF()
+        if (
+            length == self.length and frame_size == self.frame_size
+            and dpr == self.dpr and self.strip is not None
+        ):
+            self.clear()
+            return
+
+        self.length = length
+        self.frame_size = QSize(frame_size)
+        self.cell_width = frame_size.width() + CELL_SPACING
+        self.dpr = dpr
+
+        size = self.strip_size()
+        if size.isEmpty():
+            self.strip = None
+            self.hide()
+            return
+
+        self.strip = QPixmap(int(size.width() * dpr), int(size.height() * dpr))
+        self.strip.setDevicePixelRatio(dpr)
+        self.setFixedSize(size)
+        self.clear()
+        self.show()
+
+    def clear(self) -> None:
+        if self.strip is not None:
+            self.strip.fill(Qt.transparent)
+        self.head = 0
+        self.count = 0
+        self.update()
+
+    def nbytes(self) -> int:
+        if self.strip is None:
+            return 0
+        return self.strip.width() * self.strip.height() * self.strip.depth() // 8
+
+    def push(self, frame: QImage, translation: str) -> None:
+        if self.strip is None:
+            return
+
+        cell = QRect(
+            self.head * self.cell_width, 0,
+            self.cell_width, self.frame_size.height() + self.text_height
+        )
+
+        painter = QPainter(self.strip)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(cell, Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(
+            QRectF(cell.x(), 0, self.frame_size.width(), self.frame_size.height()),
+            frame
+        )
+
+        text_rect = QRect(
+            cell.x(), self.frame_size.height(),
+            self.frame_size.width(), self.text_height
+        )
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(
+            text_rect, Qt.AlignHCenter | Qt.AlignTop,
+            painter.fontMetrics().elidedText(translation, Qt.ElideRight, text_rect.width())
+        )
+        painter.end()
+
+        self.head = (self.head + 1) % self.length
+        self.count = min(self.count + 1, self.length)
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        if self.strip is None or self.count == 0:
+            return
+
+        height = self.height()
+        dpr = self.dpr
+        painter = QPainter(self)
+        if self.count < self.length:
+            width = self.count * self.cell_width
+            painter.drawPixmap(
+                QRectF(0, 0, width, height), self.strip,
+                QRectF(0, 0, width * dpr, height * dpr)
+            )
+        else:
+            # The slot at the head holds the oldest stroke
+            split = self.head * self.cell_width
+            older = self.length * self.cell_width - split
+            painter.drawPixmap(
+                QRectF(0, 0, older, height), self.strip,
+                QRectF(split * dpr, 0, older * dpr, height * dpr)
+            )
+            painter.drawPixmap(
+                QRectF(older, 0, split, height), self.strip,
+                QRectF(0, 0, split * dpr, height * dpr)
+            )
+        painter.end()
@@ -0,0 +1,171 @@
+from PyQt5.QtCore import QRect, QRectF, QSize, Qt
+from PyQt5.QtGui import QImage, QPainter, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+
+from math import ceil, sqrt
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from plover_svg_layout_display.svg_layers import element_bounds, view_transform
+
+
+# Device pixels of transparent padding around each sprite, so that
+# antialiased edges never pick up a neighbour in the atlas
+SPRITE_PADDING = 1
+
+# Raster paint engines cannot address images past this size
+MAX_ATLAS_SIDE = 16384
+
+
+class Sprite:
+
+    __slots__ = ["source", "target"]
+
+    def __init__(self, source: QRectF, target: QRectF) -> None:
+        # Source rect in atlas (device) pixels, destination in widget pixels
+        self.source = source
+        self.target = target
+
+
+class AtlasTooLarge(Exception):
+    pass
+
+
+def pack_shelves(
+    sizes: List[Tuple[str, QSize]],
+    max_side: int
+) -> Tuple[QSize, Dict[str, QRect]]:
+    # Tallest first onto rows of a width close to the square root of the
+    # total area; simple, and tight enough for the similar sized shapes of
+    # a keyboard layout
+    area = sum(size.width() * size.height() for _, size in sizes)
+    widest = max((size.width() for _, size in sizes), default=0)
+    width = max(widest, int(ceil(sqrt(area))))
+    if width > max_side:
+        raise AtlasTooLarge()
+
+    slots: Dict[str, QRect] = {}
+    x = y = shelf_height = 0
+    for group_id, size in sorted(sizes, key=lambda item: -item[1].height()):
+        if x + size.width() > width:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+
+        slots[group_id] = QRect(x, y, size.width(), size.height())
+        x += size.width()
+        shelf_height = max(shelf_height, size.height())
+
+    height = y + shelf_height
+    if height > max_side:
+        raise AtlasTooLarge()
+
+    return QSize(width, height), slots
+
+
+class SpriteAtlas:
+    """Every group of a layout rasterized once into a single packed pixmap,
+    at one scale and device pixel ratio."""
+
+    __slots__ = ["pixmap", "sprites", "dpr", "used_pixels"]
+
+    def __init__(
+        self,
+        renderer: QSvgRenderer,
+        view_box: QRectF,
+        svg_size: QSize,
+        group_ids: Iterable[str],
+        dpr: float
+    ) -> None:
+        transform = view_transform(view_box, svg_size)
+
+        device_rects: Dict[str, QRect] = {}
+        bounds: Dict[str, QRectF] = {}
+        for group_id in group_ids:
+            bounds_f = element_bounds(renderer, group_id, transform)
+            if bounds_f.isEmpty():
+                continue
+
+            device_rect = QRectF(
+                bounds_f.x() * dpr, bounds_f.y() * dpr,
+                bounds_f.width() * dpr, bounds_f.height() * dpr
+            ).toAlignedRect().adjusted(
+                -SPRITE_PADDING, -SPRITE_PADDING, SPRITE_PADDING, SPRITE_PADDING
+            )
+            device_rects[group_id] = device_rect
+            bounds[group_id] = bounds_f
+
+        atlas_size, slots = pack_shelves(
+            [(group_id, rect.size()) for group_id, rect in device_rects.items()],
+            MAX_ATLAS_SIDE
+        )
+
+        image = QImage(
+            max(atlas_size.width(), 1),
+            max(atlas_size.height(), 1),
+            QImage.Format_ARGB32_Premultiplied
+        )
+        image.fill(Qt.transparent)
+
+        self.sprites: Dict[str, Sprite] = {}
+        self.used_pixels = 0
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for group_id, slot in slots.items():
+            device_rect = device_rects[group_id]
+
+            painter.save()
+            painter.setClipRect(slot)
+            painter.translate(slot.x() - device_rect.x(), slot.y() - device_rect.y())
+            painter.scale(dpr, dpr)
+            renderer.render(painter, group_id, bounds[group_id])
+            painter.restore()
+
+            self.sprites[group_id] = Sprite(
+                QRectF(slot),
+                QRectF(
+                    device_rect.x() / dpr, device_rect.y() / dpr,
+                    device_rect.width() / dpr, device_rect.height() / dpr
+                )
+            )
+            self.used_pixels += slot.width() * slot.height()
+        painter.end()
+
+        self.pixmap = QPixmap.fromImage(image)
+        self.pixmap.setDevicePixelRatio(dpr)
+        self.dpr = dpr
+
+    def paint(self, painter: QPainter, group_ids: Iterable[str]) -> None:
+        pixmap = self.pixmap
+        sprites = self.sprites
+        for group_id in group_ids:
+            sprite = sprites.get(group_id)
+            if sprite is not None:
+                painter.drawPixmap(sprite.target, pixmap, sprite.source)
+
+    def nbytes(self) -> int:
+        return self.pixmap.width() * self.pixmap.height() * self.pixmap.depth() // 8
+
+    def report(self) -> Dict[str, float]:
+        total_pixels = self.pixmap.width() * self.pixmap.height()
+        return {
+            "width": self.pixmap.width(),
+            "height": self.pixmap.height(),
+            "dpr": self.dpr,
+            "sprites": len(self.sprites),
+            "bytes": self.nbytes(),
+            "fill": self.used_pixels / total_pixels if total_pixels else 0.0
+        }
+
+
+def build_atlas(
+    renderer: QSvgRenderer,
+    view_box: QRectF,
+    svg_size: QSize,
+    group_ids: Iterable[str],
+    dpr: float
+) -> Optional[SpriteAtlas]:
+    try:
+        return SpriteAtlas(renderer, view_box, svg_size, group_ids, dpr)
+    except AtlasTooLarge:
+        return None
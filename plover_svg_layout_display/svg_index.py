@@ -0,0 +1,193 @@
+import re
+
+from html import unescape
+from typing import Dict, Optional, Tuple
+
+
+# Tag names cannot hold quotes, so that where a tag ends never depends on
+# the bytes after it; see SVGParser.reindex
+TAG_PATTERN = re.compile(
+    rb"<([^\s/>!?\"']+)((?:[^>\"']|\"[^\"]*\"|'[^']*')*?)(/?)>"
+)
+END_TAG_PATTERN = re.compile(rb"</[^>]*>")
+ID_PATTERN = re.compile(rb"""(?:^|\s)id\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+SKIPPED_SECTIONS = (
+    (b"<!--", b"-->"),
+    (b"<![CDATA[", b"]]>"),
+    (b"<?", b"?>"),
+)
+
+
+class SVGIndexError(ValueError):
+    pass
+
+
+class SVGIndex:
+    """Byte offsets of the top-level groups of an SVG document.
+
+    Built with a single pass over the raw bytes; no tree is ever built, and
+    groups are kept as spans into the original buffer. content_start is
+    where the content of the root element begins, or None when the
+    document repeats a group ID and so cannot be patched incrementally.
+    """
+
+    __slots__ = ["svg_attribs", "group_spans", "content_start"]
+
+    def __init__(
+        self,
+        svg_attribs: bytes,
+        group_spans: Dict[str, Tuple[int, int]],
+        content_start: Optional[int] = None
+    ) -> None:
+        self.svg_attribs = svg_attribs
+        self.group_spans = group_spans
+        self.content_start = content_start
+
+
+class ResolvedIds(list):
+    """Group IDs that are all known to be in the loaded layout, along with
+    their interned indices; see SVGParser.resolve."""
+
+    __slots__ = ["indices"]
+
+    def __init__(self, group_ids=(), indices: Tuple[int, ...] = ()) -> None:
+        super().__init__(group_ids)
+        self.indices = indices
+
+
+def local_name(tag: bytes) -> bytes:
+    return tag.rsplit(b":", 1)[-1]
+
+
+class ScanResult:
+
+    __slots__ = ["svg_attribs", "content_start", "depth", "duplicates"]
+
+    def __init__(self) -> None:
+        self.svg_attribs: Optional[bytes] = None
+        self.content_start: Optional[int] = None
+        self.depth = 0
+        self.duplicates = False
+
+
+def scan_groups(
+    data: bytes,
+    position: int,
+    end: int,
+    depth: int,
+    group_spans: Dict[str, Tuple[int, int]]
+) -> ScanResult:
+    """Records the spans of the top-level groups between position and end,
+    starting at the given element depth. Nothing past end is looked at, so
+    a tag or section that does not close before end is an error."""
+    result = ScanResult()
+    group_start = None
+    group_id = None
+    position = data.find(b"<", position, end)
+
+    while position != -1:
+        skipped = False
+        for start_token, end_token in SKIPPED_SECTIONS:
+            if data.startswith(start_token, position):
+                section_end = data.find(end_token, position + len(start_token), end)
+                if section_end == -1:
+                    raise SVGIndexError("unterminated section")
+                position = section_end + len(end_token)
+                skipped = True
+                break
+
+        if skipped:
+            position = data.find(b"<", position, end)
+            continue
+
+        if data.startswith(b"<!", position):
+            tag_end = data.find(b">", position, end)
+            subset_start = data.find(b"[", position, tag_end)
+            if tag_end != -1 and subset_start != -1:
+                subset_end = data.find(b"]>", subset_start, end)
+                if subset_end == -1:
+                    raise SVGIndexError("unterminated declaration")
+
+                # Entities declared in a DTD would need expanding, which
+                # only a real XML parser does
+                if data.find(b"<!ENTITY", subset_start, subset_end) != -1:
+                    raise SVGIndexError("documents declaring entities are not indexed")
+                tag_end = subset_end + 1
+
+            if tag_end == -1:
+                raise SVGIndexError("unterminated declaration")
+
+            position = data.find(b"<", tag_end + 1, end)
+            continue
+
+        if data.startswith(b"</", position):
+            match = END_TAG_PATTERN.match(data, position, end)
+            if match is None:
+                raise SVGIndexError("unterminated end tag")
+
+            depth -= 1
+            if depth == 1 and group_start is not None:
+                group_spans[group_id] = (group_start, match.end())
+                group_start = None
+            elif depth < 0:
+                raise SVGIndexError("unbalanced end tag")
+
+            position = data.find(b"<", match.end(), end)
+            continue
+
+        match = TAG_PATTERN.match(data, position, end)
+        if match is None:
+            raise SVGIndexError("malformed tag")
+
+        tag, attribs, self_closing = match.groups()
+
+        if depth == 0:
+            if local_name(tag) != b"svg":
+                raise SVGIndexError("root element is not svg")
+            result.svg_attribs = attribs
+            result.content_start = match.end()
+
+        elif depth == 1 and local_name(tag) == b"g":
+            id_match = ID_PATTERN.search(attribs)
+            if id_match is not None:
+                raw_id = id_match.group(1)
+                if raw_id is None:
+                    raw_id = id_match.group(2)
+                group_id = unescape(raw_id.decode("utf-8"))
+                if group_id in group_spans:
+                    result.duplicates = True
+
+                if self_closing:
+                    group_spans[group_id] = (position, match.end())
+                else:
+                    group_start = position
+
+        if not self_closing:
+            depth += 1
+        elif depth == 0:
+            break
+
+        position = data.find(b"<", match.end(), end)
+
+    if group_start is not None:
+        raise SVGIndexError("unterminated group")
+
+    result.depth = depth
+    return result
+
+
+def index_svg(data: bytes) -> SVGIndex:
+    if data.startswith((b"\xff\xfe", b"\xfe\xff")):
+        raise SVGIndexError("only UTF-8 documents can be indexed")
+
+    group_spans: Dict[str, Tuple[int, int]] = {}
+    result = scan_groups(data, 0, len(data), 0, group_spans)
+    if result.svg_attribs is None:
+        raise SVGIndexError("no svg element found")
+
+    return SVGIndex(
+        result.svg_attribs,
+        group_spans,
+        None if result.duplicates else result.content_start
+    )
@@ -0,0 +1,163 @@
+from PyQt5.QtCore import QByteArray, QRectF, QSize, Qt
+from PyQt5.QtGui import QImage, QPainter, QPixmap, QTransform
+from PyQt5.QtSvg import QSvgRenderer
+
+from typing import Dict, Iterable, Optional
+
+from plover_svg_layout_display.svg_parser import SVGParser
+
+
+# Device pixels of transparent padding around each layer, so that
+# antialiased edges are not cut off
+LAYER_PADDING = 1
+
+def view_transform(view_box: QRectF, size: QSize) -> QTransform:
+    # Mirrors QSvgRenderer's KeepAspectRatio mapping, which anchors the
+    # scaled view box at the top left corner of the target
+    if view_box.isEmpty():
+        return QTransform()
+
+    scale = min(
+        size.width() / view_box.width(),
+        size.height() / view_box.height()
+    )
+
+    return QTransform(
+        scale, 0, 0, scale,
+        -view_box.x() * scale, -view_box.y() * scale
+    )
+
+
+def element_bounds(
+    renderer: QSvgRenderer,
+    group_id: str,
+    transform: QTransform
+) -> QRectF:
+    bounds = renderer.transformForElement(group_id).mapRect(
+        renderer.boundsOnElement(group_id)
+    )
+    return transform.mapRect(bounds)
+
+
+def new_image(size: QSize, dpr: float) -> QImage:
+    image = QImage(
+        max(1, int(size.width() * dpr)), max(1, int(size.height() * dpr)),
+        QImage.Format_ARGB32_Premultiplied
+    )
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    return image
+
+
+def render_image(svg_bytes: bytes, size: QSize, dpr: float) -> QImage:
+    # Images, unlike pixmaps, can be painted on any thread
+    renderer = QSvgRenderer(QByteArray(svg_bytes))
+    renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+
+    image = new_image(size, dpr)
+    painter = QPainter(image)
+    renderer.render(painter, QRectF(0, 0, size.width(), size.height()))
+    painter.end()
+
+    return image
+
+
+class Layer:
+
+    __slots__ = ["pixmap", "target"]
+
+    def __init__(self, pixmap: QPixmap, target: QRectF) -> None:
+        # The pixmap covers just the group, placed at target in widget pixels
+        self.pixmap = pixmap
+        self.target = target
+
+    def nbytes(self) -> int:
+        return self.pixmap.width() * self.pixmap.height() * self.pixmap.depth() // 8
+
+
+class LayerCache:
+    """Each group rasterized on its own, cropped to its bounds, at the size
+    of the layout and the device pixel ratio of the screen it is drawn on.
+
+    Layers are rendered lazily, the first time a group is drawn, so a
+    stroke costs one blit per group on display however large the layout.
+    """
+
+    __slots__ = ["svg_parser", "size", "layers"]
+
+    def __init__(self, svg_parser: SVGParser) -> None:
+        self.svg_parser = svg_parser
+        self.size: Optional[QSize] = None
+        self.layers: Dict[float, Dict[str, Optional[Layer]]] = {}
+
+    def reset(self, size: Optional[QSize]) -> None:
+        self.size = size
+        self.layers = {}
+
+    def discard(self, group_ids: Iterable[str]) -> None:
+        for layers in self.layers.values():
+            for group_id in group_ids:
+                layers.pop(group_id, None)
+
+    def nbytes(self) -> int:
+        return sum(
+            layer.nbytes()
+            for layers in self.layers.values()
+            for layer in layers.values()
+            if layer is not None
+        )
+
+    def render_layer(self, group_id: str, dpr: float) -> Optional[Layer]:
+        # A document holding just the group keeps the root element, and so
+        # maps it to the same place as the whole layout would
+        renderer = QSvgRenderer(QByteArray(self.svg_parser.get_svg_bytes([group_id])))
+        renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+        bounds = element_bounds(
+            renderer, group_id, view_transform(renderer.viewBoxF(), self.size)
+        )
+        if bounds.isEmpty():
+            return None
+
+        device_rect = QRectF(
+            bounds.x() * dpr, bounds.y() * dpr,
+            bounds.width() * dpr, bounds.height() * dpr
+        ).toAlignedRect().adjusted(
+            -LAYER_PADDING, -LAYER_PADDING, LAYER_PADDING, LAYER_PADDING
+        )
+
+        image = QImage(device_rect.size(), QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(-device_rect.x(), -device_rect.y())
+        painter.scale(dpr, dpr)
+        renderer.render(painter, group_id, bounds)
+        painter.end()
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        return Layer(pixmap, QRectF(
+            device_rect.x() / dpr, device_rect.y() / dpr,
+            device_rect.width() / dpr, device_rect.height() / dpr
+        ))
+
+    def get_layer(self, group_id: str, dpr: float) -> Optional[Layer]:
+        layers = self.layers.get(dpr)
+        if layers is None:
+            layers = self.layers[dpr] = {}
+
+        if group_id in layers:
+            return layers[group_id]
+
+        if self.size is None or group_id not in self.svg_parser.group_svgs:
+            return None
+
+        layer = self.render_layer(group_id, dpr)
+        layers[group_id] = layer
+        return layer
+
+    def paint(self, painter: QPainter, group_ids: Iterable[str], dpr: float) -> None:
+        for group_id in group_ids:
+            layer = self.get_layer(group_id, dpr)
+            if layer is not None:
+                painter.drawPixmap(layer.target, layer.pixmap, QRectF(layer.pixmap.rect()))
@@ -0,0 +1,277 @@
+"""Load-time cleanup of layout SVGs.
+
+Editors such as Inkscape save metadata, editor-only attributes, unused
+definitions, wrapper groups and overly precise path data along with the
+drawing, all of which Qt parses again whenever a group is drawn. The
+optimized document draws the same, and only ever lives in memory and in
+the layout cache; the file on disk is never touched.
+"""
+
+import re
+
+from typing import Set, Tuple
+
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+EDITOR_NAMESPACES = (
+    "http://www.inkscape.org/namespaces/inkscape",
+    "http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd",
+)
+
+NON_RENDERING_TAGS = ("metadata", "title", "desc")
+
+# Properties that are not inherited, and so can be dropped wherever they
+# hold their initial value
+INITIAL_STYLES = {
+    "opacity": "1",
+    "mix-blend-mode": "normal",
+    "isolation": "auto",
+}
+
+# Decimal places kept in path data
+PATH_PRECISION = 3
+
+NUMBER_PATTERN = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+REFERENCE_PATTERN = re.compile(r"url\(\s*['\"]?#([^)'\"\s]+)")
+ARC_PATTERN = re.compile(r"[aA]")
+
+
+class OptimizeReport:
+
+    __slots__ = [
+        "bytes_before", "bytes_after", "removed_elements", "removed_defs",
+        "flattened_groups", "minified_styles", "rounded_paths"
+    ]
+
+    def __init__(self, bytes_before: int) -> None:
+        self.bytes_before = bytes_before
+        self.bytes_after = bytes_before
+        self.removed_elements = 0
+        self.removed_defs = 0
+        self.flattened_groups = 0
+        self.minified_styles = 0
+        self.rounded_paths = 0
+
+
+def split_tag(tag) -> Tuple[str, str]:
+    if not isinstance(tag, str):
+        return "", ""
+    if tag.startswith("{"):
+        namespace, name = tag[1:].split("}", 1)
+        return namespace, name
+    return "", tag
+
+
+def is_svg_tag(tag, name: str) -> bool:
+    namespace, local_name = split_tag(tag)
+    return local_name == name and namespace in ("", SVG_NAMESPACE)
+
+
+def remove_element(element) -> None:
+    # Tails are kept, since text in a <text> may follow the element
+    parent = element.getparent()
+    if parent is None:
+        return
+
+    if element.tail:
+        previous = element.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + element.tail
+        else:
+            parent.text = (parent.text or "") + element.tail
+    parent.remove(element)
+
+
+def strip_editor_data(root, report: OptimizeReport) -> None:
+    for element in list(root.iter()):
+        namespace, local_name = split_tag(element.tag)
+        if not local_name or namespace in EDITOR_NAMESPACES or (
+            namespace in ("", SVG_NAMESPACE) and local_name in NON_RENDERING_TAGS
+        ):
+            remove_element(element)
+            report.removed_elements += 1
+            continue
+
+        for name in list(element.attrib):
+            if split_tag(name)[0] in EDITOR_NAMESPACES:
+                del element.attrib[name]
+
+
+def referenced_ids(root) -> Set[str]:
+    references = set()
+    for element in root.iter():
+        if not isinstance(element.tag, str):
+            continue
+
+        for name, value in element.attrib.items():
+            if name in ("href", XLINK_HREF) and value.startswith("#"):
+                references.add(value[1:])
+            elif "url(" in value:
+                references.update(REFERENCE_PATTERN.findall(value))
+
+        if is_svg_tag(element.tag, "style") and element.text:
+            references.update(REFERENCE_PATTERN.findall(element.text))
+
+    return references
+
+
+def drop_unused_defs(root, report: OptimizeReport) -> None:
+    # Definitions may only be used by other definitions, so this repeats
+    # until nothing else can be dropped
+    while True:
+        references = referenced_ids(root)
+        removed = 0
+        for defs in [element for element in root.iter() if is_svg_tag(element.tag, "defs")]:
+            for child in list(defs):
+                if is_svg_tag(child.tag, "style"):
+                    continue
+                if child.get("id") not in references:
+                    remove_element(child)
+                    removed += 1
+
+            if len(defs) == 0:
+                remove_element(defs)
+
+        report.removed_defs += removed
+        if not removed:
+            return
+
+
+def flatten_groups(parent, report: OptimizeReport) -> None:
+    """Merges groups that only carry a transform into their only child, and
+    unwraps groups without any attributes, below the top-level groups."""
+    for child in list(parent):
+        if not isinstance(child.tag, str):
+            continue
+
+        flatten_groups(child, report)
+        if not is_svg_tag(child.tag, "g"):
+            continue
+
+        attributes = dict(child.attrib)
+        transform = attributes.pop("transform", None)
+        if attributes or (child.text and child.text.strip()):
+            continue
+
+        children = list(child)
+        if transform is not None:
+            if len(children) != 1:
+                continue
+
+            inner_transform = children[0].get("transform")
+            children[0].set(
+                "transform",
+                transform if inner_transform is None
+                else "{} {}".format(transform, inner_transform)
+            )
+
+        index = parent.index(child)
+        tail = child.tail
+        parent[index:index + 1] = children
+        if children:
+            children[-1].tail = tail
+        report.flattened_groups += 1
+
+
+def minify_style(style: str, initial: Set[str] = frozenset()) -> str:
+    """Drops editor-only declarations, earlier declarations of the same
+    property, and the ones in `initial` that only restate the initial
+    value of their property."""
+    declarations = {}
+    for declaration in style.split(";"):
+        name, _, value = declaration.partition(":")
+        name = name.strip()
+        value = value.strip()
+        if not name or not value or name.startswith(("-inkscape", "inkscape")):
+            continue
+        if name in initial and INITIAL_STYLES.get(name) == value:
+            declarations.pop(name, None)
+            continue
+
+        # Later declarations of a property win
+        declarations.pop(name, None)
+        declarations[name] = value
+
+    return ";".join("{}:{}".format(name, value) for name, value in declarations.items())
+
+
+def minify_styles(root, report: OptimizeReport) -> None:
+    # An initial value in an inline style can override a stylesheet rule or
+    # a presentation attribute, so it is only dropped when neither applies
+    has_stylesheet = any(is_svg_tag(element.tag, "style") for element in root.iter())
+    for element in root.iter():
+        if not isinstance(element.tag, str):
+            continue
+
+        style = element.get("style")
+        if style is None:
+            continue
+
+        initial = set()
+        if not has_stylesheet and element.get("class") is None:
+            initial = set(INITIAL_STYLES).difference(element.attrib)
+        minified = minify_style(style, initial)
+        if minified != style:
+            report.minified_styles += 1
+        if minified:
+            element.set("style", minified)
+        else:
+            del element.attrib["style"]
+
+
+def round_numbers(text: str, precision: int) -> str:
+    def replace(match) -> str:
+        number = "{:.{}f}".format(float(match.group()), precision)
+        if "." in number:
+            number = number.rstrip("0").rstrip(".")
+        if number in ("-0", ""):
+            number = "0"
+
+        # Numbers may be written without a separator, such as "1.5.5"
+        start = match.start()
+        if start > 0 and text[start - 1] in "0123456789." and not number.startswith("-"):
+            number = " " + number
+        return number
+
+    return NUMBER_PATTERN.sub(replace, text)
+
+
+def round_paths(root, report: OptimizeReport, precision: int) -> None:
+    for element in root.iter():
+        if not isinstance(element.tag, str):
+            continue
+
+        # Arc flags may be written without separators ("a1 1 0 011 1"),
+        # which would be read as a single number, so arcs are left alone
+        data = element.get("d")
+        if is_svg_tag(element.tag, "path") and data and not ARC_PATTERN.search(data):
+            element.set("d", round_numbers(data, precision))
+            report.rounded_paths += 1
+
+        points = element.get("points")
+        if points and (is_svg_tag(element.tag, "polygon") or is_svg_tag(element.tag, "polyline")):
+            element.set("points", round_numbers(points, precision))
+            report.rounded_paths += 1
+
+
+def optimize_svg(data: bytes, precision: int = PATH_PRECISION) -> Tuple[bytes, OptimizeReport]:
+    from lxml import etree as ET
+
+    report = OptimizeReport(len(data))
+    parser = ET.XMLParser(remove_comments=True, remove_pis=True, huge_tree=True)
+    root = ET.fromstring(data, parser)
+
+    strip_editor_data(root, report)
+    drop_unused_defs(root, report)
+    for child in root:
+        if is_svg_tag(child.tag, "g"):
+            flatten_groups(child, report)
+    minify_styles(root, report)
+    round_paths(root, report, precision)
+    ET.cleanup_namespaces(root)
+
+    optimized = ET.tostring(root, encoding="UTF-8", xml_declaration=True)
+    report.bytes_after = len(optimized)
+    return optimized, report
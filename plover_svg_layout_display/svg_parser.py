@@ -1,51 +1,395 @@
-from typing import List, Dict
-from lxml import etree as ET
+import sys
 
-from plover_svg_layout_display.qt_utils import load_qt_text
-from plover_svg_layout_display.resources_rc import *
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from plover import log
 
-SVG_TEMPLATE = (
-    "<svg{header}>\n{content}\n</svg>"
+from plover_svg_layout_display.qt_utils import load_qt_bytes
+from plover_svg_layout_display.resources_rc import *
+from plover_svg_layout_display.svg_index import (
+    ResolvedIds, SVGIndexError, index_svg, scan_groups
 )
+from plover_svg_layout_display.svg_optimize import optimize_svg
+
+
+SVG_FOOTER = b"\n</svg>"
+
+
+def common_prefix(old: memoryview, new: bytes) -> int:
+    # bytes.startswith compares against a buffer without copying it, so
+    # each halving step is a plain memory comparison
+    low, high = 0, min(len(old), len(new))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if new.startswith(old[low:middle], low):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def common_suffix(old: memoryview, new: bytes, limit: int) -> int:
+    old_end = len(old)
+    new_end = len(new)
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if new.startswith(old[old_end - middle:old_end - low], new_end - middle):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class GroupSVGs(Mapping):
+    """Read-only view of the groups of a loaded layout, keyed by ID.
+
+    Groups are stored as spans of a single buffer, and decoded each time
+    they are looked up; frames are assembled from the buffer directly, so
+    decoded copies are never kept around.
+    """
+
+    __slots__ = ["data", "spans"]
+
+    def __init__(self, data: bytes, spans: Dict[str, Tuple[int, int]]) -> None:
+        self.data = memoryview(data)
+        self.spans = spans
+
+    def __getitem__(self, group_id: str) -> str:
+        start, end = self.spans[group_id]
+        return str(self.data[start:end], "utf-8")
+
+    def rebase(self, data: bytes, spans: Dict[str, Tuple[int, int]]) -> None:
+        self.data = memoryview(data)
+        self.spans = spans
+
+    def __contains__(self, group_id: object) -> bool:
+        return group_id in self.spans
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
 
 
 class SVGParser:
     
-    __slots__ = ["group_svgs", "svg_attribs", "svg_raw"]
+    __slots__ = [
+        "group_svgs", "svg_attribs", "svg_header",
+        "svg_data", "group_data", "group_spans",
+        "group_order", "group_index", "span_table", "reported", "optimized",
+        "group_view", "content_start"
+    ]
+
+    def load_file(self, path: str, streaming: bool = True, optimize: bool = False) -> None:
+        data = load_qt_bytes(path)
+        self.optimized = optimize
+        if optimize:
+            data = self.optimize(data, path)
+
+        if streaming:
+            try:
+                self.load_index(data)
+                return
+            except SVGIndexError:
+                pass
+
+        self.load_tree(data)
+
+    def load_cached(
+        self,
+        svg_attribs: str,
+        group_spans: Dict[str, Tuple[int, int]],
+        group_data: bytes,
+        optimized: bool = False,
+        content_start: Optional[int] = None
+    ) -> None:
+        self.optimized = optimized
+        self.content_start = content_start
+        self.svg_data = group_data
+        self.group_data = group_data
+        self.group_spans = group_spans
+        self.group_svgs = GroupSVGs(group_data, group_spans)
+        self.svg_attribs = svg_attribs
+        self.svg_header = "<svg{}>\n".format(svg_attribs).encode("utf-8")
+        self.intern_groups()
+
+    def load_index(self, data: bytes) -> None:
+        index = index_svg(data)
+
+        # The groups are served straight out of the file's own bytes
+        self.svg_data = data
+        self.group_data = data
+        self.group_spans = index.group_spans
+        self.group_svgs = GroupSVGs(data, index.group_spans)
+        self.svg_attribs = index.svg_attribs.decode("utf-8")
+        self.svg_header = b"<svg" + index.svg_attribs + b">\n"
+        self.content_start = index.content_start
+        self.intern_groups()
+
+    def load_tree(self, data: bytes) -> None:
+        from lxml import etree as ET
 
-    def load_file(self, path: str) -> List[str]:
         parser = ET.XMLParser(recover=True)
-        self.svg_raw = load_qt_text(path)
-        tree = ET.fromstring(self.svg_raw.encode("utf-8"), parser)
+        tree = ET.fromstring(data, parser)
+        if tree is None:
+            raise ValueError("no svg element found")
 
-        self.group_svgs: Dict[str, str] = {}
+        chunks: List[bytes] = []
+        spans: Dict[str, Tuple[int, int]] = {}
+        offset = 0
         for child in tree:
             tag = child.tag
+            if not isinstance(tag, str):
+                continue
             if "}" in tag:
                 tag = tag.split("}", 1)[1]
 
             if tag == "g" and "id" in child.attrib:
-                self.group_svgs[child.attrib["id"]] = ET.tostring(child).decode()
+                chunk = ET.tostring(child)
+                chunks.append(chunk)
+                spans[child.attrib["id"]] = (offset, offset + len(chunk))
+                offset += len(chunk)
+
+        self.svg_data = data
+        self.content_start = None
+        self.group_data = b"".join(chunks)
+        self.group_spans = spans
+        self.group_svgs = GroupSVGs(self.group_data, spans)
+
+        svg_raw = self.svg_raw
+        self.svg_attribs = ""
+        if "<svg" in svg_raw:
+            self.svg_attribs = svg_raw.split("<svg", 1)[1].split(">")[0]
+        self.svg_header = "<svg{}>\n".format(self.svg_attribs).encode("utf-8")
+        self.intern_groups()
+
+    def optimize(self, data: bytes, path: str = "") -> bytes:
+        try:
+            optimized, report = optimize_svg(data)
+        except Exception:
+            log.warning("svgld: could not optimize %s, loading it as is", path, exc_info=True)
+            return data
+
+        log.info(
+            "svgld: optimized %s from %d to %d bytes",
+            path or "layout", report.bytes_before, report.bytes_after
+        )
+        return optimized
+
+    def intern_groups(self) -> None:
+        # Groups are numbered in document order, so that resolved IDs can be
+        # turned into content by indexing a list
+        spans = self.group_spans
+        self.group_view = memoryview(self.group_data)
+        self.group_order: List[str] = list(spans)
+        self.group_index: Dict[str, int] = {
+            group_id: index for index, group_id in enumerate(self.group_order)
+        }
+        self.span_table: List[Tuple[int, int]] = [
+            spans[group_id] for group_id in self.group_order
+        ]
+        self.reported: Set[str] = set()
+
+    def report_unresolved(self, group_ids: Iterable[str]) -> None:
+        new_ids = set(group_ids).difference(self.reported)
+        if not new_ids:
+            return
 
-        if "<svg" in self.svg_raw:
-            self.svg_attribs = self.svg_raw.split("<svg", 1)[1].split(">")[0]
+        self.reported.update(new_ids)
+        log.warning(
+            "svgld: layout has no groups with the IDs %s",
+            ", ".join(sorted(map(str, new_ids)))
+        )
+
+    def resolve(self, group_ids: Iterable[str]) -> ResolvedIds:
+        """Drops the IDs that are not in the layout, reporting each of them
+        the first time it shows up."""
+        index = self.group_index
+        resolved = ResolvedIds()
+        indices = []
+        unresolved = None
+        for group_id in group_ids:
+            group_index = index.get(group_id)
+            if group_index is None:
+                if unresolved is None:
+                    unresolved = []
+                unresolved.append(group_id)
+                continue
+
+            resolved.append(group_id)
+            indices.append(group_index)
+
+        if unresolved is not None:
+            self.report_unresolved(unresolved)
+
+        resolved.indices = tuple(indices)
+        return resolved
+
+    def reindex(
+        self,
+        data: bytes
+    ) -> Optional[Tuple[Dict[str, Tuple[int, int]], List[str], Dict[str, Tuple[int, int]]]]:
+        """Indexes a new version of the layout by only scanning the part that
+        differs from the current one, between the nearest untouched groups.
+        Returns the new group spans, the IDs of the groups that were in the
+        scanned part before, and the spans found in it; or None when the
+        whole file has to be indexed instead."""
+        content_start = self.content_start
+        if content_start is None:
+            return None
+
+        old_data = self.group_view
+        prefix = common_prefix(old_data, data)
+        if prefix < content_start:
+            return None
+
+        suffix = common_suffix(old_data, data, min(len(old_data), len(data)) - prefix)
+        old_end = len(old_data) - suffix
+        shift = len(data) - len(old_data)
+
+        # Spans are in document order and do not overlap, so they are
+        # sorted by both their starts and their ends
+        spans = self.span_table
+        before = bisect_right(spans, (prefix, len(old_data)))
+        if before > 0 and spans[before - 1][1] > prefix:
+            before -= 1
+        after = bisect_left(spans, (old_end, -1))
+
+        window_start = spans[before - 1][1] if before > 0 else content_start
+        window_end = spans[after][0] + shift if after < len(spans) else len(data)
+
+        window_spans: Dict[str, Tuple[int, int]] = {}
+        try:
+            result = scan_groups(data, window_start, window_end, 1, window_spans)
+        except SVGIndexError:
+            return None
+
+        # The scan has to end where the untouched groups start again, in
+        # the same state as before, and must not bring in another root
+        if (
+            result.svg_attribs is not None or result.duplicates
+            or (after < len(spans) and result.depth != 1)
+        ):
+            return None
+
+        group_index = self.group_index
+        for group_id in window_spans:
+            index = group_index.get(group_id)
+            if index is not None and (index < before or index >= after):
+                return None
+
+        order = self.group_order
+        group_spans = dict(zip(order[:before], spans[:before]))
+        group_spans.update(window_spans)
+        if shift:
+            for group_id, (start, end) in zip(order[after:], spans[after:]):
+                group_spans[group_id] = (start + shift, end + shift)
+        else:
+            group_spans.update(zip(order[after:], spans[after:]))
+
+        return group_spans, order[before:after], window_spans
+
+    def patch(self, data: bytes) -> Optional[Tuple[Set[str], Set[str]]]:
+        """Switches to a new version of the same layout, and returns the IDs
+        of the groups that were changed or added, and of those that were
+        removed. Returns None, leaving the parser as it was, if the new
+        version cannot be patched in and has to be loaded from scratch."""
+        if self.optimized:
+            data = self.optimize(data)
+        data = bytes(data)
 
+        old_data = self.group_view
+        old_spans = self.group_spans
+        new_data = memoryview(data)
+
+        reindexed = self.reindex(data)
+        if reindexed is not None:
+            new_spans, old_ids, candidates = reindexed
+            content_start = self.content_start
+            removed = set(old_ids).difference(new_spans)
+        else:
+            try:
+                index = index_svg(data)
+            except SVGIndexError:
+                return None
+
+            if b"<svg" + index.svg_attribs + b">\n" != self.svg_header:
+                return None
+
+            new_spans = candidates = index.group_spans
+            content_start = index.content_start
+            removed = set(old_spans).difference(new_spans)
+
+        changed = set()
+        for group_id, (start, end) in candidates.items():
+            old_span = old_spans.get(group_id)
+            if (
+                old_span is None
+                or old_data[old_span[0]:old_span[1]] != new_data[start:end]
+            ):
+                changed.add(group_id)
+
+        self.svg_data = data
+        self.group_data = data
+        self.group_spans = new_spans
+        self.content_start = content_start
+        self.group_svgs.rebase(data, new_spans)
+        self.intern_groups()
+        return changed, removed
+
+    @property
+    def svg_raw(self) -> str:
+        return str(self.svg_data, "utf-8", "replace")
+
+    def join_spans(self, spans: Iterable[Tuple[int, int]]) -> bytes:
+        # Groups are joined straight out of the shared buffer in a single
+        # pass, so the frame is the only copy made
+        data = self.group_view
+        parts = [self.svg_header]
+        for start, end in spans:
+            parts.append(data[start:end])
+            parts.append(b"\n")
+        if len(parts) > 1:
+            parts.pop()
+        parts.append(SVG_FOOTER)
+        return b"".join(parts)
+
+    def get_indexed_bytes(self, indices: Iterable[int]) -> bytes:
+        spans = self.span_table
+        return self.join_spans(spans[index] for index in indices)
+
+    def get_svg_bytes(self, group_ids: Iterable[str]) -> bytes:
+        if isinstance(group_ids, ResolvedIds):
+            return self.get_indexed_bytes(group_ids.indices)
+
+        spans = self.group_spans
+        return self.join_spans(spans[id] for id in group_ids if id in spans)
+
+    def memory_report(self) -> Dict[str, int]:
+        # Buffers read from the layout cache are mapped from disk rather
+        # than held on the heap
+        buffer_name = "group buffer" if isinstance(self.group_data, bytes) else "mapped group buffer"
+        report = {buffer_name: len(self.group_data)}
+        if self.svg_data is not self.group_data:
+            report["source document"] = len(self.svg_data)
+
+        report["group index"] = (
+            sys.getsizeof(self.group_spans) + sys.getsizeof(self.group_index)
+            + sys.getsizeof(self.span_table) + sys.getsizeof(self.group_order)
+            + sum(sys.getsizeof(group_id) for group_id in self.group_order)
+            + sum(sys.getsizeof(span) for span in self.span_table)
+        )
+        return report
 
     def get_svg_content(
         self, 
         group_ids: List[str]
     ) -> str:
-        content = "\n".join(
-            self.group_svgs[id] 
-            for id in group_ids
-            if id in self.group_svgs
-        )
-
-        return SVG_TEMPLATE.format(
-            header=self.svg_attribs,
-            content=content
-        )
+        return self.get_svg_bytes(group_ids).decode("utf-8")
     
     def get_whole_svg(self) -> str:
         return self.get_svg_content(self.group_svgs.keys())
@@ -1,14 +1,48 @@
-from PyQt5.QtWidgets import QWidget, QSizePolicy
-from PyQt5.QtCore import QByteArray, Qt, QRect, QPoint
-from PyQt5.QtSvg import QSvgWidget
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import QByteArray, Qt, QRect, QRectF, QSize
+from PyQt5.QtGui import QImage, QPainter, QPaintEvent, QRegion
+from PyQt5.QtSvg import QSvgWidget, QSvgRenderer
 
-from typing import List
+from time import monotonic, perf_counter
+from typing import Dict, List, Optional, Set
 
+from plover import log
+
+from plover_svg_layout_display.layout_config import (
+    RENDER_DOCUMENT, RENDER_LAYERS, RENDER_ELEMENTS, RENDER_ATLAS
+)
+from plover_svg_layout_display.frame_cache import FrameCache, FrameKey, frame_key
+from plover_svg_layout_display.group_animation import Fade, animation_clock
+from plover_svg_layout_display.layout_cache import CachedLayout
+from plover_svg_layout_display.stage_timings import StageTimings
+from plover_svg_layout_display.svg_atlas import SpriteAtlas, build_atlas
+from plover_svg_layout_display.svg_layers import (
+    LayerCache, element_bounds, new_image, view_transform
+)
+from plover_svg_layout_display.svg_index import ResolvedIds
 from plover_svg_layout_display.svg_parser import SVGParser
 
 
 DUMMY_PATH = ":/svgld/invalid.svg"
 
+# Extra pixels around each dirty group, for antialiased edges
+DIRTY_MARGIN = 1
+
+
+def padded_bounds(
+    renderer: QSvgRenderer,
+    group_id: str,
+    view_box: QRectF,
+    size: QSize
+) -> Optional[QRect]:
+    bounds_f = element_bounds(renderer, group_id, view_transform(view_box, size))
+    if bounds_f.isEmpty():
+        return None
+
+    return bounds_f.toAlignedRect().adjusted(
+        -DIRTY_MARGIN, -DIRTY_MARGIN, DIRTY_MARGIN, DIRTY_MARGIN
+    )
+
 
 class LayoutWidget(QSvgWidget):
 
@@ -22,41 +56,535 @@ class LayoutWidget(QSvgWidget):
         self.renderer().setAspectRatioMode(Qt.KeepAspectRatio)
         self.is_invalid = False
         self.svg_size = None
+        self.scale = 100
+        self.render_mode = RENDER_DOCUMENT
+        self.group_ids: List[str] = []
+        self.changed = False
+        self.view_box = QRectF()
+        self.bounds: Dict[str, Optional[QRect]] = {}
 
         self.svg_parser = SVGParser()
-        
-    def update_groups(self, group_ids: List[str]) -> None:
+        self.element_renderer = QSvgRenderer()
+        self.element_renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+        self.layer_cache = LayerCache(self.svg_parser)
+        self.frame_cache = FrameCache()
+        self.frame_cache_limits = (0, 0)
+        self.frame: Optional[QImage] = None
+        # Whether every stroke is drawn into an image, so that it can be
+        # reused elsewhere, such as by the stroke history strip
+        self.keep_frames = False
+        self.timings: Optional[StageTimings] = None
+        self.loaded: Optional[LoadedSVG] = None
+        self.fades: Dict[str, Fade] = {}
+        self.group_fades: Dict[str, float] = {}
+
+    def set_render_mode(self, render_mode: str) -> None:
+        if render_mode == self.render_mode:
+            return
+
+        self.render_mode = render_mode
+        self.layer_cache.reset(self.svg_size)
+        self.frame_cache.clear()
+        if self.loaded is not None:
+            self.loaded.root().render_mode = render_mode
+            self.refresh_renderer()
+
+    def refresh_renderer(self) -> None:
+        if self.render_mode in (RENDER_ELEMENTS, RENDER_ATLAS):
+            self.loaded.refresh_renderer()
+
+    def uses_document(self) -> bool:
+        return (
+            self.render_mode not in (RENDER_LAYERS, RENDER_ELEMENTS, RENDER_ATLAS)
+            or self.is_invalid
+        )
+
+    def frame_key(self, group_ids: List[str]) -> FrameKey:
+        return frame_key(group_ids, self.svg_size, self.devicePixelRatioF())
+
+    def assemble_svg(self, group_ids: List[str]) -> bytes:
+        if self.timings is None:
+            return self.svg_parser.get_svg_bytes(group_ids)
+
+        start = perf_counter()
+        svg_bytes = self.svg_parser.get_svg_bytes(group_ids)
+        self.timings.record("assemble", perf_counter() - start)
+        return svg_bytes
+
+    def render_frame(self, group_ids: List[str]) -> QImage:
+        dpr = self.devicePixelRatioF()
+        frame = new_image(self.svg_size, dpr)
+        painter = QPainter(frame)
+        if self.uses_document():
+            # The widget's own renderer has just been loaded with the frame,
+            # so it is drawn without parsing it again
+            self.renderer().render(
+                painter, QRectF(0, 0, self.svg_size.width(), self.svg_size.height())
+            )
+        elif self.render_mode == RENDER_LAYERS:
+            self.layer_cache.paint(painter, group_ids, dpr)
+        elif self.render_mode == RENDER_ATLAS and self.current_atlas() is not None:
+            self.current_atlas().paint(painter, group_ids)
+        else:
+            self.paint_elements(painter, group_ids)
+        painter.end()
+
+        return frame
+
+    def record_frame(self, key: Optional[FrameKey], group_ids: List[str]) -> None:
+        start = perf_counter()
+        frame = self.render_frame(group_ids)
+        if self.timings is not None:
+            self.timings.record("render", perf_counter() - start)
+
+        if key is not None:
+            self.frame_cache.put(key, frame, frame.sizeInBytes())
+        self.frame = frame
+
+    def dirty_region(self, group_ids: List[str]) -> Optional[QRegion]:
+        old_ids = set(self.group_ids)
+        new_ids = set(group_ids)
+
+        # Groups that stay on screen but swap their stacking order could
+        # cover each other differently, so those need a full repaint
+        if (
+            [id for id in self.group_ids if id in new_ids]
+            != [id for id in group_ids if id in old_ids]
+        ):
+            return None
+
+        region = QRegion()
+        for group_id in old_ids.symmetric_difference(new_ids):
+            bounds = self.get_bounds(group_id)
+            if bounds is not None:
+                region += bounds
+
+        return region
+
+    def update_frame(self, group_ids: List[str]) -> None:
+        region = self.dirty_region(group_ids)
+        self.group_ids = group_ids
+
+        if region is None:
+            self.changed = True
+            self.update()
+        elif not region.isEmpty():
+            self.changed = True
+            self.update(region)
+
+    def update_fades(self, group_ids: List[str], fades: Optional[Dict[str, float]]) -> None:
+        if self.group_fades or self.fades:
+            new_ids = set(group_ids)
+            for group_id in new_ids.intersection(self.fades):
+                del self.fades[group_id]
+
+            # Groups the last script result asked to fade out keep being
+            # drawn over the frame once they leave it
+            now = monotonic()
+            for group_id, fade_ms in self.group_fades.items():
+                if (
+                    fade_ms > 0 and group_id not in new_ids
+                    and group_id in self.svg_parser.group_index
+                ):
+                    self.fades[group_id] = Fade(now, fade_ms / 1000)
+
+            if self.fades:
+                animation_clock().start(self)
+
+        self.group_fades = fades or {}
+
+    def clear_fades(self) -> None:
+        if self.fades:
+            animation_clock().stop(self)
+        self.fades = {}
+        self.group_fades = {}
+
+    def animate(self, now: float) -> bool:
+        region = QRegion()
+        for group_id, fade in list(self.fades.items()):
+            bounds = self.get_bounds(group_id)
+            if bounds is not None:
+                region += bounds
+            if now >= fade.end():
+                del self.fades[group_id]
+
+        if not region.isEmpty():
+            self.update(region)
+
+        return bool(self.fades)
+
+    def update_groups(
+        self,
+        group_ids: List[str],
+        fades: Optional[Dict[str, float]] = None
+    ) -> None:
+        self.changed = False
+
+        # Past this point, every ID is known to be in the layout
+        if not isinstance(group_ids, ResolvedIds) and not self.is_invalid:
+            group_ids = self.svg_parser.resolve(group_ids)
+
+        if not self.is_invalid:
+            self.update_fades(group_ids, fades)
+
+        # Cached frames are finished images of a stroke, so a hit skips
+        # assembling, parsing and drawing SVG content altogether. Atlas
+        # blits are already about as cheap, so they skip it. Frames seen
+        # for the first time are drawn as if there was no cache, and the
+        # second time they are also rasterized from what was just drawn.
+        self.frame = None
+        record = self.keep_frames and not self.is_invalid and self.svg_size is not None
+        record_key = None
+        if (
+            self.frame_cache.enabled() and not self.is_invalid
+            and self.svg_size is not None and self.render_mode != RENDER_ATLAS
+        ):
+            key = self.frame_key(group_ids)
+            frame = self.frame_cache.get(key)
+            if frame is not None:
+                self.frame = frame
+                self.update_frame(group_ids)
+                return
+
+            if self.frame_cache.admit(key):
+                record = True
+                record_key = key
+
+        if not self.uses_document():
+            if record:
+                self.record_frame(record_key, group_ids)
+            self.update_frame(group_ids)
+            return
+
         if self.is_invalid:
-            svg_str = self.svg_parser.svg_raw
+            svg_bytes = self.svg_parser.svg_data
+        else:
+            svg_bytes = self.assemble_svg(group_ids)
+
+        start = perf_counter()
+        self.load(QByteArray(svg_bytes))
+        if self.timings is not None:
+            self.timings.record("render", perf_counter() - start)
+        if record:
+            self.record_frame(record_key, group_ids)
+        self.group_ids = group_ids
+        self.changed = True
+        self.update()
+
+    def get_bounds(self, group_id: str) -> Optional[QRect]:
+        if group_id in self.bounds:
+            return self.bounds[group_id]
+
+        bounds = None
+        if group_id in self.svg_parser.group_svgs and self.svg_size is not None:
+            bounds = padded_bounds(
+                self.element_renderer, group_id, self.view_box, self.svg_size
+            )
+
+        self.bounds[group_id] = bounds
+        return bounds
+
+    def paint_elements(
+        self,
+        painter: QPainter,
+        group_ids: List[str],
+        size: QSize = None
+    ) -> None:
+        transform = view_transform(self.view_box, size or self.svg_size)
+        for group_id in group_ids:
+            bounds = element_bounds(self.element_renderer, group_id, transform)
+            if not bounds.isEmpty():
+                self.element_renderer.render(painter, group_id, bounds)
+
+    def current_atlas(self) -> Optional[SpriteAtlas]:
+        if self.loaded is None:
+            return None
+
+        return self.loaded.get_atlas(self.devicePixelRatioF())
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        start = perf_counter()
+
+        if self.frame is None and self.uses_document():
+            super().paintEvent(event)
         else:
-            svg_str = self.svg_parser.get_svg_content(group_ids)
+            painter = QPainter(self)
+            if self.frame is not None:
+                painter.drawImage(0, 0, self.frame)
+            elif self.render_mode == RENDER_LAYERS:
+                self.layer_cache.paint(painter, self.group_ids, self.devicePixelRatioF())
+            elif self.render_mode == RENDER_ATLAS and self.current_atlas() is not None:
+                self.current_atlas().paint(painter, self.group_ids)
+            else:
+                self.paint_elements(painter, self.group_ids)
+            painter.end()
+
+        if self.fades:
+            self.paint_fades()
+
+        if self.timings is not None:
+            self.timings.record("paint", perf_counter() - start)
+
+    def paint_fades(self) -> None:
+        # Fading groups are drawn from their cached layers, so animating
+        # never reparses anything
+        now = monotonic()
+        dpr = self.devicePixelRatioF()
+        painter = QPainter(self)
+        for group_id, fade in self.fades.items():
+            opacity = fade.opacity(now)
+            if opacity > 0.0:
+                painter.setOpacity(opacity)
+                self.layer_cache.paint(painter, (group_id,), dpr)
+        painter.end()
+
+    def set_frame_cache_limits(self, max_entries: int, max_bytes: int) -> None:
+        self.frame_cache_limits = (max_entries, max_bytes)
+        self.frame_cache.resize(max_entries, max_bytes)
+
+    def set_layout(self, loaded: "LoadedSVG") -> None:
+        self.clear_fades()
+        self.loaded = loaded
+        self.svg_parser = loaded.svg_parser
+        self.element_renderer = loaded.element_renderer
+        self.view_box = loaded.view_box
+        self.svg_size = loaded.svg_size
+        self.scale = loaded.scale
+        self.is_invalid = loaded.is_invalid
+        self.bounds = loaded.bounds
+        self.layer_cache = loaded.layer_cache
+        self.frame_cache = loaded.frame_cache
+        self.frame_cache.resize(*self.frame_cache_limits)
+
+        # Caches built for another render mode are of no use to this one
+        root = loaded.root()
+        if root.render_mode != self.render_mode:
+            root.render_mode = self.render_mode
+            self.layer_cache.reset(self.svg_size)
+            self.frame_cache.clear()
 
-        self.load(QByteArray(str.encode(svg_str, "utf-8")))
+        self.refresh_renderer()
+        self.setFixedSize(self.svg_size)
+        self.group_ids = []
+        self.update_groups(list(self.svg_parser.group_svgs))
+        self.changed = True
         self.update()
-    
+
+    def patch_layout(self, changed: Set[str], removed: Set[str]) -> None:
+        self.loaded.patch(changed, removed)
+        self.refresh_groups()
+
+    def refresh_groups(self) -> None:
+        self.refresh_renderer()
+
+        # Indices may have shifted, so the groups on display are resolved again
+        group_ids = list(self.group_ids)
+        self.group_ids = []
+        self.update_groups(group_ids)
+        self.changed = True
+        self.update()
+
     def load_invalid(self, scale: int = 100) -> None:
-        self.load_svg(DUMMY_PATH, scale, True)
+        self.set_layout(load_layout_svg(DUMMY_PATH, scale))
 
-    def load_svg(self, path: str, scale: int, invalid: bool = False) -> None:
-        if not path.strip():
-            self.load_invalid(scale)
+    def load_svg(
+        self,
+        path: str,
+        scale: int,
+        cached: CachedLayout = None
+    ) -> None:
+        self.set_layout(load_layout_svg(path, scale, cached))
+
+
+class LoadedSVG:
+    """A parsed layout at one scale, along with everything drawn from it.
+
+    The widget switches between layouts by swapping references to these,
+    so that nothing needs to be parsed again. Layouts derived for another
+    scale share the parser, renderer and caches of the layout they were
+    derived from, and only keep their own bounds, layers and atlases.
+    """
+
+    __slots__ = [
+        "svg_parser", "element_renderer", "view_box", "svg_size", "scale",
+        "is_invalid", "render_mode", "bounds", "layer_cache", "frame_cache",
+        "atlases", "renderer_stale", "generation", "base", "derived"
+    ]
+
+    def __init__(
+        self,
+        svg_parser: SVGParser,
+        scale: int,
+        is_invalid: bool,
+        base: "LoadedSVG" = None
+    ) -> None:
+        self.svg_parser = svg_parser
+        if base is None:
+            self.element_renderer = QSvgRenderer(
+                QByteArray(svg_parser.get_svg_bytes(svg_parser.group_svgs))
+            )
+            self.element_renderer.setAspectRatioMode(Qt.KeepAspectRatio)
+        else:
+            self.element_renderer = base.element_renderer
+        self.view_box = self.element_renderer.viewBoxF()
+
+        scale_ratio = scale / 100
+        new_size = self.element_renderer.defaultSize()
+        new_size.scale(
+            int(new_size.width() * scale_ratio), 
+            int(new_size.height() * scale_ratio), 
+            Qt.KeepAspectRatio
+        )
+
+        self.svg_size = new_size
+        self.scale = scale
+        self.is_invalid = is_invalid
+        self.render_mode = None
+        self.bounds: Dict[str, Optional[QRect]] = {}
+        self.atlases: Dict[float, Optional[SpriteAtlas]] = {}
+        self.renderer_stale = False
+        self.generation = 0
+        self.base = base
+        self.derived: Dict[int, LoadedSVG] = {}
+
+        # Layers are rasterized, so every scale needs its own
+        self.layer_cache = LayerCache(svg_parser)
+        self.layer_cache.reset(new_size)
+
+        # Frames are keyed by their size, so every scale can share them
+        self.frame_cache = FrameCache() if base is None else base.frame_cache
+
+    def root(self) -> "LoadedSVG":
+        return self if self.base is None else self.base
+
+    def derive(self, scale: int) -> "LoadedSVG":
+        root = self.root()
+        if scale == root.scale:
+            return root
+
+        if scale not in root.derived:
+            root.derived[scale] = LoadedSVG(
+                root.svg_parser, scale, root.is_invalid, root
+            )
+
+        return root.derived[scale]
+
+    def refresh_renderer(self) -> None:
+        root = self.root()
+        if not root.renderer_stale:
             return
-        try:
-            self.svg_parser.load_file(path)
-            svg_str = self.svg_parser.get_whole_svg()
-            self.load(QByteArray(str.encode(svg_str, "utf-8")))
-
-            scale_ratio = scale / 100
-            new_size = self.renderer().defaultSize()
-            new_size.scale(
-                int(new_size.width() * scale_ratio), 
-                int(new_size.height() * scale_ratio), 
-                Qt.KeepAspectRatio
+
+        root.element_renderer.load(QByteArray(
+            root.svg_parser.get_svg_bytes(root.svg_parser.group_svgs)
+        ))
+        root.renderer_stale = False
+
+    def patch(self, changed: Set[str], removed: Set[str]) -> None:
+        """Drops everything drawn from groups that were edited or removed
+        since the layout was loaded; see SVGParser.patch."""
+        root = self.root()
+        stale = changed | removed
+        root.generation += 1
+
+        root.frame_cache.discard(lambda key: not stale.isdisjoint(key[0]))
+
+        # Reparsing the whole layout is only needed to draw it element by
+        # element; the old renderer still has the right geometry for every
+        # untouched group, so the bounds of the edited ones are taken from
+        # a document holding just those
+        patch_renderer = None
+        if changed:
+            root.renderer_stale = True
+            patch_renderer = QSvgRenderer(
+                QByteArray(root.svg_parser.get_svg_bytes(changed))
+            )
+
+        for loaded in [root, *root.derived.values()]:
+            loaded.atlases.clear()
+            loaded.layer_cache.discard(stale)
+            for group_id in stale:
+                loaded.bounds.pop(group_id, None)
+
+            if patch_renderer is not None:
+                for group_id in changed:
+                    loaded.bounds[group_id] = padded_bounds(
+                        patch_renderer, group_id, loaded.view_box, loaded.svg_size
+                    )
+
+    def get_atlas(self, dpr: float) -> Optional[SpriteAtlas]:
+        # One atlas per device pixel ratio, so that moving the window back
+        # and forth between screens only rasterizes the layout once each.
+        # Layouts too large to pack are drawn as elements instead.
+        if dpr not in self.atlases:
+            self.atlases[dpr] = build_atlas(
+                self.element_renderer,
+                self.view_box,
+                self.svg_size,
+                self.svg_parser.group_svgs,
+                dpr
+            )
+
+        return self.atlases[dpr]
+
+    def atlas_reports(self) -> List[Dict[str, float]]:
+        return [
+            atlas.report() for atlas in self.atlases.values()
+            if atlas is not None
+        ]
+
+    def atlas_bytes(self) -> int:
+        return sum(
+            atlas.nbytes() for atlas in self.atlases.values()
+            if atlas is not None
+        )
+
+    def memory_report(self) -> Dict[str, int]:
+        # Derived layouts only own their layers and atlases; everything
+        # else is counted once, by the layout they were derived from
+        if self.base is not None:
+            return {"layers": self.layer_cache.nbytes(), "atlases": self.atlas_bytes()}
+
+        report = self.svg_parser.memory_report()
+
+        # Qt does not report the size of a parsed document; its node tree
+        # is assumed to take about twice the size of the source
+        report["renderer"] = 2 * len(self.svg_parser.group_data)
+        report["frame cache"] = self.frame_cache.total_bytes
+        report["layers"] = self.layer_cache.nbytes()
+        report["atlases"] = self.atlas_bytes()
+        report["extra displays"] = sum(loaded.nbytes() for loaded in self.derived.values())
+        return report
+
+    def nbytes(self) -> int:
+        return sum(self.memory_report().values())
+
+
+def load_layout_svg(
+    path: str,
+    scale: int,
+    cached: CachedLayout = None,
+    optimize: bool = False
+) -> LoadedSVG:
+    try:
+        if not path.strip():
+            raise ValueError("no layout path")
+
+        svg_parser = SVGParser()
+        if cached is not None:
+            svg_parser.load_cached(
+                cached.svg_attribs,
+                cached.group_spans,
+                cached.group_data,
+                optimize,
+                cached.content_start
             )
-            
-            self.resize(new_size)
-            self.renderer().setViewBox(QRect(QPoint(0, 0), new_size))
-            self.svg_size = new_size
-            self.is_invalid = invalid
-        except:
-            self.load_invalid(scale)
+        else:
+            svg_parser.load_file(path, optimize=optimize)
+
+        return LoadedSVG(svg_parser, scale, False)
+    except (ValueError, SyntaxError) as error:
+        # Parse errors from lxml are syntax errors
+        log.error("svgld: could not load layout %s, showing a placeholder: %s", path, error)
+        svg_parser = SVGParser()
+        svg_parser.load_file(DUMMY_PATH)
+        return LoadedSVG(svg_parser, scale, True)
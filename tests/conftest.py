@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(TESTS_DIR)
+
+# Without Plover installed, the plugin runs against the same stubs as the
+# benchmarks, which the harness installs when it is imported
+try:
+    import plover.log
+except ImportError:
+    sys.path.insert(0, REPO_DIR)
+    from benchmarks import harness
+
+RESOURCES_DIR = os.path.join(REPO_DIR, "plover_svg_layout_display", "resources")
+EN_SVG = os.path.join(RESOURCES_DIR, "en_layout.svg")
+EN_PY = os.path.join(RESOURCES_DIR, "en_convert.py")
+
+
+@pytest.fixture(scope="session")
+def en_svg() -> str:
+    return EN_SVG
+
+
+@pytest.fixture(scope="session")
+def en_py() -> str:
+    return EN_PY
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,68 @@
+from plover_svg_layout_display.frame_cache import FrameCache
+
+
+def test_disabled_by_default():
+    cache = FrameCache()
+    assert not cache.enabled()
+    assert not cache.admit("a")
+    cache.put("a", "frame", 1)
+    assert cache.get("a") is None
+
+
+def test_admits_on_second_sighting():
+    cache = FrameCache(4, 100)
+    assert not cache.admit("a")
+    assert cache.admit("a")
+    cache.put("a", "frame", 1)
+    assert cache.get("a") == "frame"
+    assert not cache.seen
+
+
+def test_evicts_least_recently_used_by_count():
+    cache = FrameCache(2, 100)
+    cache.put("a", "a", 1)
+    cache.put("b", "b", 1)
+    assert cache.get("a") == "a"
+    cache.put("c", "c", 1)
+    assert list(cache.frames) == ["a", "c"]
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evicts_by_bytes():
+    cache = FrameCache(10, 10)
+    cache.put("a", "a", 4)
+    cache.put("b", "b", 4)
+    cache.put("c", "c", 4)
+    assert list(cache.frames) == ["b", "c"]
+    assert cache.total_bytes == 8
+
+    # A frame that could never fit leaves the others alone
+    cache.put("d", "d", 11)
+    assert list(cache.frames) == ["b", "c"]
+
+    cache.resize(1, 10)
+    assert list(cache.frames) == ["c"]
+    assert cache.total_bytes == 4
+
+
+def test_offered_frames_only_fill_free_room():
+    cache = FrameCache(2, 100)
+    cache.put("a", "a", 1)
+    assert cache.offer("b", "b", 1)
+    assert not cache.offer("c", "c", 1)
+    assert list(cache.frames) == ["b", "a"]
+
+    assert cache.get("b") == "b"
+    assert cache.prefetch_hits == 1
+
+
+def test_discard():
+    cache = FrameCache(4, 100)
+    cache.put(("a", "b"), "ab", 1)
+    cache.put(("c",), "c", 1)
+    cache.admit(("a",))
+    cache.discard(lambda key: "a" in key)
+    assert list(cache.frames) == [("c",)]
+    assert not cache.seen
+    assert cache.total_bytes == 1
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtSvg")
+
+from plover_svg_layout_display.layout_script import load_script
+
+
+def wait_for(prefetcher, qapp) -> None:
+    while prefetcher.running:
+        prefetcher.thread_pool.waitForDone()
+        qapp.processEvents()
+
+
+def test_bundled_script_is_a_table(en_py):
+    script = load_script(en_py)
+
+    assert script.batch_convert is not None
+    assert script.table_rows() == script.key_rows
+    assert script.table_rows()[1] == ["S-", "ls", "ls_n"]
+
+
+def test_bundled_layout_is_prefetched(qapp, en_svg, en_py):
+    from benchmarks import harness
+
+    tool = harness.make_tool(en_svg, en_py, prefetch_frames=32, max_fps=0)
+    prefetcher = tool.frame_prefetcher
+    # Loading the layout starts a pass of its own, with nothing written yet
+    wait_for(prefetcher, qapp)
+    strokes = [("S-",), ("T-", "-E"), ("K-", "-R"), ("S-", "T-", "-P")]
+    for stroke in strokes:
+        prefetcher.history[stroke] += 1
+
+    prefetcher.start()
+    wait_for(prefetcher, qapp)
+    assert prefetcher.prefetched == len(strokes)
+
+    frame_cache = tool.svg_widget.frame_cache
+    for stroke in strokes:
+        tool.on_stroke(stroke)
+        qapp.processEvents()
+    assert frame_cache.prefetch_hits == len(strokes)
+    tool.close()
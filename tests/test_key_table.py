@@ -0,0 +1,74 @@
+import pytest
+
+from plover_svg_layout_display.key_table import KeyTable, is_key_table
+from plover_svg_layout_display.layout_script import compile_script
+
+
+KEYS = [
+    ("S-", "ls", "ls_n"),
+    ("T-", "lt", None),
+    ("-E", "re", "re_n"),
+    ("-F", None, "rf_n"),
+    ("S-", "ls_second", None),
+]
+
+STROKES = [
+    (),
+    ("S-",),
+    ("T-", "-E"),
+    ("S-", "T-", "-E", "-F"),
+    ("-F", "*"),
+    ("S-", "-E"),
+    ("S-",),
+]
+
+
+def convert_stroke(stroke):
+    # The scalar form the table is compiled from
+    group_ids = []
+    for row in KEYS:
+        group_id = row[1] if row[0] in stroke else row[2]
+        if group_id is not None:
+            group_ids.append(group_id)
+    return group_ids
+
+
+@pytest.mark.parametrize("stroke", STROKES)
+def test_matches_scalar_script(stroke):
+    assert KeyTable(KEYS).convert_stroke(stroke, "") == convert_stroke(stroke)
+
+
+def test_batch_matches_scalar_script():
+    frames, codes = KeyTable(KEYS).convert_strokes(STROKES)
+    assert [frames[code] for code in codes] == [convert_stroke(stroke) for stroke in STROKES]
+    assert len(frames) == len(set(map(tuple, frames)))
+
+
+def test_bound_table_leaves_out_missing_ids():
+    table = KeyTable(KEYS)
+    group_index = {"ls": 0, "lt": 1, "re_n": 2, "rf_n": 3}
+    assert table.bind(group_index) == {"ls_n", "re", "ls_second"}
+
+    frame = table.convert_stroke(("S-", "T-"), "")
+    assert frame == ["ls", "lt", "re_n", "rf_n"]
+    assert frame.indices == (0, 1, 2, 3)
+
+
+def test_compiled_only_without_convert_stroke():
+    script = compile_script("KEYS = {!r}".format(KEYS))
+    assert script.key_table is not None
+    assert script.table_rows() == [list(row) for row in KEYS]
+
+    script = compile_script(
+        "KEYS = {!r}\ndef convert_stroke(stroke, _):\n    return ['custom']".format(KEYS)
+    )
+    assert script.key_table is None
+    assert script.convert(("S-",), str) == ["custom"]
+    assert script.table_rows() is None
+
+
+def test_is_key_table():
+    assert is_key_table(KEYS)
+    assert not is_key_table([])
+    assert not is_key_table([("S-",)])
+    assert not is_key_table([(1, "a", "b")])
@@ -0,0 +1,136 @@
+import os
+
+import pytest
+
+from plover_svg_layout_display import layout_cache
+from plover_svg_layout_display.layout_cache import LayoutCache
+
+
+SVG_DATA = b"<svg><g id='a'/><g id='b'><rect/></g></svg>"
+GROUP_DATA = b"<g id='a'/><g id='b'><rect/></g>"
+GROUP_SPANS = {"a": (0, 11), "b": (11, 32)}
+KEY_ROWS = [["S-", "a", None]]
+
+
+@pytest.fixture
+def paths(tmp_path):
+    svg_path = tmp_path / "layout.svg"
+    py_path = tmp_path / "layout.py"
+    svg_path.write_bytes(SVG_DATA)
+    py_path.write_text("KEYS = [('S-', 'a', None)]")
+    return str(svg_path), str(py_path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LayoutCache(str(tmp_path / "cache"), 1024 * 1024)
+
+
+def store(cache, svg_path, py_path, **kwargs):
+    cache.store(
+        svg_path, py_path, SVG_DATA, ' width="1"', GROUP_SPANS, GROUP_DATA,
+        KEY_ROWS, content_start=5, **kwargs
+    )
+
+
+def touch(path, data):
+    # Rewrites a file with a different stamp, whatever the clock resolution
+    stat = os.stat(path)
+    with open(path, "wb") as changed_file:
+        changed_file.write(data)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_round_trip(cache, paths):
+    store(cache, *paths)
+    cached = cache.load(*paths)
+
+    assert cached.svg_attribs == ' width="1"'
+    assert cached.group_spans == GROUP_SPANS
+    assert bytes(cached.group_data) == GROUP_DATA
+    assert cached.key_rows == KEY_ROWS
+    assert cached.content_start == 5
+    assert [name for name in os.listdir(cache.directory) if name.endswith(".tmp")] == []
+
+
+def test_changed_files_are_rejected(cache, paths):
+    svg_path, py_path = paths
+    store(cache, svg_path, py_path)
+
+    touch(py_path, b"KEYS = [('T-', 'a', None)]")
+    assert cache.load(svg_path, py_path) is None
+
+    store(cache, svg_path, py_path)
+    touch(svg_path, SVG_DATA.replace(b"rect", b"line"))
+    assert cache.load(svg_path, py_path) is None
+
+
+def test_touched_but_unchanged_files_are_accepted(cache, paths):
+    svg_path, py_path = paths
+    store(cache, svg_path, py_path)
+
+    touch(svg_path, SVG_DATA)
+    assert cache.load(svg_path, py_path) is not None
+
+
+def test_optimized_entries_are_kept_apart(cache, paths):
+    store(cache, *paths, optimized=True)
+    assert cache.load(*paths) is None
+    assert cache.load(*paths, optimized=True) is not None
+
+
+def test_other_versions_are_rejected(cache, paths, monkeypatch):
+    store(cache, *paths)
+    monkeypatch.setattr(layout_cache, "CACHE_VERSION", layout_cache.CACHE_VERSION + 1)
+    assert cache.load(*paths) is None
+
+
+def test_corrupt_entries_are_rejected(cache, paths):
+    store(cache, *paths)
+    entry_path = cache.entry_path(*paths)
+
+    with open(entry_path, "r+b") as entry_file:
+        entry_file.write(b"garbage!")
+    assert cache.load(*paths) is None
+
+    with open(entry_path, "wb") as entry_file:
+        entry_file.write(b"SVG")
+    assert cache.load(*paths) is None
+
+
+def test_evicts_least_recently_used(tmp_path, paths):
+    svg_path, py_path = paths
+    cache = LayoutCache(str(tmp_path / "cache"), 0)
+    store(cache, svg_path, py_path)
+    assert cache.entries() == []
+
+
+def test_bundled_layout_round_trip(qapp, cache, en_svg, en_py):
+    from plover_svg_layout_display.layout_registry import build_layout
+
+    built = build_layout(en_svg, en_py, 100, cache)
+    cached = cache.load(en_svg, en_py)
+    assert cached is not None
+    assert cached.key_rows == built.script.key_rows
+
+    loaded = build_layout(en_svg, en_py, 100, cache)
+    assert loaded.svg.svg_parser.group_spans == built.svg.svg_parser.group_spans
+    assert loaded.script.key_rows == built.script.key_rows
+
+    # The batched form is not cached, and batches are looked up in the
+    # table instead, drawing the same frames
+    strokes = [("S-",), ("T-", "-E"), ("#", "*", "-Z"), ("S-",)]
+    for stroke in strokes:
+        assert (
+            loaded.script.convert(stroke, str)
+            == built.script.convert(stroke, str)
+        )
+
+    def decode(encoded):
+        frames, indices = encoded
+        return [frames[index] for index in indices]
+
+    assert (
+        decode(loaded.script.convert_strokes(strokes))
+        == decode(built.script.convert_strokes(strokes))
+    )
@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtSvg")
+
+from PyQt5.QtCore import QThread
+
+from plover_svg_layout_display import layout_registry
+from plover_svg_layout_display.layout_registry import LayoutRegistry
+
+
+def wait_for(registry, qapp) -> None:
+    registry.thread_pool.waitForDone()
+    qapp.processEvents()
+
+
+@pytest.fixture
+def registry(qapp):
+    registry = LayoutRegistry(64 * 1024 * 1024)
+    yield registry
+    registry.thread_pool.waitForDone()
+    registry.clear()
+
+
+def test_warmed_layouts_are_kept(qapp, registry, en_svg, en_py):
+    key = (en_svg, en_py, 100)
+    registry.warm((key,), None)
+    wait_for(registry, qapp)
+
+    layout = registry.get(key)
+    assert layout is not None
+    assert not layout.svg.is_invalid
+    assert layout.script is not None
+
+
+def test_scripts_are_loaded_on_the_gui_thread(qapp, registry, monkeypatch, en_svg, en_py):
+    threads = []
+    load_layout_script = layout_registry.load_layout_script
+
+    def record_thread(*args):
+        threads.append(QThread.currentThread())
+        return load_layout_script(*args)
+
+    monkeypatch.setattr(layout_registry, "load_layout_script", record_thread)
+    key = (en_svg, en_py, 100)
+    assert not registry.request(key, None)
+    wait_for(registry, qapp)
+
+    assert registry.get(key) is not None
+    assert threads == [qapp.thread()]
+
+
+def test_layouts_warmed_before_clearing_are_dropped(qapp, registry, en_svg, en_py):
+    key = (en_svg, en_py, 100)
+    ready = []
+    registry.ready.connect(ready.append)
+
+    assert not registry.request(key, None)
+    registry.clear()
+    wait_for(registry, qapp)
+    assert registry.get(key) is None
+    assert ready == []
+
+    # The key can be loaded again with the new settings
+    assert not registry.request(key, None, optimize=True)
+    wait_for(registry, qapp)
+    assert ready == [key]
+    assert registry.get(key).svg.svg_parser.optimized
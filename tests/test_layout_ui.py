@@ -0,0 +1,21 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtSvg")
+
+
+def test_force_repaint_keeps_the_window_size(qapp, en_svg, en_py):
+    from benchmarks import harness
+
+    tool = harness.make_tool(
+        en_svg, en_py, force_repaint=True, max_fps=0, extra_views="50"
+    )
+    tool.on_stroke(("S-",))
+    qapp.processEvents()
+    assert len(tool.views) == 1
+    sizes = [tool.size()] + [view.size() for view in tool.views]
+
+    for stroke in [("T-", "-E"), ("S-",), ("K-", "-R"), ("K-", "-R")]:
+        tool.on_stroke(stroke)
+        qapp.processEvents()
+        assert [tool.size()] + [view.size() for view in tool.views] == sizes
+    tool.close()
@@ -0,0 +1,82 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtSvg")
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage
+
+from plover_svg_layout_display.layout_config import (
+    RENDER_ATLAS, RENDER_DOCUMENT, RENDER_ELEMENTS, RENDER_LAYERS
+)
+from plover_svg_layout_display.svg_widget import LayoutWidget, load_layout_svg
+
+
+RENDER_MODES = (RENDER_DOCUMENT, RENDER_LAYERS, RENDER_ELEMENTS, RENDER_ATLAS)
+
+
+def painted_pixels(widget: LayoutWidget) -> int:
+    image = QImage(widget.size(), QImage.Format_ARGB32)
+    image.fill(Qt.transparent)
+    widget.render(image)
+    return sum(
+        1
+        for y in range(0, image.height(), 4)
+        for x in range(0, image.width(), 4)
+        if image.pixel(x, y) >> 24
+    )
+
+
+@pytest.mark.parametrize("cache_entries", (0, 256))
+@pytest.mark.parametrize("render_mode", RENDER_MODES)
+def test_layout_renders(qapp, en_svg, render_mode, cache_entries):
+    widget = LayoutWidget()
+    widget.set_render_mode(render_mode)
+    widget.set_frame_cache_limits(cache_entries, 16 * 1024 * 1024)
+
+    loaded = load_layout_svg(en_svg, 100)
+    assert not loaded.is_invalid
+    widget.set_layout(loaded)
+    assert painted_pixels(widget) > 0
+
+    group_ids = list(loaded.svg_parser.group_svgs)
+    widget.update_groups(group_ids[:3])
+    assert painted_pixels(widget) > 0
+
+    widget.update_groups([])
+    assert painted_pixels(widget) == 0
+
+
+@pytest.mark.parametrize("render_mode", (RENDER_DOCUMENT, RENDER_LAYERS, RENDER_ELEMENTS))
+def test_frames_are_cached_on_second_use(qapp, en_svg, render_mode):
+    widget = LayoutWidget()
+    widget.set_render_mode(render_mode)
+    widget.set_frame_cache_limits(256, 16 * 1024 * 1024)
+    widget.set_layout(load_layout_svg(en_svg, 100))
+
+    rendered = []
+    render_frame = widget.render_frame
+    widget.render_frame = lambda group_ids: rendered.append(group_ids) or render_frame(group_ids)
+
+    group_ids = list(widget.svg_parser.group_svgs)[:3]
+    widget.update_groups(group_ids)
+    assert widget.frame is None and not rendered
+
+    widget.update_groups(group_ids)
+    assert widget.frame is not None and len(rendered) == 1
+    expected = painted_pixels(widget)
+
+    widget.update_groups([])
+    widget.update_groups(group_ids)
+    assert len(rendered) == 1
+    assert widget.frame_cache.hits == 1
+    assert painted_pixels(widget) == expected
+
+
+@pytest.mark.parametrize("optimize", (False, True))
+@pytest.mark.parametrize("data", (b"", b"not a layout", bytes(range(256))))
+def test_broken_layouts_show_a_placeholder(qapp, tmp_path, data, optimize):
+    svg_path = tmp_path / "layout.svg"
+    svg_path.write_bytes(data)
+
+    assert load_layout_svg(str(svg_path), 100, optimize=optimize).is_invalid
+    assert load_layout_svg(str(tmp_path / "missing.svg"), 100).is_invalid
@@ -0,0 +1,72 @@
+import sys
+
+from time import monotonic, sleep
+
+import pytest
+
+from plover_svg_layout_display.script_watchdog import (
+    ScriptError, ScriptTimeout, load_isolated_script
+)
+
+
+# Scripts run in a new interpreter, which imports the real Plover rather
+# than the stand-ins the tests otherwise fall back to
+pytestmark = pytest.mark.skipif(
+    getattr(sys.modules.get("plover"), "__file__", None) is None,
+    reason="needs Plover installed"
+)
+
+
+def convert_when_ready(script, stroke, timeout=30.0):
+    deadline = monotonic() + timeout
+    while True:
+        try:
+            return script.convert(stroke, lambda: "test")
+        except ScriptTimeout:
+            if monotonic() > deadline:
+                raise
+            sleep(0.01)
+
+
+@pytest.fixture
+def load(tmp_path):
+    scripts = []
+
+    def load(py_text, budget=5.0):
+        py_path = tmp_path / "layout.py"
+        py_path.write_text(py_text)
+        script = load_isolated_script(str(py_path), budget)
+        scripts.append(script)
+        return script
+
+    yield load
+    for script in scripts:
+        script.close()
+
+
+def test_loading_does_not_wait_for_the_worker(load):
+    script = load("def convert_stroke(stroke, translation):\n    return [translation]\n")
+
+    assert script.starting
+    with pytest.raises(ScriptTimeout):
+        script.convert(("S-",), lambda: "test")
+    assert convert_when_ready(script, ("S-",)) == ["test"]
+
+
+def test_tables_run_inside_plover(load):
+    script = load("KEYS = [('S-', 'a', 'b')]\n")
+    assert script.table_rows() is None
+    script.bind({"a": 0, "b": 1})
+
+    assert list(convert_when_ready(script, ("S-",))) == ["a"]
+    assert script.process is None
+    assert script.table_rows() == [["S-", "a", "b"]]
+
+
+def test_broken_scripts_fail(load):
+    script = load("raise ValueError()\n")
+
+    with pytest.raises(ScriptError):
+        convert_when_ready(script, ("S-",))
+    with pytest.raises(ScriptError):
+        script.convert(("S-",), lambda: "test")
@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtSvg")
+
+from plover_svg_layout_display.layout_config import (
+    RENDER_ATLAS, RENDER_DOCUMENT, RENDER_ELEMENTS, RENDER_LAYERS
+)
+
+
+@pytest.mark.parametrize("cache_entries", (0, 256))
+@pytest.mark.parametrize(
+    "render_mode", (RENDER_DOCUMENT, RENDER_LAYERS, RENDER_ELEMENTS, RENDER_ATLAS)
+)
+def test_strip_reuses_the_drawn_frame(
+    qapp, monkeypatch, en_svg, en_py, render_mode, cache_entries
+):
+    from benchmarks import harness
+    from plover_svg_layout_display.svg_parser import SVGParser
+    from plover_svg_layout_display.svg_widget import LayoutWidget
+
+    tool = harness.make_tool(
+        en_svg, en_py, render_mode=render_mode, max_fps=0,
+        history_strokes=4, frame_cache_entries=cache_entries
+    )
+    widget = tool.svg_widget
+
+    assembled = []
+    get_svg_bytes = SVGParser.get_svg_bytes
+    monkeypatch.setattr(SVGParser, "get_svg_bytes", lambda self, group_ids: (
+        assembled.append(group_ids) or get_svg_bytes(self, group_ids)
+    ))
+    rendered = []
+    render_frame = LayoutWidget.render_frame
+    monkeypatch.setattr(LayoutWidget, "render_frame", lambda self, group_ids: (
+        rendered.append(group_ids) or render_frame(self, group_ids)
+    ))
+    pushed = []
+    push = tool.stroke_ribbon.push
+    tool.stroke_ribbon.push = lambda frame, translation: (
+        pushed.append(frame) or push(frame, translation)
+    )
+
+    strokes = [("S-",), ("T-", "-E"), ("S-",), ("K-", "-R")]
+    for stroke in strokes:
+        tool.on_stroke(stroke)
+        qapp.processEvents()
+        assert pushed[-1] is widget.frame
+
+    # Each stroke is drawn at most once, for the main display
+    assert len(pushed) == len(strokes)
+    assert len(rendered) <= len(strokes)
+    if cache_entries == 0:
+        assert len(rendered) == len(strokes)
+    if render_mode == RENDER_DOCUMENT:
+        assert len(assembled) <= len(strokes)
+    assert tool.stroke_ribbon.count == len(strokes)
+    tool.close()
@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtSvg")
+
+from PyQt5.QtCore import QSize
+
+from plover_svg_layout_display.svg_atlas import AtlasTooLarge, pack_shelves
+
+
+def test_slots_do_not_overlap():
+    sizes = [
+        (str(index), QSize(5 + index * 7 % 23, 3 + index * 11 % 17))
+        for index in range(40)
+    ]
+    atlas_size, slots = pack_shelves(sizes, 4096)
+
+    assert set(slots) == {group_id for group_id, _ in sizes}
+    for group_id, size in sizes:
+        slot = slots[group_id]
+        assert slot.size() == size
+        assert slot.left() >= 0 and slot.top() >= 0
+        assert slot.right() < atlas_size.width() and slot.bottom() < atlas_size.height()
+
+    rects = list(slots.values())
+    for index, rect in enumerate(rects):
+        for other in rects[index + 1:]:
+            assert not rect.intersects(other)
+
+
+def test_empty():
+    atlas_size, slots = pack_shelves([], 4096)
+    assert slots == {}
+    assert atlas_size.isEmpty()
+
+
+def test_too_large():
+    with pytest.raises(AtlasTooLarge):
+        pack_shelves([("wide", QSize(100, 1))], 50)
+    with pytest.raises(AtlasTooLarge):
+        pack_shelves([(str(index), QSize(10, 10)) for index in range(100)], 60)
@@ -0,0 +1,71 @@
+import pytest
+
+pytest.importorskip("lxml")
+
+from lxml import etree as ET
+
+from plover_svg_layout_display.svg_index import SVGIndexError, index_svg
+from plover_svg_layout_display.svg_parser import SVGParser
+
+
+SIMPLE_SVG = b"""<?xml version="1.0"?>
+<!-- <g id="commented"/> -->
+<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">
+  <g id="a"><rect width="1" height="1"/></g>
+  <g id='b' class="x>y"><g id="nested"/></g>
+  <rect id="not_a_group"/>
+  <g><rect/></g>
+  <g id="c"/>
+</svg>
+"""
+
+
+def tree_groups(data: bytes):
+    parser = SVGParser()
+    parser.load_tree(data)
+    return parser
+
+
+def test_matches_lxml_on_bundled_layout(en_svg):
+    with open(en_svg, "rb") as svg_file:
+        data = svg_file.read()
+
+    index = index_svg(data)
+    tree = tree_groups(data)
+    assert list(index.group_spans) == list(tree.group_spans)
+
+    # Both loaders must hand out the same elements, whatever their spelling
+    for group_id, (start, end) in index.group_spans.items():
+        indexed = ET.fromstring(data[start:end])
+        parsed = ET.fromstring(tree.group_svgs[group_id].encode("utf-8"))
+        assert indexed.attrib == parsed.attrib
+        assert len(indexed.findall(".//*")) == len(parsed.findall(".//*"))
+
+
+def test_top_level_groups_only():
+    index = index_svg(SIMPLE_SVG)
+    assert list(index.group_spans) == ["a", "b", "c"]
+    assert list(tree_groups(SIMPLE_SVG).group_spans) == ["a", "b", "c"]
+
+    start, end = index.group_spans["b"]
+    assert SIMPLE_SVG[start:end] == b"""<g id='b' class="x>y"><g id="nested"/></g>"""
+    assert b'width="10"' in index.svg_attribs
+
+
+@pytest.mark.parametrize("data", (
+    b"<!DOCTYPE svg [<!ENTITY e 'x'>]><svg><g id='a'>&e;</g></svg>",
+    b"<html><g id='a'/></html>",
+    b"<svg><g id='a'><rect/>",
+    b"<svg></g></g>",
+    b"<svg><!-- unterminated",
+    b"no markup at all",
+))
+def test_rejects_what_lxml_has_to_load(data):
+    with pytest.raises(SVGIndexError):
+        index_svg(data)
+
+
+def test_repeated_ids_cannot_be_patched():
+    index = index_svg(b"<svg><g id='a'/><g id='a'/></svg>")
+    assert list(index.group_spans) == ["a"]
+    assert index.content_start is None
@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtSvg")
+
+from PyQt5.QtCore import QRectF
+
+from plover_svg_layout_display.svg_widget import load_layout_svg
+
+
+def test_layers_are_cropped_and_rendered_once(qapp, en_svg):
+    loaded = load_layout_svg(en_svg, 100)
+    layer_cache = loaded.layer_cache
+    group_id = next(iter(loaded.svg_parser.group_svgs))
+
+    layer = layer_cache.get_layer(group_id, 1.0)
+    assert layer is not None
+    assert layer_cache.get_layer(group_id, 1.0) is layer
+
+    layout_rect = QRectF(0, 0, loaded.svg_size.width(), loaded.svg_size.height())
+    assert layer.target.width() < layout_rect.width()
+    assert layout_rect.adjusted(-1, -1, 1, 1).contains(layer.target)
+
+
+def test_layers_follow_pixel_ratio_and_scale(qapp, en_svg):
+    loaded = load_layout_svg(en_svg, 100)
+    group_id = next(iter(loaded.svg_parser.group_svgs))
+
+    layer = loaded.layer_cache.get_layer(group_id, 1.0)
+    hidpi_layer = loaded.layer_cache.get_layer(group_id, 2.0)
+    assert hidpi_layer.pixmap.width() > layer.pixmap.width()
+    assert hidpi_layer.target.width() == pytest.approx(layer.target.width(), abs=2)
+
+    derived = loaded.derive(200)
+    assert derived.layer_cache is not loaded.layer_cache
+    derived_layer = derived.layer_cache.get_layer(group_id, 1.0)
+    assert derived_layer.pixmap.width() > layer.pixmap.width()
+
+
+def test_edited_groups_are_discarded(qapp, en_svg):
+    loaded = load_layout_svg(en_svg, 100)
+    group_id = next(iter(loaded.svg_parser.group_svgs))
+
+    layer = loaded.layer_cache.get_layer(group_id, 1.0)
+    assert loaded.layer_cache.nbytes() > 0
+    loaded.patch({group_id}, set())
+    assert loaded.layer_cache.get_layer(group_id, 1.0) is not layer
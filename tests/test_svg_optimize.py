@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("lxml")
+
+from plover_svg_layout_display.svg_optimize import minify_style, optimize_svg
+
+
+def styles(data: bytes):
+    from lxml import etree as ET
+
+    optimized, _ = optimize_svg(data)
+    root = ET.fromstring(optimized)
+    return [element.get("style") for element in root.iter("{*}rect")]
+
+
+def test_minify_style():
+    assert minify_style("fill:red;;-inkscape-font:x;fill:blue") == "fill:blue"
+    assert minify_style("opacity:1;fill:red") == "opacity:1;fill:red"
+    assert minify_style("opacity:1;fill:red", {"opacity"}) == "fill:red"
+
+
+def test_initial_values_are_dropped():
+    assert styles(
+        b"<svg xmlns='http://www.w3.org/2000/svg'>"
+        b"<g id='a'><rect style='opacity:1;fill:red'/></g></svg>"
+    ) == ["fill:red"]
+
+
+@pytest.mark.parametrize("data", (
+    # A class rule or a presentation attribute would apply without them
+    b"<svg xmlns='http://www.w3.org/2000/svg'>"
+    b"<style>.faded{opacity:0.5}</style>"
+    b"<g id='a'><rect style='opacity:1;fill:red'/></g></svg>",
+    b"<svg xmlns='http://www.w3.org/2000/svg'>"
+    b"<g id='a'><rect class='faded' style='opacity:1;fill:red'/></g></svg>",
+    b"<svg xmlns='http://www.w3.org/2000/svg'>"
+    b"<g id='a'><rect opacity='0.5' style='opacity:1;fill:red'/></g></svg>",
+))
+def test_initial_values_that_override_others_are_kept(data):
+    assert styles(data) == ["opacity:1;fill:red"]
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+from plover_svg_layout_display.svg_parser import SVGParser
+
+
+def make_svg(groups):
+    return (
+        b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">\n'
+        + b"\n".join(
+            b'<g id="%s"><rect width="%d" height="1"/></g>' % (group_id.encode(), width)
+            for group_id, width in groups
+        )
+        + b"\n</svg>\n"
+    )
+
+
+GROUPS = [("g{}".format(index), index + 1) for index in range(50)]
+
+
+def load(data):
+    parser = SVGParser()
+    parser.optimized = False
+    parser.load_index(data)
+    return parser
+
+
+def assert_same_layout(patched, fresh):
+    assert list(patched.group_spans) == list(fresh.group_spans)
+    assert dict(patched.group_svgs) == dict(fresh.group_svgs)
+    assert patched.group_index == fresh.group_index
+    assert patched.get_svg_bytes(fresh.group_order) == fresh.get_svg_bytes(fresh.group_order)
+
+
+def test_edit_one_group():
+    parser = load(make_svg(GROUPS))
+    groups = list(GROUPS)
+    groups[20] = ("g20", 999)
+    data = make_svg(groups)
+
+    # Only the edited group is scanned again
+    _, old_ids, window_spans = parser.reindex(data)
+    assert old_ids == ["g20"] and list(window_spans) == ["g20"]
+
+    assert parser.patch(data) == ({"g20"}, set())
+    assert_same_layout(parser, load(data))
+
+
+def test_add_and_remove_groups():
+    parser = load(make_svg(GROUPS))
+    groups = GROUPS[:10] + [("new", 5)] + GROUPS[12:]
+    data = make_svg(groups)
+
+    assert parser.patch(data) == ({"new"}, {"g10", "g11"})
+    assert_same_layout(parser, load(data))
+
+
+def test_unchanged():
+    data = make_svg(GROUPS)
+    parser = load(data)
+    assert parser.patch(data) == (set(), set())
+
+
+def test_root_change_needs_full_reload():
+    parser = load(make_svg(GROUPS))
+    data = make_svg(GROUPS).replace(b'width="100"', b'width="200"', 1)
+
+    assert parser.patch(data) is None
+    assert parser.svg_attribs.count('width="100"') == 1
+
+
+def test_broken_edit_needs_full_reload():
+    data = make_svg(GROUPS)
+    parser = load(data)
+    assert parser.patch(data.replace(b"<rect", b"<!-- <rect", 1)) is None
+    assert_same_layout(parser, load(data))
+
+
+def test_unbalanced_edit_matches_full_index():
+    parser = load(make_svg(GROUPS))
+    data = make_svg(GROUPS).replace(b"</g>", b"", 1)
+
+    assert parser.patch(data) is not None
+    assert_same_layout(parser, load(data))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_edits_match_full_index(seed):
+    generator = random.Random(seed)
+    groups = list(GROUPS)
+    parser = load(make_svg(groups))
+
+    for _ in range(10):
+        index = generator.randrange(len(groups))
+        action = generator.choice(("edit", "insert", "delete", "rename"))
+        if action == "edit":
+            groups[index] = (groups[index][0], generator.randrange(1000))
+        elif action == "insert":
+            groups.insert(index, ("n{}".format(generator.randrange(10 ** 6)), 1))
+        elif action == "delete" and len(groups) > 1:
+            del groups[index]
+        else:
+            groups[index] = ("r{}".format(generator.randrange(10 ** 6)), groups[index][1])
+
+        data = make_svg(groups)
+        old_groups = dict(parser.group_svgs)
+        changed, removed = parser.patch(data)
+        fresh = load(data)
+        assert_same_layout(parser, fresh)
+
+        assert removed == set(old_groups).difference(fresh.group_spans)
+        assert changed == {
+            group_id for group_id, text in fresh.group_svgs.items()
+            if old_groups.get(group_id) != text
+        }